@@ -7,17 +7,25 @@ from __future__ import annotations
 import os
 import re
 import time
-import requests
+import threading
 import feedparser
-import bs4
-from typing import List, Dict, Any, Optional
+import numpy as np
+from collections import Counter
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 from langchain_core.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 
+try:
+    from ..common import feed_cache, content_store, search_index, near_dup, extractors, http_session, politeness, feed_watermark, matcher, ranking, embeddings
+    from ..common.llm import get_chat_model, invoke_llm
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common import feed_cache, content_store, search_index, near_dup, extractors, http_session, politeness, feed_watermark, matcher, ranking, embeddings
+    from common.llm import get_chat_model, invoke_llm
+
 # ------------------------------------------------------------------------------
 # 설정
 # ------------------------------------------------------------------------------
@@ -27,20 +35,33 @@ ONDEMAND_PER_FEED_LIMIT = 50
 ONDEMAND_DAYS_BACK = 5
 
 PER_FEED_LIMIT = 17
+# 큐레이션: 관심사가 있는 사용자는 관심사/최근 질문과 기사 임베딩의 코사인 유사도가 이 값 이상이면
+# 키워드가 없어도 우선 후보 (최근 질문만 있는 사용자는 유사도를 점수로만 쓴다)
+CURATION_MIN_SIMILARITY = float(os.getenv("CURATION_MIN_SIMILARITY", "0.35"))
+# 랭킹 상위 k + EXTRA건 중 최종 k건을 LLM이 고르게 할지 (후보 수가 고정이라 풀 크기와 무관한 비용)
+CURATION_LLM_TIEBREAK = os.getenv("CURATION_LLM_TIEBREAK", "0") == "1"
+CURATION_TIEBREAK_EXTRA = 2
+# 데일리 공용 풀에 포함할 최근 수집 기간 (poll_feeds가 하루 동안 쌓은 기사)
+DAILY_POOL_HOURS = int(os.getenv("DAILY_POOL_HOURS", "24"))
 FEEDS = [
     "https://www.hankyung.com/feed/economy",        # 한국경제
     "https://www.yna.co.kr/rss/economy.xml",        # 연합뉴스 (JTBC 대체)
     "https://www.mk.co.kr/rss/30100041/",           # 매일경제
 ]
 
-UA_HEADERS = {"User-Agent": os.getenv("USER_AGENT", "NewsTutorAgent/1.0")}
+# RSS 병렬 폴링 (피드별 타임아웃)
+RSS_FETCH_TIMEOUT = float(os.getenv("RSS_FETCH_TIMEOUT", "5"))
+
+# 병렬 스크랩 엔진
+SCRAPE_MAX_WORKERS = int(os.getenv("SCRAPE_MAX_WORKERS", "8"))
+SCRAPE_PER_DOMAIN_LIMIT = int(os.getenv("SCRAPE_PER_DOMAIN_LIMIT", "3"))
+SCRAPE_DEADLINE_SEC = float(os.getenv("SCRAPE_DEADLINE_SEC", "90"))
+ONDEMAND_SCRAPE_DEADLINE_SEC = float(os.getenv("ONDEMAND_SCRAPE_DEADLINE_SEC", "20"))
+
+UA_HEADERS = http_session.UA_HEADERS
 
-# 매체별 기본 SoupStrainer (빠른 경로)
-DOMAIN_PARSE_ONLY = {
-    "www.hankyung.com": ("div", {"id": "articletxt"}),
-    "www.yna.co.kr": ("div", {"class": "story-news article"}),
-    "www.mk.co.kr": ("p", {"refid": True}),
-}
+# 본문 추출 로직 버전 (바꾸면 content_store의 기존 본문을 무시하고 다시 스크랩)
+EXTRACTOR_VERSION = "2"
 
 # DB API(옵션)
 NEWS_DB_API_BASE = os.getenv("NEWS_DB_API_BASE", "").rstrip("/")
@@ -58,6 +79,9 @@ class NewsDoc:
         self.source = source
         self.summary = summary
         self.content = content
+        self.simhash: Optional[int] = None
+        # 관심사 매처별 등장 횟수 (공용 풀 기사는 관심사 집합당 한 번만 스캔)
+        self.interest_counts: Dict[Any, Counter] = {}
 
 # ------------------------------------------------------------------------------
 # 유틸
@@ -84,22 +108,42 @@ def _dedup_by_title(docs: List[NewsDoc]) -> List[NewsDoc]:
             out.append(d)
     return out
 
+def _dedup_near_duplicates(docs: List[NewsDoc],
+                           index: Optional["near_dup.SimHashIndex"] = None) -> List[NewsDoc]:
+    """본문 SimHash가 가까운(제목만 바꾼 재게재) 기사는 먼저 나온 것만 남긴다."""
+    index = index if index is not None else near_dup.SimHashIndex()
+    out = []
+    for d in docs:
+        if len(d.content or "") >= near_dup.NEAR_DUP_MIN_CHARS:
+            if d.simhash is None:
+                d.simhash = near_dup.simhash(d.content)
+            dup = index.check_and_add(d, d.simhash)
+            if dup is not None:
+                if DEBUG: print(f"[near-dup] drop '{d.title[:20]}' ~ '{dup.title[:20]}'")
+                continue
+        out.append(d)
+    return out
+
 def _keyword_matches_any(title: str, summary: str, content: str, keyword: Optional[str]) -> bool:
     if not keyword:
         return True
     kw = keyword.lower()
     return kw in (title or "").lower() or kw in (summary or "").lower() or kw in (content or "").lower()
 
-def _score_by_keyword(title: str, summary: str, keyword: str) -> int:
-    if not keyword:
-        return 0
-    t = (title or "").lower()
-    s = (summary or "").lower()
-    kw = keyword.lower()
-    score = 0
-    if kw in t: score += 3
-    if kw in s: score += 1
-    return score
+def _parse_interests(interests: Any) -> List[str]:
+    # 프로필 관심사는 리스트 또는 "금리, 반도체" 같은 문자열로 들어온다
+    if isinstance(interests, str):
+        interests = re.split(r"[,/\n]", interests)
+    return [k.strip() for k in (interests or []) if k and k.strip()]
+
+def _interest_counts(doc: NewsDoc, m: "matcher.InterestMatcher") -> Counter:
+    counts = doc.interest_counts.get(m)
+    if counts is None:
+        counts = doc.interest_counts[m] = m.count(doc.title, doc.summary, doc.content)
+    return counts
+
+def _hit_to_doc(hit: "search_index.SearchHit") -> NewsDoc:
+    return NewsDoc(hit.title, hit.url, int(hit.published_at or 0), hit.source, hit.summary)
 
 # ------------------------------------------------------------------------------
 # DB API
@@ -111,7 +155,7 @@ def search_db_api_by_keyword(keyword: str, limit: int = 6) -> list[NewsDoc]:
         return out
     try:
         url = f"{NEWS_DB_API_BASE}{NEWS_DB_SEARCH_PATH}"
-        resp = requests.get(url, params={"q": keyword, "limit": limit}, timeout=5)
+        resp = http_session.get(url, params={"q": keyword, "limit": limit}, timeout=5)
         resp.raise_for_status()
         data = resp.json() or []
         for it in data:
@@ -137,118 +181,164 @@ def search_db_api_by_keyword(keyword: str, limit: int = 6) -> list[NewsDoc]:
 # ------------------------------------------------------------------------------
 # RSS 메타 수집
 # ------------------------------------------------------------------------------
-def collect_rss_meta_via_feedparser(
+_parsed_feeds: Dict[str, Tuple[int, list]] = {}
+
+def _fetch_feed_entries(rss_url: str, timeout: float = RSS_FETCH_TIMEOUT) -> list:
+    # feedparser.parse(url)은 타임아웃이 없으므로 본문은 캐시/requests로 받고 파싱만 맡긴다
+    body = feed_cache.fetch_feed_body(rss_url, headers=UA_HEADERS, timeout=timeout)
+
+    # 본문이 그대로면(TTL 내 / 304) 이전 파싱 결과를 재사용
+    digest = hash(body)
+    memo = _parsed_feeds.get(rss_url)
+    if memo and memo[0] == digest:
+        return memo[1]
+    parsed = feedparser.parse(body)
+    entries = getattr(parsed, "entries", []) or []
+    _parsed_feeds[rss_url] = (digest, entries)
+    return entries
+
+def _entries_to_docs(entries: list, source: str, per_feed_limit: int,
+                     cutoff: Optional[float]) -> List[NewsDoc]:
+    docs: List[NewsDoc] = []
+    for e in entries[:per_feed_limit]:
+        title = _norm(getattr(e, "title", ""))
+        link = _norm(getattr(e, "link", ""))
+        if not title or not link: continue
+        ts = _parse_time(e)
+        if cutoff is not None and ts and ts < cutoff: continue
+        summary = _norm(getattr(e, "summary", "")) or _norm(getattr(e, "description", ""))
+        docs.append(NewsDoc(title, link, ts, source, summary))
+    return docs
+
+def iter_rss_meta(
     feeds: List[str],
     per_feed_limit: int = PER_FEED_LIMIT,
     days_back: Optional[int] = None,
-) -> List[NewsDoc]:
-    docs: List[NewsDoc] = []
+    timeout: float = RSS_FETCH_TIMEOUT,
+) -> Iterator[Tuple[str, List[NewsDoc]]]:
+    """
+    모든 피드를 동시에 폴링하고, 끝나는 순서대로 (rss_url, docs)를 내보낸다.
+    실패하거나 시간 안에 끝나지 않은 피드는 빈 결과로 취급한다.
+    """
+    if not feeds:
+        return
     cutoff = None
     if days_back and days_back > 0:
         cutoff = time.time() - days_back * 86400
 
-    for rss_url in feeds:
-        parsed = feedparser.parse(rss_url)
-        source = _domain_of(rss_url)
-        cnt = 0
-        entries = getattr(parsed, "entries", []) or []
-        for e in entries[:per_feed_limit]:
-            title = _norm(getattr(e, "title", ""))
-            link = _norm(getattr(e, "link", ""))
-            if not title or not link: continue
-            ts = _parse_time(e)
-            if cutoff is not None and ts and ts < cutoff: continue
-            summary = _norm(getattr(e, "summary", "")) or _norm(getattr(e, "description", ""))
-            docs.append(NewsDoc(title, link, ts, source, summary))
-            cnt += 1
-        if DEBUG: print(f"[RSS] {source} : {cnt} fetched")
+    executor = ThreadPoolExecutor(max_workers=len(feeds), thread_name_prefix="rss")
+    futures = {executor.submit(_fetch_feed_entries, url, timeout): url for url in feeds}
+    try:
+        # 연결/읽기 타임아웃과 별개로 전체 폴링 시간에도 상한을 둔다
+        for fut in as_completed(futures, timeout=timeout * 2):
+            rss_url = futures[fut]
+            source = _domain_of(rss_url)
+            try:
+                docs = _entries_to_docs(fut.result(), source, per_feed_limit, cutoff)
+            except Exception as e:
+                if DEBUG: print(f"[RSS] {source} : fetch fail {e!r}")
+                docs = []
+            if DEBUG: print(f"[RSS] {source} : {len(docs)} fetched")
+            yield rss_url, docs
+    except FuturesTimeout:
+        if DEBUG: print(f"[RSS] feed timeout ({timeout * 2:.0f}s) -> skip slow feeds")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
+def collect_rss_meta_via_feedparser(
+    feeds: List[str],
+    per_feed_limit: int = PER_FEED_LIMIT,
+    days_back: Optional[int] = None,
+) -> List[NewsDoc]:
+    by_feed: Dict[str, List[NewsDoc]] = {}
+    for rss_url, feed_docs in iter_rss_meta(feeds, per_feed_limit=per_feed_limit, days_back=days_back):
+        by_feed[rss_url] = feed_docs
+
+    # 결과 순서는 FEEDS 순서로 고정 (완료 순서와 무관)
+    docs: List[NewsDoc] = [d for rss_url in feeds for d in by_feed.get(rss_url, [])]
     if DEBUG: print(f"[RSS] total collected = {len(docs)} (meta only)")
     return docs
 
 # ------------------------------------------------------------------------------
 # 본문 스크랩
 # ------------------------------------------------------------------------------
-def _scrape_hankyung_via_loader(url: str) -> str:
+def _scrape_from_network(url: str) -> str:
+    # 매체별 추출기는 common/extractors.py 레지스트리에서 관리
     try:
-        loader = WebBaseLoader(
-            web_paths=(url,),
-            bs_kwargs=dict(parse_only=bs4.SoupStrainer("div", attrs={"id": "articletxt"})),
-            header_template=UA_HEADERS,
-        )
-        docs = loader.load()
-        if not docs: return ""
-        return " ".join(s.strip() for s in (docs[0].page_content or "").split("\n") if s.strip())
-    except Exception as e:
-        if DEBUG: print("[scrape fail] hankyung:", repr(e))
+        return extractors.scrape(url)
+    except politeness.DomainCircuitOpen as e:
+        if DEBUG: print("[scrape skip]", repr(e))
         return ""
-
-def _scrape_yonhap(url: str, timeout: int = 15) -> str:
-    try:
-        loader = WebBaseLoader(
-            web_paths=(url,),
-            bs_kwargs=dict(parse_only=bs4.SoupStrainer("div", attrs={"class": "story-news article"})),
-            header_template=UA_HEADERS,
-        )
-        docs = loader.load()
-        if docs:
-            text = docs[0].page_content.strip()
-            text = " ".join(s.strip() for s in text.split("\n") if s.strip())
-            return re.sub(r"\[[^\]]*\]", "", text)
-    except Exception: pass
-    
-    try:
-        r = requests.get(url, headers=UA_HEADERS, timeout=timeout)
-        r.raise_for_status()
-        soup = bs4.BeautifulSoup(r.text, "html.parser")
-        container = soup.select_one("div.story-news.article")
-        if not container: return ""
-        for bad in container.select("script, style, figure, aside"): bad.decompose()
-        for br in container.find_all("br"): br.replace_with("\n")
-        
-        text = container.get_text("\n", strip=True)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r"\[[^\]]*\]", "", text)
-        return text
     except Exception as e:
-        if DEBUG: print("[scrape fail] yonhap:", repr(e))
+        if DEBUG: print("[scrape fail]", _domain_of(url), repr(e))
         return ""
 
-def _scrape_mk(url: str, timeout: int = 15) -> str:
-    try:
-        resp = requests.get(url, headers=UA_HEADERS, timeout=timeout)
-        resp.raise_for_status()
-    except Exception as e:
-        if DEBUG: print("[scrape fail] mk GET:", repr(e))
-        return ""
-    soup = bs4.BeautifulSoup(resp.text, "html.parser")
-    container = soup.select_one("div.news_cnt_detail_wrap")
-    if not container: return ""
-    for bad in container.select(".ad_wrap, .ad_wrap_ad_wide, script, style, figure, aside"): bad.decompose()
-    
-    text = container.get_text("\n", strip=True)
-    return re.sub(r"\n{3,}", "\n\n", text)
+def _scrape_through_store(url: str, fetch) -> str:
+    # 저장소에 있으면 네트워크를 타지 않는다 (빈 본문은 저장하지 않아 다음에 재시도)
+    stored = content_store.get(url, extractor_version=EXTRACTOR_VERSION)
+    if stored is not None:
+        if DEBUG: print(f"[store hit] {_domain_of(url)} | {len(stored.content)} chars")
+        return stored.content
+    content = fetch(url)
+    if content:
+        content_store.put(url, content, EXTRACTOR_VERSION)
+    return content
 
 def scrape_article_via_loader(url: str) -> str:
-    dom = _domain_of(url)
-    if "hankyung.com" in dom: return _scrape_hankyung_via_loader(url)
-    if "yna.co.kr" in dom: return _scrape_yonhap(url)
-    if "mk.co.kr" in dom: return _scrape_mk(url)
+    return _scrape_through_store(url, _scrape_from_network)
 
-    tag_attrs = DOMAIN_PARSE_ONLY.get(dom)
-    if not tag_attrs: return ""
+# ------------------------------------------------------------------------------
+# 병렬 스크랩 엔진 (도메인별 동시성 제한 + 전체 데드라인)
+# ------------------------------------------------------------------------------
+_domain_sems: Dict[str, threading.BoundedSemaphore] = {}
+_domain_sems_lock = threading.Lock()
+
+def _domain_semaphore(dom: str) -> threading.BoundedSemaphore:
+    with _domain_sems_lock:
+        sem = _domain_sems.get(dom)
+        if sem is None:
+            sem = _domain_sems[dom] = threading.BoundedSemaphore(SCRAPE_PER_DOMAIN_LIMIT)
+        return sem
+
+def _scrape_capped(url: str) -> str:
+    def _fetch(u: str) -> str:
+        with _domain_semaphore(_domain_of(u)):
+            return _scrape_from_network(u)
+    return _scrape_through_store(url, _fetch)
+
+def scrape_many(urls: List[str],
+                max_workers: int = SCRAPE_MAX_WORKERS,
+                deadline: float = SCRAPE_DEADLINE_SEC) -> Dict[str, str]:
+    """
+    여러 기사를 동시에 스크랩해 {url: 본문}을 돌려준다.
+    같은 매체에는 SCRAPE_PER_DOMAIN_LIMIT개까지만 동시에 요청하고,
+    deadline(초)이 지나면 끝난 것만 담아 부분 결과로 반환한다.
+    """
+    results: Dict[str, str] = {}
+    urls = list(dict.fromkeys(u for u in urls if u))
+    if not urls:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls))),
+                                  thread_name_prefix="scrape")
+    futures = {executor.submit(_scrape_capped, u): u for u in urls}
+    started = time.time()
     try:
-        loader = WebBaseLoader(
-            web_paths=(url,),
-            bs_kwargs=dict(parse_only=bs4.SoupStrainer(tag_attrs[0], attrs=tag_attrs[1])),
-            header_template=UA_HEADERS,
-        )
-        docs = loader.load()
-        if not docs: return ""
-        return _norm(docs[0].page_content or "")
-    except Exception as e:
-        if DEBUG: print("[scrape fail]", dom, repr(e))
-        return ""
+        for fut in as_completed(futures, timeout=deadline):
+            url = futures[fut]
+            try:
+                results[url] = fut.result() or ""
+            except Exception as e:
+                if DEBUG: print("[scrape fail]", _domain_of(url), repr(e))
+                results[url] = ""
+    except FuturesTimeout:
+        if DEBUG:
+            print(f"[scrape] deadline {deadline:.0f}s hit -> partial {len(results)}/{len(urls)}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if DEBUG: print(f"[scrape] {len(results)}/{len(urls)} done in {time.time() - started:.1f}s")
+    return results
 
 # ------------------------------------------------------------------------------
 # LLM 파라미터 추출
@@ -272,10 +362,10 @@ def extract_search_params_llm(user_text: str) -> SearchParams:
         "- '최근 경제 뉴스 보여줘' -> {\"keyword\": \"경제\", \"k\": 1, \"reason\": \"키워드 경제, 개수 미지정(기본값 1)\"}\n"
         "- '요약해줘' -> {\"keyword\": null, \"k\": 1, \"reason\": \"검색 키워드 없음\"}"
     )
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
     
     try:
-        res = llm.invoke([("system", sys_prompt), ("user", user_text)])
+        res = invoke_llm(llm, [("system", sys_prompt), ("user", user_text)], label="news_query")
         text = res.content.strip()
         
         # ✅ [수정] 마크다운 코드 블록 제거 (```json ... ```)
@@ -296,47 +386,206 @@ def extract_search_params_llm(user_text: str) -> SearchParams:
         return SearchParams(keyword=None, k=1, reason="fallback")
 
 # ------------------------------------------------------------------------------
-# Daily Top 3 (본문 기반)
+# 증분 수집 (피드 워터마크 이후 새 항목만 스크랩/색인)
 # ------------------------------------------------------------------------------
-def build_daily_top3(profile: Optional[Dict[str, Any]] = None,
-                     state: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    # 1) 메타 수집
-    meta = collect_rss_meta_via_feedparser(FEEDS, per_feed_limit=PER_FEED_LIMIT)
-
-    # 2) 전건 본문 스크랩
-    full: List[NewsDoc] = []
-    for d in meta:
-        d.content = scrape_article_via_loader(d.url)
-        full.append(d)
+def ingest_new_articles(per_feed_limit: int = PER_FEED_LIMIT) -> List[NewsDoc]:
+    """
+    피드별 워터마크 이후 새로 올라온 항목만 본문 스크랩 + 색인한다.
+    poll_feeds 커맨드(수 분 간격)와 데일리 작업이 함께 사용한다.
+    """
+    new_by_feed: Dict[str, List[NewsDoc]] = {}
+    for rss_url, docs in iter_rss_meta(FEEDS, per_feed_limit=per_feed_limit):
+        new_by_feed[rss_url] = feed_watermark.filter_new(rss_url, docs)
+        if DEBUG: print(f"[ingest] {_domain_of(rss_url)} : {len(new_by_feed[rss_url])}/{len(docs)} new")
+
+    fresh: List[NewsDoc] = []
+    seen_urls = set()
+    for docs in new_by_feed.values():
+        for d in docs:
+            if d.url in seen_urls: continue
+            seen_urls.add(d.url)
+            fresh.append(d)
+    if not fresh:
+        return fresh
+
+    contents = scrape_many([d.url for d in fresh])
+    for d in fresh:
+        d.content = contents.get(d.url, "")
         if DEBUG:
-            print(f"[daily] scraped {len(d.content):>4} | {d.source} | {d.title[:30]}")
+            print(f"[ingest] scraped {len(d.content):>4} | {d.source} | {d.title[:30]}")
 
-    # 3) 관심사 기반 필터
-    interests = set((profile or {}).get("interests", []))
-    def _hit(doc: NewsDoc) -> bool:
-        if not interests: return True
-        t, s, c = doc.title.lower(), doc.summary.lower(), (doc.content or "").lower()
-        return any(k.lower() in t or k.lower() in s or k.lower() in c for k in interests)
+    # 로컬 검색 인덱스에 증분 색인 (챗봇 검색용)
+    try:
+        n = search_index.add_documents(fresh)
+        if DEBUG: print(f"[ingest] indexed {n} new docs")
+    except Exception as e:
+        if DEBUG: print("[ingest] index fail:", repr(e))
+
+    # 큐레이션용 임베딩은 수집 시점에 한 번만 계산해 캐시 (랭킹 때는 캐시 조회만)
+    try:
+        embeddings.embed_texts([embeddings.doc_text(d.title, d.summary, d.content) for d in fresh if d.content])
+    except Exception as e:
+        if DEBUG: print("[ingest] embed fail:", repr(e))
+
+    # 데드라인에 걸렸거나 서킷이 열려 건너뛴 항목은 다음 수집 때 다시 시도
+    for rss_url, docs in new_by_feed.items():
+        done = [d for d in docs
+                if d.content or (d.url in contents and not politeness.scheduler.is_open(_domain_of(d.url)))]
+        feed_watermark.advance(rss_url, done)
+
+    return fresh
+
+def load_recent_pool(hours: int = DAILY_POOL_HOURS) -> List[NewsDoc]:
+    """최근 hours시간 안에 수집된(본문 있는) 기사를 로컬 저장소에서 불러온다."""
+    since = int(time.time()) - hours * 3600
+    pool: List[NewsDoc] = []
+    for hit in search_index.recent_documents(since, content_only=True):
+        stored = content_store.get(hit.url, extractor_version=EXTRACTOR_VERSION)
+        if stored is None: continue
+        d = _hit_to_doc(hit)
+        d.content = stored.content
+        pool.append(d)
+    return pool
 
-    full = [d for d in full if _hit(d)]
+# ------------------------------------------------------------------------------
+# Daily Ingest (공용 풀: 실행당 1회 구성)
+# ------------------------------------------------------------------------------
+def ingest_daily_pool() -> List[NewsDoc]:
+    """
+    마지막 증분 수집 이후 분량만 가져온 뒤, 최근 DAILY_POOL_HOURS 동안
+    수집된 기사로 공용 풀을 만든다. 사용자별 단계(build_daily_top3)는 이 풀을
+    필터/정렬만 하므로 스크랩 비용이 사용자 수와 무관하게 O(기사 수)가 된다.
+    """
+    ingest_new_articles()
+    pool = load_recent_pool()
 
-    # 4) 중복 제거 & 최신순 -> Top 3
-    full = _dedup_by_title(full)
-    full.sort(key=lambda d: d.published_at, reverse=True)
-    picks = full[:3]
+    # 제목만 다른 재게재 기사 제거 (요약/용어/퀴즈 LLM 비용 절감)
+    pool = _dedup_near_duplicates(pool)
 
+    if DEBUG: print(f"[ingest] daily pool size = {len(pool)}")
+    return pool
+
+# ------------------------------------------------------------------------------
+# Daily Top 3 (본문 기반, 관련도 랭킹)
+# ------------------------------------------------------------------------------
+def _to_daily_dict(d: NewsDoc) -> Dict[str, Any]:
     # ✅ [핵심 수정] content 필드를 포함하여 반환하도록 수정
-    daily = [
-        {
-            "title": d.title,
-            "url": d.url,
-            "source": d.source,
-            "published_at": int(d.published_at),
-            "summary": d.summary,
-            "content": d.content,  # ★ 여기를 추가했습니다!
-        }
-        for d in picks
-    ]
+    return {
+        "title": d.title,
+        "url": d.url,
+        "source": d.source,
+        "published_at": int(d.published_at),
+        "summary": d.summary,
+        "content": d.content,  # ★ 여기를 추가했습니다!
+    }
+
+def _profile_query(profile: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Optional[str]]:
+    """(관심사, 최근 질문, 등급) — 같은 값이면 랭킹 결과를 공유한다. 등급은 LLM 재선별 때만 구분"""
+    profile = profile or {}
+    interests = tuple(sorted(set(_parse_interests(profile.get("interests")))))
+    history = tuple(h.strip() for h in (profile.get("history") or []) if h and h.strip())
+    level = profile.get("level") if CURATION_LLM_TIEBREAK else None
+    return interests, history, level
+
+def _semantic_similarity(docs: List[NewsDoc], queries: List[str]) -> Optional[np.ndarray]:
+    """(질의 수, 기사 수) 코사인 유사도. 질의가 비었거나 임베딩 실패면 None"""
+    active = [r for r, q in enumerate(queries) if q]
+    if not active:
+        return None
+    try:
+        doc_vecs = embeddings.embed_texts([embeddings.doc_text(d.title, d.summary, d.content) for d in docs])
+        query_vecs = embeddings.embed_texts([queries[r] for r in active])
+    except Exception as e:
+        if DEBUG: print("[curation] embed fail -> keyword only:", repr(e))
+        return None
+    sim = np.zeros((len(queries), len(docs)), dtype=np.float32)
+    sim[active] = embeddings.cosine_matrix(query_vecs, doc_vecs)
+    return sim
+
+def _llm_tiebreak(query: str, level: Optional[str], candidates: List[NewsDoc], k: int) -> List[NewsDoc]:
+    """랭킹 상위 후보(k + EXTRA건) 제목만 보여주고 최종 k건을 고르게 한다. 실패하면 랭킹 순서 유지"""
+    if len(candidates) <= k:
+        return candidates
+    titles = "\n".join(f"{i + 1}. {d.title}" for i, d in enumerate(candidates))
+    sys_prompt = (
+        "당신은 경제 뉴스 큐레이터입니다. [사용자 정보]와 [후보 뉴스 제목]을 보고 "
+        f"사용자에게 가장 유익한 기사 {k}개의 번호를 고르세요.\n"
+        "반드시 JSON으로만 응답하세요. 예시: {\"final_indices\": [2, 1, 4]}"
+    )
+    user_msg = f"[사용자 정보]\n- 레벨: {level}\n- 관심사/최근 질문: {query}\n\n[후보 뉴스 제목]\n{titles}"
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
+    try:
+        import json
+        text = invoke_llm(llm, [("system", sys_prompt), ("user", user_msg)], label="curation").content.strip()
+        if "```" in text:
+            text = text.split("```")[1].removeprefix("json")
+        picked = [candidates[i - 1] for i in json.loads(text)["final_indices"] if 0 < i <= len(candidates)]
+        picked = list(dict.fromkeys(picked))
+        rest = [d for d in candidates if d not in picked]
+        return (picked + rest)[:k]
+    except Exception as e:
+        if DEBUG: print("[curation] tiebreak fail:", repr(e))
+        return candidates[:k]
+
+def rank_daily_top3(profiles: List[Optional[Dict[str, Any]]],
+                    pool: List[NewsDoc], k: int = 3) -> List[List[Dict[str, Any]]]:
+    """
+    공용 풀 하나로 여러 사용자의 Top-k를 한 번에 계산한다.
+    중복 제거/풀 특징(최신성, 매체, 사건 그룹)은 1회, 관심사 스캔/임베딩 유사도는 관심사 조합당 1회.
+    관심사가 있는 사용자는 키워드가 나오거나 의미상 가까운 기사를 먼저 받고, 모자라면 전체 랭킹으로 채운다.
+    최근 질문은 임베딩 유사도 점수로만 반영한다.
+    """
+    docs = _dedup_near_duplicates(_dedup_by_title(list(pool)))
+    if not docs:
+        return [[] for _ in profiles]
+
+    features = ranking.PoolFeatures.build(
+        [d.published_at for d in docs], [d.source for d in docs], [d.simhash for d in docs]
+    )
+    # 같은 (관심사, 최근 질문) 사용자는 같은 행 하나로 랭킹하고 결과를 공유
+    keys = [_profile_query(p) for p in profiles]
+    row_of: Dict[Any, int] = {}
+    for key in keys:
+        row_of.setdefault(key, len(row_of))
+    rows = list(row_of)
+    queries = [", ".join(interests + history) for interests, history, _ in rows]
+
+    counts = np.zeros((len(rows), len(docs)), dtype=np.float64)
+    for r, (interests, _, _) in enumerate(rows):
+        m = matcher.get_matcher(interests)
+        if m:
+            counts[r] = [sum(_interest_counts(d, m).values()) for d in docs]
+    similarity = _semantic_similarity(docs, queries)
+
+    # 관심사가 있으면 키워드가 나오거나 의미상 가까운 기사를 우선 후보로 둔다.
+    # 최근 질문만 있는 사용자는 인사/잡담 질문이 섞이므로 유사도를 점수로만 쓰고 거르지 않는다.
+    mask = np.ones((len(rows), len(docs)), dtype=bool)
+    for r, (interests, _, _) in enumerate(rows):
+        if not interests:
+            continue
+        mask[r] = counts[r] > 0
+        if similarity is not None:
+            mask[r] |= similarity[r] >= CURATION_MIN_SIMILARITY
+
+    extra = CURATION_TIEBREAK_EXTRA if CURATION_LLM_TIEBREAK else 0
+    # 우선 후보가 k건보다 적으면 전체 랭킹 순서로 채운다 (관심 기사가 없는 날에도 Top-k를 받음)
+    picks = ranking.top_k_filled(features, counts, mask, k=k + extra, similarity=similarity)
+    ranked = []
+    for r, row in enumerate(picks):
+        chosen = [docs[i] for i in row if i >= 0]
+        if extra and queries[r]:
+            chosen = _llm_tiebreak(queries[r], rows[r][2], chosen, k)
+        ranked.append([_to_daily_dict(d) for d in chosen[:k]])
+    return [list(ranked[row_of[key]]) for key in keys]
+
+def build_daily_top3(profile: Optional[Dict[str, Any]] = None,
+                     state: Optional[Dict[str, Any]] = None,
+                     pool: Optional[List[NewsDoc]] = None) -> List[Dict[str, Any]]:
+    # 1~2) 공용 풀 사용 (없으면 단독 실행용으로 직접 수집/스크랩)
+    full: List[NewsDoc] = list(pool) if pool is not None else ingest_daily_pool()
+
+    # 3~4) 관심사 필터 + 중복 제거 + 관련도 랭킹 -> Top 3
+    daily = rank_daily_top3([profile], full)[0]
 
     if state is not None:
         ctx = state.setdefault("context", {})
@@ -353,17 +602,32 @@ def handle_on_demand(user_text: str, state: Optional[Dict] = None, profile: Opti
     keyword, k = params.keyword, params.k
     
     picks: list[NewsDoc] = []
+    candidates: list[NewsDoc] = []
     # DB 검색 생략 (필요시 추가)
-    
-    # RSS 검색
-    meta = collect_rss_meta_via_feedparser(FEEDS, per_feed_limit=ONDEMAND_PER_FEED_LIMIT, days_back=ONDEMAND_DAYS_BACK)
+
+    # 1) 로컬 인덱스 검색 (수집된 전체 기사 대상, 관련도순)
     if keyword:
-        meta = [d for d in meta if _keyword_matches_any(d.title, d.summary, "", keyword)]
-    meta.sort(key=lambda d: d.published_at, reverse=True)
-    
+        try:
+            candidates = [_hit_to_doc(h) for h in search_index.search(keyword, limit=k)]
+            if DEBUG: print(f"[DBG index] hits={len(candidates)} for '{keyword}'")
+        except Exception as e:
+            if DEBUG: print("[DBG index] error:", repr(e))
+
+    # 2) 부족하면 RSS 검색 (결과는 다음 검색을 위해 색인)
+    if len(candidates) < k:
+        meta = collect_rss_meta_via_feedparser(FEEDS, per_feed_limit=ONDEMAND_PER_FEED_LIMIT, days_back=ONDEMAND_DAYS_BACK)
+        try:
+            search_index.add_documents(meta)
+        except Exception as e:
+            if DEBUG: print("[DBG index] add fail:", repr(e))
+        if keyword:
+            meta = [d for d in meta if _keyword_matches_any(d.title, d.summary, "", keyword)]
+        meta.sort(key=lambda d: d.published_at, reverse=True)
+        candidates += meta
+
     # 중복 제거 및 선택
     seen = set()
-    for d in meta:
+    for d in candidates:
         if d.url not in seen:
             seen.add(d.url)
             picks.append(d)
@@ -372,10 +636,16 @@ def handle_on_demand(user_text: str, state: Optional[Dict] = None, profile: Opti
     if not picks:
         return AIMessage(content=f"[news_find] '{keyword}' 관련 기사를 찾지 못했습니다.")
 
-    # 본문 스크랩
+    # 본문 스크랩 (병렬: 가장 느린 기사 1건 시간 안에 반환)
+    contents = scrape_many([d.url for d in picks], deadline=ONDEMAND_SCRAPE_DEADLINE_SEC)
     ctx_articles = []
     for d in picks:
-        d.content = scrape_article_via_loader(d.url)
+        d.content = contents.get(d.url, "")
+        if d.content:
+            try:
+                search_index.add_document(d.url, d.title, d.summary, d.content, d.source, d.published_at)
+            except Exception as e:
+                if DEBUG: print("[DBG index] add fail:", repr(e))
         ctx_articles.append({
             "title": d.title, "url": d.url, "source": d.source,
             "published_at": int(d.published_at), "summary": d.summary,
@@ -1,14 +1,23 @@
 """
 news_summary.py — 뉴스 요약 에이전트 (LangChain + FewShot + Personalization)
 """
-from typing import List, Dict, Any, Optional
-import re, json, time
+from typing import List, Dict, Any, Optional, Tuple
+import os, re, json, time, threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from langchain_core.prompts import ChatPromptTemplate, FewShotChatMessagePromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 
+try:
+    from ..common import token_budget, summary_cache
+    from ..common.llm import get_chat_model, invoke_llm, is_retryable
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common import token_budget, summary_cache
+    from common.llm import get_chat_model, invoke_llm, is_retryable
+
 # ============================================================
 # 🔧 디버그 설정
 # ============================================================
@@ -38,7 +47,19 @@ def sanitize_articles(items: List[Any]) -> List[Dict]:
             })
     return safe
 
-SAFE_MAX_CHARS = 4000  # GPT-4o-mini 토큰 한도 고려
+SUMMARY_MODEL = "gpt-4o-mini"
+# 프롬프트/퓨샷/map-reduce 방식을 바꾸면 올린다 (요약 캐시 무효화)
+PROMPT_VERSION = "3"
+# 본문 토큰 예산: 이하면 한 번에 요약, 넘으면 청크별 요약(map) 후 합쳐서 최종 요약(reduce)
+SUMMARY_INPUT_TOKENS = int(os.getenv("SUMMARY_INPUT_TOKENS", "3000"))
+MAP_CHUNK_TOKENS = int(os.getenv("SUMMARY_MAP_CHUNK_TOKENS", "2000"))
+MAP_OVERLAP_TOKENS = 100
+MAP_MAX_WORKERS = int(os.getenv("SUMMARY_MAP_MAX_WORKERS", "4"))
+# 프로세스 전체에서 동시에 나가는 요약 LLM 호출 상한 (OpenAI 분당 요청 한도에 맞춰 조정)
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))
+# 기사 단위가 아니라 LLM 호출 시도 단위로 잡는다 (map 청크 호출과 함께 써도 교착되지 않게).
+# invoke_llm(slots=...)이 시도마다 잡았다 놓으므로 재시도 백오프/429 대기 중에는 슬롯을 비워 둔다.
+_llm_slots = threading.BoundedSemaphore(SUMMARY_MAX_CONCURRENCY)
 
 # ---------------------------
 # 1) 레벨별 퓨샷 (스키마 유지, 개인화 문구 강화)
@@ -139,45 +160,52 @@ FEW_SHOT_EXAMPLES = {
 # ---------------------------
 # 2) 프롬프트 빌더
 # ---------------------------
-def build_summary_prompt(level: str, user_profile: Dict = None) -> ChatPromptTemplate:
-    level = level if level in FEW_SHOT_EXAMPLES else "새싹"
-    
-    # 레벨별 설정
-    cfg = {
-        "씨앗": {
-            "sent_avg": "25~30", "sent_max": 30,
-            "jargon_max": 0, "tone": "일상어 위주, 평이·직설",
-            "personalize_rules": ["유치원생이 알아 들을 수 있게 요약하라."]
-        },
-        "새싹": {
-            "sent_avg": "35~40", "sent_max": 40,
-            "jargon_max": 1, "tone": "간결·실용, 필요시 쉬운 괄호 풀이",
-            "personalize_rules": ["초등학생이 알아 들을 수 있게 요약하라."]
-        },
-        "나무": {
-            "sent_avg": "45~50", "sent_max": 50,
-            "jargon_max": 3, "tone": "시장·수급 용어 허용, 과잉전문어 금지",
-            "personalize_rules": ["경제학을 전공한 학부생이 알아 들을 수 있게 요약하라."]
-        },
-        "숲": {
-            "sent_avg": "55~60", "sent_max": 60,
-            "jargon_max": 5, "tone": "정책·커브·프리미엄 등 고급 용어 허용",
-            "personalize_rules": ["경제학 박사 혹은 교수가 알아 들을 수 있게 요약하라."]
-        }
-    }.get(level, { 
-        "sent_avg": "50", "sent_max": 50, "jargon_max": 2, "tone": "친절함", "personalize_rules": ["쉽게 설명하라"]
-    })
+# 레벨별 설정 (단일/다중 등급 요약 공용)
+LEVEL_CONFIG = {
+    "씨앗": {
+        "sent_avg": "25~30", "sent_max": 30,
+        "jargon_max": 0, "tone": "일상어 위주, 평이·직설",
+        "personalize_rules": ["유치원생이 알아 들을 수 있게 요약하라."]
+    },
+    "새싹": {
+        "sent_avg": "35~40", "sent_max": 40,
+        "jargon_max": 1, "tone": "간결·실용, 필요시 쉬운 괄호 풀이",
+        "personalize_rules": ["초등학생이 알아 들을 수 있게 요약하라."]
+    },
+    "나무": {
+        "sent_avg": "45~50", "sent_max": 50,
+        "jargon_max": 3, "tone": "시장·수급 용어 허용, 과잉전문어 금지",
+        "personalize_rules": ["경제학을 전공한 학부생이 알아 들을 수 있게 요약하라."]
+    },
+    "숲": {
+        "sent_avg": "55~60", "sent_max": 60,
+        "jargon_max": 5, "tone": "정책·커브·프리미엄 등 고급 용어 허용",
+        "personalize_rules": ["경제학 박사 혹은 교수가 알아 들을 수 있게 요약하라."]
+    }
+}
+DEFAULT_LEVEL_CONFIG = {
+    "sent_avg": "50", "sent_max": 50, "jargon_max": 2, "tone": "친절함", "personalize_rules": ["쉽게 설명하라"]
+}
+
+_JSON_PARSER = JsonOutputParser()
+_FORMAT_INSTRUCTIONS = _JSON_PARSER.get_format_instructions()
 
+def build_summary_prompt(level: str, user_profile: Dict = None) -> ChatPromptTemplate:
     up = user_profile or {}
     interests = ", ".join(up.get("interests", [])) or "일반"
+    return _compiled_summary_prompt(level, interests)
+
+@lru_cache(maxsize=64)
+def _compiled_summary_prompt(level: str, interests: str) -> ChatPromptTemplate:
+    """(등급, 관심사)별 프롬프트는 한 번만 조립해 재사용한다 (퓨샷 포함)"""
+    level = level if level in FEW_SHOT_EXAMPLES else "새싹"
     
-    parser = JsonOutputParser()
-    format_instructions = parser.get_format_instructions()
+    cfg = LEVEL_CONFIG.get(level, DEFAULT_LEVEL_CONFIG)
 
     system_tmpl = (
         "당신은 경제 뉴스 요약 전문가입니다. 반드시 한국어로 답하고, 사실에 없는 내용은 추정하지 마세요.\n"
         "오직 JSON 하나만 반환하세요. 스키마는 다음과 같습니다:\n"
-        f"{format_instructions}\n"
+        f"{_FORMAT_INSTRUCTIONS}\n"
         "- summary_5sentences: 5문장 핵심 요약(문장 수 정확히 5개).\n"
         "- ** summary_len: 글자 수 500 내외로 핵심 요약 ** (정확하게 500자 내외)"
         "- key_points: 불릿 3개(간결, 중복 금지).\n"
@@ -231,20 +259,115 @@ def _json_loose_parse(s: str) -> Dict:
         except Exception:
             return {}
 
-def summarize_one(article: Dict, level: str, user_profile: Dict) -> Dict:
-    model = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0.2,
-        timeout=300,
-        model_kwargs={"response_format": {"type": "json_object"}},
-    )
-    parser = JsonOutputParser()
+# ---------------------------
+# 3-1) 긴 기사: 청크별 메모(map) -> 메모를 본문 대신 넣어 최종 요약(reduce)
+# ---------------------------
+MAP_PROMPT = ChatPromptTemplate.from_messages([
+    ("system",
+     "당신은 경제 기사 발췌 정리 담당입니다. 반드시 한국어 JSON 하나만 반환하세요.\n"
+     '스키마: {{"points": ["핵심 사실 3~6개"], "metrics": [{{"name": "", "value": "", "period": ""}}], '
+     '"term_candidates": ["경제 용어"]}}\n'
+     "- 본문에 있는 사실·수치만 적고 추정하지 마세요."),
+    ("human", "기사 제목: {title}\n전체 {total}개 부분 중 {index}번째 부분:\n{chunk}"),
+])
+
+def _map_chunk(title: str, chunk: str, index: int, total: int) -> Dict:
+    model = get_chat_model(SUMMARY_MODEL, temperature=0, json_mode=True, timeout=120)
+    try:
+        raw = invoke_llm(MAP_PROMPT | model, {"title": title, "chunk": chunk, "index": index, "total": total},
+                         label="summary_map", slots=_llm_slots)
+        data = _json_loose_parse(raw.content if hasattr(raw, "content") else str(raw))
+        if data.get("points"):
+            return data
+    except Exception as e:
+        dprint(f"Map chunk {index}/{total} failed: {e}")
+    # 실패한 부분은 원문 앞부분으로 대체 (reduce 단계에서 함께 요약)
+    share = max(200, SUMMARY_INPUT_TOKENS // max(1, total))
+    return {"points": [token_budget.truncate_to_tokens(chunk, share, SUMMARY_MODEL)],
+            "metrics": [], "term_candidates": []}
+
+def _reduce_notes(notes: List[Dict]) -> str:
+    lines = []
+    for i, note in enumerate(notes, 1):
+        lines.append(f"[부분 {i}]")
+        lines.extend(f"- {p}" for p in note.get("points", []))
+        for m in note.get("metrics", []):
+            if isinstance(m, dict) and m.get("name") and m.get("value"):
+                lines.append(f"- 수치: {m['name']} = {m['value']} ({m.get('period', '')})")
+    return token_budget.truncate_to_tokens("\n".join(lines), SUMMARY_INPUT_TOKENS, SUMMARY_MODEL)
+
+def _merge_unique(primary: List, extra: List) -> List:
+    out, seen = [], set()
+    for x in list(primary) + list(extra):
+        key = json.dumps(x, ensure_ascii=False, sort_keys=True) if isinstance(x, dict) else str(x)
+        if key not in seen:
+            seen.add(key)
+            out.append(x)
+    return out
+
+def prepare_content(title: str, content: str) -> Tuple[str, List[Dict]]:
+    """
+    요약 프롬프트에 넣을 본문. 예산 이하면 그대로, 넘으면 청크를 동시에 map 요약해
+    부분 메모로 바꾼다. (두 번째 값: map 결과, 짧은 기사면 빈 리스트)
+    """
+    if token_budget.count_tokens(content, SUMMARY_MODEL) <= SUMMARY_INPUT_TOKENS:
+        return content, []
+
+    chunks = token_budget.split_by_tokens(content, MAP_CHUNK_TOKENS, MAP_OVERLAP_TOKENS, SUMMARY_MODEL)
+    dprint(f"Long article -> map-reduce over {len(chunks)} chunks: {title[:10]}...")
+    with ThreadPoolExecutor(max_workers=max(1, min(MAP_MAX_WORKERS, len(chunks)))) as ex:
+        notes = list(ex.map(lambda ic: _map_chunk(title, ic[1], ic[0], len(chunks)), enumerate(chunks, 1)))
+    return _reduce_notes(notes), notes
+
+def _interests_key(user_profile: Any) -> str:
+    return ", ".join(user_profile.get("interests", []) or []) if isinstance(user_profile, dict) else ""
+
+def _finalize_summary(data: Dict, notes: List[Dict]) -> Dict:
+    # 최소 필드 보정
+    data.setdefault("summary_5sentences", "")
+    data.setdefault("key_points", [])
+    data.setdefault("metrics", [])
+    data.setdefault("term_candidates", [])
+    if notes:
+        # reduce 단계에서 빠진 부분별 수치/용어 보충
+        note_metrics = [m for n in notes for m in n.get("metrics", [])
+                        if isinstance(m, dict) and m.get("name") and m.get("value")]
+        note_terms = [t for n in notes for t in n.get("term_candidates", []) if t]
+        data["metrics"] = _merge_unique(data["metrics"], note_metrics)
+        data["term_candidates"] = _merge_unique(data["term_candidates"], note_terms)[:10]
+    return data
+
+# 데일리 배치 전용 캐시 변형: 다중 등급 프롬프트(퓨샷 없음) 결과는 챗봇 요약(summarize_one)과 키를 나눈다
+BATCH_CACHE_VARIANT = "batch"
+
+def _summary_key(content: str, level: Optional[str], user_profile: Any, batch: bool = False) -> str:
+    interests = _interests_key(user_profile)
+    variant = f"{BATCH_CACHE_VARIANT}|{interests}" if batch else interests
+    return summary_cache.make_key(content, level, PROMPT_VERSION, SUMMARY_MODEL, variant)
+
+def _cache_get(key: str) -> Optional[Dict]:
+    try:
+        return summary_cache.get(key)
+    except Exception as e:
+        dprint(f"Summary cache read failed: {e}")
+        return None
+
+def _cache_put(key: str, data: Dict, content: str, level: str) -> None:
+    try:
+        summary_cache.put(key, data, content, level, PROMPT_VERSION, SUMMARY_MODEL)
+    except Exception as e:
+        dprint(f"Summary cache write failed: {e}")
+
+def summarize_one(article: Dict, level: str, user_profile: Dict, batch: bool = False) -> Dict:
+    """batch=True(데일리)면 prefill_grade_summaries가 채운 배치 캐시도 먼저 본다."""
+    model = get_chat_model(SUMMARY_MODEL, temperature=0.2, json_mode=True, timeout=300)
+    parser = _JSON_PARSER
     prompt = build_summary_prompt(level, user_profile)
 
     title = article.get("title", "")
     url = article.get("url", "")
     raw_content = (article.get("content", "") or "")
-    content = _strip_ctrl(raw_content)[:SAFE_MAX_CHARS]
+    content = _strip_ctrl(raw_content)
 
     if not content.strip():
         dprint(f"Skip empty content for: {title}")
@@ -255,6 +378,16 @@ def summarize_one(article: Dict, level: str, user_profile: Dict) -> Dict:
             "_error": "empty_content"
         }
 
+    # 같은 본문 x 등급 x 프롬프트 버전 x 모델 요약은 캐시에서 바로 반환 (토큰 비용 0)
+    cache_key = _summary_key(content, level, user_profile)
+    cached = (batch and _cache_get(_summary_key(content, level, user_profile, batch=True))) or _cache_get(cache_key)
+    if cached:
+        dprint(f"Summary cache hit: {title[:10]}...")
+        return {"title": title, "url": url, "level": level, **cached}
+
+    content_key = content
+    content, notes = prepare_content(title, content)
+
     last_err = None
     for attempt in range(3):
         try:
@@ -262,27 +395,27 @@ def summarize_one(article: Dict, level: str, user_profile: Dict) -> Dict:
                 dprint(f"Retry summary ({attempt+1}/3) for: {title[:10]}...")
             
             chain = prompt | model
-            raw = chain.invoke({"title": title, "url": url, "content": content})
+            raw = invoke_llm(chain, {"title": title, "url": url, "content": content}, label="summary",
+                             slots=_llm_slots)
             text = raw.content if hasattr(raw, "content") else str(raw)
             
             data = _json_loose_parse(text)
             if not data:
                 data = parser.parse(text)
 
-            # 최소 필드 보정
-            data.setdefault("summary_5sentences", "")
-            data.setdefault("key_points", [])
-            data.setdefault("metrics", [])
-            data.setdefault("term_candidates", [])
+            data = _finalize_summary(data, notes)
             
             # 성공 시 디버그 로그
             dprint(f"Summary OK: {title[:10]}... (len={len(data['summary_5sentences'])})")
+            _cache_put(cache_key, data, content_key, level)
             return {"title": title, "url": url, "level": level, **data}
             
         except Exception as e:
             last_err = str(e)
             dprint(f"Summary failed attempt {attempt+1}: {e}")
-            time.sleep(0.5 * (attempt + 1))
+            # API 오류 재시도(백오프, 429 대기)는 invoke_llm이 이미 다 했다. 여기서는 JSON 파싱 실패만 다시 시도
+            if is_retryable(e):
+                break
 
     dprint(f"Give up summarizing: {title[:10]}...")
     return {
@@ -292,6 +425,143 @@ def summarize_one(article: Dict, level: str, user_profile: Dict) -> Dict:
     }
 
 
+# ---------------------------
+# 3-1b) 다중 등급 요약: 본문은 한 번만 보내고 등급별 요약을 한 번의 호출로 받는다
+# ---------------------------
+@lru_cache(maxsize=32)
+def _compiled_multi_grade_prompt(levels: Tuple[str, ...], interests: str) -> ChatPromptTemplate:
+    rules = "\n".join(
+        f"  · {lv}: 평균 문장 길이 {cfg['sent_avg']} 단어, 최대 {cfg['sent_max']} 단어/문장, "
+        f"전문용어 상한 {cfg['jargon_max']}개, 톤: {cfg['tone']}. {cfg['personalize_rules'][0]}"
+        for lv, cfg in ((lv, LEVEL_CONFIG.get(lv, DEFAULT_LEVEL_CONFIG)) for lv in levels)
+    )
+    example = ", ".join(
+        f'"{lv}": {{{{"summary_5sentences": "...", "key_points": ["..."], "metrics": [], "term_candidates": ["..."]}}}}'
+        for lv in levels
+    )
+    system_tmpl = (
+        "당신은 경제 뉴스 요약 전문가입니다. 반드시 한국어로 답하고, 사실에 없는 내용은 추정하지 마세요.\n"
+        f"같은 기사를 레벨 {', '.join(levels)} 독자용으로 각각 요약하고, 레벨 이름을 키로 하는 JSON 하나만 반환하세요.\n"
+        f"형식: {{{{{example}}}}}\n"
+        "- summary_5sentences: 레벨별 5문장 핵심 요약(문장 수 정확히 5개, 글자 수 500 내외).\n"
+        "- key_points: 불릿 3개(간결, 중복 금지).\n"
+        "- metrics: 본문에 실재하는 수치·지표만 포함(이름/값/기간 필수, 없는 경우 빈 배열).\n"
+        "- term_candidates: 해당 레벨 독자가 모를 법한 경제 용어 2~10개(기사 맥락 내에서만).\n"
+        "- 레벨별 난이도·가독성 목표(KReaD)와 개인화 규칙:\n"
+        f"{rules}\n"
+        f"- 관심사: {interests}\n"
+    )
+    return ChatPromptTemplate.from_messages([
+        ("system", system_tmpl),
+        ("human",
+         "다음 기사를 레벨별로 요약하세요.\n"
+         "제목: {title}\n"
+         "URL: {url}\n"
+         "본문:\n{content}\n\n"
+         "제약: 본문에 없는 수치·사실을 만들지 말고, JSON 외의 텍스트를 추가하지 마세요."),
+    ])
+
+def summarize_multi_grade(article: Dict, levels: List[str], user_profile: Optional[Dict] = None) -> Dict[str, Dict]:
+    """
+    등급 -> summarize_one과 같은 형식의 요약 dict. (데일리 배치 전용)
+    캐시에 없는 등급만 한 번의 호출로 만들고 각 등급의 배치 캐시에 저장한다.
+    등급 없음(None)은 새싹과 같은 요약을 쓴다. 빠진 등급/실패는 summarize_one으로 처리.
+    """
+    title = article.get("title", "")
+    url = article.get("url", "")
+    content = _strip_ctrl(article.get("content", "") or "")
+    interests = _interests_key(user_profile)
+    levels = list(dict.fromkeys(levels))
+
+    results: Dict[str, Dict] = {}
+    keys: Dict[str, str] = {}
+    if content.strip():
+        for lv in levels:
+            keys[lv] = _summary_key(content, lv, user_profile, batch=True)
+            cached = _cache_get(keys[lv]) or _cache_get(_summary_key(content, lv, user_profile))
+            if cached:
+                results[lv] = {"title": title, "url": url, "level": lv, **cached}
+
+    # 프롬프트 레벨(등급 없음 -> 새싹)별로 묶는다. 같은 프롬프트 레벨의 등급은 요약 하나를 같이 쓴다
+    groups: Dict[str, List[str]] = {}
+    for lv in levels:
+        if lv not in results:
+            groups.setdefault(lv if lv in LEVEL_CONFIG else "새싹", []).append(lv)
+
+    def _store(lv: str, part: Dict, content_key: str) -> None:
+        _cache_put(keys[lv], part, content_key, lv)
+        results[lv] = {"title": title, "url": url, "level": lv, **part}
+
+    wanted = tuple(groups)
+    if len(wanted) >= 2:
+        content_key = content
+        body, notes = prepare_content(title, content)
+        prompt = _compiled_multi_grade_prompt(wanted, interests or "일반")
+        model = get_chat_model(SUMMARY_MODEL, temperature=0.2, json_mode=True, timeout=300)
+        for attempt in range(2):
+            try:
+                raw = invoke_llm(prompt | model, {"title": title, "url": url, "content": body},
+                                 label="summary_multi", slots=_llm_slots)
+                data = _json_loose_parse(raw.content if hasattr(raw, "content") else str(raw))
+                for plv, lvs in groups.items():
+                    part = data.get(plv)
+                    if isinstance(part, dict) and part.get("summary_5sentences"):
+                        part = _finalize_summary(dict(part), notes)
+                        for lv in lvs:
+                            _store(lv, part, content_key)
+                dprint(f"Multi-grade summary OK ({len(results)}/{len(levels)}): {title[:10]}...")
+                break
+            except Exception as e:
+                dprint(f"Multi-grade summary failed attempt {attempt+1}: {e}")
+                if is_retryable(e):
+                    break
+
+    # 남은 프롬프트 레벨은 하나씩 요약하고, 같은 그룹의 다른 등급(등급 없음 등)에도 배치 캐시로 나눠 준다
+    for plv, lvs in groups.items():
+        missing = [lv for lv in lvs if lv not in results]
+        if not missing:
+            continue
+        one = summarize_one(article, plv, user_profile or {})
+        part = {k: v for k, v in one.items() if k not in ("title", "url", "level")}
+        for lv in missing:
+            if "_error" in one or lv not in keys:
+                results[lv] = {**one, "level": lv}
+            else:
+                _store(lv, part, content)
+    return results
+
+def prefill_grade_summaries(jobs: List[Tuple[Dict, List[str]]], user_profile: Optional[Dict] = None,
+                            max_workers: int = SUMMARY_MAX_CONCURRENCY) -> None:
+    """
+    데일리 작업용: 여러 등급에 걸친 기사를 다중 등급 요약으로 먼저 만들어 요약 캐시를 채운다.
+    이후 등급별 build_daily_summaries는 캐시에서 바로 읽는다.
+    jobs: [(기사 dict, [등급, ...]), ...]
+    """
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as ex:
+        list(ex.map(lambda job: summarize_multi_grade(sanitize_articles([job[0]])[0], job[1], user_profile), jobs))
+
+# ---------------------------
+# 3-2) 여러 기사 동시 요약 (입력 순서 유지)
+# ---------------------------
+def summarize_many(articles: List[Dict], level: str, user_profile: Dict,
+                   max_workers: int = SUMMARY_MAX_CONCURRENCY, batch: bool = False) -> List[Dict]:
+    if not articles:
+        return []
+
+    def _one(i_art):
+        i, art = i_art
+        dprint(f"[{i}/{len(articles)}] Summarizing: {art.get('title','Untitled')}")
+        return summarize_one(art, level, user_profile, batch=batch)
+
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(articles)))) as ex:
+        results = list(ex.map(_one, enumerate(articles, 1)))
+    dprint(f"Summarized {len(results)} articles in {time.time() - started:.1f}s")
+    return results
+
+
 # ---------------------------
 # 4) 메인 핸들러 (Chatbot)
 # ---------------------------
@@ -317,12 +587,7 @@ def handle(text: str, profile: Optional[Dict[str, Any]] = None, state: Optional[
         return AIMessage(content="[news_summary] 요약할 기사가 없습니다. 먼저 뉴스를 검색해 주세요.")
 
     sanitized = sanitize_articles(articles)
-    summaries = []
-    
-    for i, art in enumerate(sanitized, 1):
-        dprint(f"[{i}/{len(sanitized)}] Summarizing: {art.get('title','Untitled')}")
-        res = summarize_one(art, level, profile)
-        summaries.append(res)
+    summaries = summarize_many(sanitized, level, profile)
 
     # 결과를 State Context에 저장
     ctx["summaries"] = summaries
@@ -367,12 +632,7 @@ def build_daily_summaries(state: Dict[str, Any], profile: Dict) -> List[Dict]:
         return []
 
     sanitized = sanitize_articles(source_articles)
-    daily_summaries = []
-    
-    for i, art in enumerate(sanitized, 1):
-        dprint(f"[Batch] Summarizing [{i}/{len(sanitized)}]: {art.get('title','Untitled')}")
-        res = summarize_one(art, level, profile)
-        daily_summaries.append(res)
+    daily_summaries = summarize_many(sanitized, level, profile, batch=True)
         
     # 결과 저장 (보통 파이프라인 스크립트에서 state에 할당하겠지만, 여기서도 반환)
     return daily_summaries
\ No newline at end of file
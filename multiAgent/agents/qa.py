@@ -10,12 +10,17 @@ from dataclasses import dataclass
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.messages import AIMessage
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 
+try:
+    from ..common.llm import get_chat_model, get_structured_model, get_embeddings, get_search_tool, invoke_llm
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common.llm import get_chat_model, get_structured_model, get_embeddings, get_search_tool, invoke_llm
+
 load_dotenv()
 
 # ============================================================
@@ -65,7 +70,7 @@ def _build_ephemeral_store(corpus: List[Tuple[str, str]]) -> Optional[FAISS]:
     docs = [Document(page_content=txt, metadata={"doc_id": did}) for did, txt in corpus]
     splitter = RecursiveCharacterTextSplitter(chunk_size=600, chunk_overlap=80)
     splits = splitter.split_documents(docs)
-    vs = FAISS.from_documents(splits, OpenAIEmbeddings())
+    vs = FAISS.from_documents(splits, get_embeddings())
     return vs
 
 def _internal_rag_answer(
@@ -102,11 +107,11 @@ def _internal_rag_answer(
         "반드시 제공된 컨텍스트 내에서만 답하고, 문맥에 없는 내용은 추측하지 말아라. "
         f"사용자 수준(level={level})에 맞춰 간단히 설명하고, 필요하면 한 줄 예시를 들어라."
     )
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    res = llm.invoke([
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
+    res = invoke_llm(llm, [
         {"role": "system", "content": sys},
         {"role": "user", "content": f"질문: {question}\n\n[내부 컨텍스트]\n{ctx_text}"},
-    ])
+    ], label="qa")
     return AIMessage(content=res.content)
 
 
@@ -116,11 +121,11 @@ def _internal_rag_answer(
 _SMALLTALK_PAT = re.compile(r"^\s*(안녕|하이|헬로|hello|반가워|고마워|감사|잘\s*지내|ㅎㅇ)\b", re.IGNORECASE)
 def qa_smalltalk(user_text: str) -> AIMessage:
     dprint("mode=SMALLTALK")
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
-    res = llm.invoke([
+    llm = get_chat_model("gpt-4o-mini", temperature=0.7)
+    res = invoke_llm(llm, [
         {"role": "system", "content": "너는 공손하고 간결하게 대화하는 어시스턴트다."},
         {"role": "user", "content": user_text},
-    ])
+    ], label="qa")
     return AIMessage(content=res.content)
 
 
@@ -131,8 +136,7 @@ def _tavily_results(query: str, k: int = 1) -> List[Dict[str, Any]]:
     """Tavily community tool만 사용 (결과 기본 1개)."""
     dprint("WEB.search (community only):", query, "k=", k)
     try:
-        from langchain_community.tools.tavily_search import TavilySearchResults
-        tool = TavilySearchResults(max_results=k)
+        tool = get_search_tool(max_results=k)
         results = tool.invoke({"query": query})
         dprint("tavily community ok; n_results=", len(results) if isinstance(results, list) else "n/a")
         return results if isinstance(results, list) else []
@@ -147,15 +151,15 @@ def qa_web_summarize(query: str, results: List[Dict[str, Any]], level: str = "be
         f"- {r.get('title','(제목없음)')} {r.get('url','')}"
         for r in top if isinstance(r, dict)
     ) or "(검색 결과가 없습니다)"
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
     sys = (
         "너는 뉴스/웹 검색 결과를 사용자 질의에 맞춰 핵심만 정리하는 어시스턴트다. "
         f"사용자 수준(level={level})에 맞춰 간결하게 요약하고, 가능한 경우 참고링크도 함께 제공해."
     )
-    res = llm.invoke([
+    res = invoke_llm(llm, [
         {"role": "system", "content": sys},
         {"role": "user", "content": f"사용자 질문: {query}\n\n검색 결과(상위 3개):\n{refs_text}"},
-    ])
+    ], label="qa")
     return AIMessage(content=res.content)
 
 
@@ -183,12 +187,12 @@ _QA_ROUTE_SYSTEM = (
 )
 
 def qa_llm_route(user_text: str, has_summaries: bool) -> QARouteDecision:
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0).with_structured_output(QARouteDecision)
+    llm = get_structured_model(QARouteDecision, "gpt-4o-mini", temperature=0)
     sys = _QA_ROUTE_SYSTEM + f"\n\n[컨텍스트] has_summaries={has_summaries}"
-    out = llm.invoke([
+    out = invoke_llm(llm, [
         {"role": "system", "content": sys},
         {"role": "user", "content": user_text or ""},
-    ])
+    ], label="qa_route")
     dprint("llm-route:", out.model_dump())
     return out
 
@@ -2,15 +2,22 @@
 quiz.py — 퀴즈 생성 및 채점 에이전트
 (v3: quiz.py의 생성 로직 + 그래프 핸들러 결합)
 """
-import os, uuid, json, re, random
+import os, uuid, json, re, random, time, threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.globals import set_llm_cache
 from langchain_core.messages import AIMessage
+from functools import lru_cache
+
+try:
+    from ..common.llm import get_chat_model, invoke_llm
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common.llm import get_chat_model, invoke_llm
 
 # --- 0. 설정 및 로드 ---
 set_llm_cache(None)  # 전역 LLM 캐시 비활성화
@@ -26,14 +33,30 @@ def dprint(*args, **kwargs):
         print("[DBG quiz]", *args, **kwargs)
 
 # --- 1. LLM 모델 초기화 ---
-llm = ChatOpenAI(
-    model="gpt-4o",
+# 퀴즈 1건 생성 요청의 타임아웃 (초). 마감을 넘겨 버려진 후보 호출도 이 시간 안에 끝난다.
+QUIZ_CALL_TIMEOUT_SEC = float(os.getenv("QUIZ_CALL_TIMEOUT_SEC", "20"))
+llm = get_chat_model(
+    "gpt-4o",
     temperature=0.9,
+    timeout=QUIZ_CALL_TIMEOUT_SEC,
     top_p=1.0,
     presence_penalty=0.6,
     frequency_penalty=0.3,
 )
 
+# 후보 퀴즈 병렬 생성 설정
+QUIZ_MAX_WORKERS = int(os.getenv("QUIZ_MAX_WORKERS", "4"))
+# 필요한 개수보다 추가로 띄워 두는 후보 수 (실패/중복/불량 대비).
+# 남는 호출은 취소되지 않고 끝까지 과금되므로 최대 1로 제한한다.
+QUIZ_HEDGE = min(1, max(0, int(os.getenv("QUIZ_HEDGE", "1"))))
+# 채팅 출제 경로의 전체 지연 상한 (초) / 데일리 배치 상한
+QUIZ_DEADLINE_SEC = float(os.getenv("QUIZ_DEADLINE_SEC", "20"))
+QUIZ_BATCH_DEADLINE_SEC = float(os.getenv("QUIZ_BATCH_DEADLINE_SEC", "90"))
+# 데일리 배치: 한 번의 호출로 받을 후보 수 (이 중 점수 상위 n개 사용)
+QUIZ_BATCH_CANDIDATES = int(os.getenv("QUIZ_BATCH_CANDIDATES", "4"))
+# 챗봇 퀴즈 풀이 비었을 때 백그라운드로 채워 넣을 문항 수 (0이면 보충 안 함)
+QUIZ_POOL_REFILL = int(os.getenv("QUIZ_POOL_REFILL", "4"))
+
 # --- 2. Pydantic 퀴즈 구조 정의 (기존 quiz.py 로직) ---
 # (원본 quiz.py의 Pydantic 모델)
 class OXQuiz(BaseModel):
@@ -52,6 +75,16 @@ class ShortAnswer(BaseModel):
     answer: List[str] = Field(description="정답 리스트 (단어 또는 짧은 구). '...요인 중 하나는?'처럼 답이 여러 개일 수 있는 경우, 가능한 단답형 정답을 리스트에 모두 포함하세요.")
     rationale: str = Field(description="정답에 대한 간단한 해설")
 
+# 한 번의 호출로 같은 유형 후보 여러 개를 받는 배치 모델 (문맥/지시문을 한 번만 보낸다)
+class OXQuizBatch(BaseModel):
+    quizzes: List[OXQuiz] = Field(description="서로 다른 O/X 퀴즈 목록")
+
+class MultipleChoice4Batch(BaseModel):
+    quizzes: List[MultipleChoice4] = Field(description="서로 다른 4지선다 퀴즈 목록")
+
+class ShortAnswerBatch(BaseModel):
+    quizzes: List[ShortAnswer] = Field(description="서로 다른 단답형 퀴즈 목록")
+
 # --- 3. 퀴즈 '자동 생성' 함수 (기존 quiz.py 로직) ---
 # (원본 quiz.py의 생성 프롬프트 및 함수)
 QUIZ_STYLE_VARIANTS = [
@@ -206,48 +239,43 @@ def post_shuffle(quiz):
         q.answer_index = q.options.index(correct)
     return q
 
+QUIZ_MODEL_CLASSES = {"OX": OXQuiz, "MC4": MultipleChoice4, "ShortAnswer": ShortAnswer}
+QUIZ_BATCH_CLASSES = {"OX": OXQuizBatch, "MC4": MultipleChoice4Batch, "ShortAnswer": ShortAnswerBatch}
+QUIZ_TYPE_LABELS = {"OX": "O/X 퀴즈", "MC4": "4지선다 객관식 퀴즈", "ShortAnswer": "단답형 퀴즈"}
+
+@lru_cache(maxsize=None)
+def _quiz_prompt_and_parser(quiz_type: str, is_term_quiz: bool, batch: bool = False):
+    """(유형, 용어퀴즈 여부, 배치 여부)별 프롬프트/파서는 한 번만 만든다 (format_instructions 포함)"""
+    model_cls = (QUIZ_BATCH_CLASSES if batch else QUIZ_MODEL_CLASSES)[quiz_type]
+    parser = PydanticOutputParser(pydantic_object=model_cls)
+    template = term_prompt_template_text if is_term_quiz else prompt_template_text
+    prompt = ChatPromptTemplate.from_template(
+        template=template + "\n[DIVERSITY_KEY]\n{diversity}\n",
+        partial_variables={"format_instructions": parser.get_format_instructions()}
+    )
+    return prompt, parser
+
 def generate_quiz(context: str, quiz_type: str, is_term_quiz: bool = False):
-    model_class, task_description = None, None
-    
-    if is_term_quiz:
-        selected_prompt_template = term_prompt_template_text
-        task_prefix = "경제 용어 "
-    else:
-        selected_prompt_template = prompt_template_text
-        task_prefix = ""
-    
-    if quiz_type == "OX":
-        model_class = OXQuiz
-        task_description = f"{task_prefix}O/X 퀴즈 1개"
-    elif quiz_type == "MC4":
-        model_class = MultipleChoice4
-        task_description = f"{task_prefix}4지선다 객관식 퀴즈 1개"
-    elif quiz_type == "ShortAnswer":
-        model_class = ShortAnswer
-        task_description = f"{task_prefix}단답형 퀴즈 1개" 
-    else:
+    if quiz_type not in QUIZ_TYPE_LABELS:
         dprint(f"오류: 지원하지 않는 퀴즈 유형입니다. ({quiz_type})")
         return None
+    task_prefix = "경제 용어 " if is_term_quiz else ""
+    task_description = f"{task_prefix}{QUIZ_TYPE_LABELS[quiz_type]} 1개"
 
     try:
-        parser = PydanticOutputParser(pydantic_object=model_class)
-        format_instructions = parser.get_format_instructions()
+        prompt, parser = _quiz_prompt_and_parser(quiz_type, is_term_quiz)
         entropy = uuid.uuid4().hex
         variant = random.choice(QUIZ_STYLE_VARIANTS)
 
-        prompt = ChatPromptTemplate.from_template(
-            template=selected_prompt_template + "\n[DIVERSITY_KEY]\n{diversity}\n",
-            partial_variables={"format_instructions": format_instructions}
-        )
         chain = prompt | llm | parser
         
-        result = chain.invoke({
+        result = invoke_llm(chain, {
             "context": context,
             "task": task_description,
             "diversity": entropy,
             "variant": variant,
             "safe_rules": SAFE_RULES,
-        })
+        }, label="quiz")
         
         if not is_term_quiz or (isinstance(result, ShortAnswer)):
              return post_shuffle(result)
@@ -258,38 +286,208 @@ def generate_quiz(context: str, quiz_type: str, is_term_quiz: bool = False):
         dprint(f"퀴즈 생성 중 오류 발생: {e}")
         return None
 
+def generate_quiz_batch(context: str, quiz_type: str, count: int, is_term_quiz: bool = False) -> List[Any]:
+    """같은 유형 퀴즈 count개를 한 번의 호출로 생성 (post_shuffle은 로컬에서 문항별로 적용)"""
+    if quiz_type not in QUIZ_TYPE_LABELS or count <= 0:
+        return []
+    task_prefix = "경제 용어 " if is_term_quiz else ""
+    task_description = (
+        f"서로 다른 {task_prefix}{QUIZ_TYPE_LABELS[quiz_type]} {count}개 (quizzes 목록에 담을 것). "
+        "각 문제는 내용의 서로 다른 사실·개념을 묻고, 질문 문장이 겹치지 않게 하세요."
+    )
+    try:
+        prompt, parser = _quiz_prompt_and_parser(quiz_type, is_term_quiz, batch=True)
+        result = invoke_llm(prompt | llm | parser, {
+            "context": context,
+            "task": task_description,
+            "diversity": uuid.uuid4().hex,
+            "variant": random.choice(QUIZ_STYLE_VARIANTS),
+            "safe_rules": SAFE_RULES,
+        }, label="quiz_batch")
+    except Exception as e:
+        dprint(f"배치 퀴즈 생성 중 오류 발생: {e}")
+        return []
+
+    quizzes = result.quizzes
+    if not is_term_quiz or quiz_type == "ShortAnswer":
+        quizzes = [post_shuffle(q) for q in quizzes]
+    return quizzes
+
 def generate_quiz_candidates(context: str, quiz_type: str, k: int = 3, is_term_quiz: bool = False):
     return [q for _ in range(k) if (q := generate_quiz(context, quiz_type, is_term_quiz=is_term_quiz))]
 
+def _quiz_score(q):
+    rationale_len = len(getattr(q, "rationale", "") or "")
+    uniq_opts = len(set(getattr(q, "options", []) or []))
+    return rationale_len + uniq_opts
+
+def _is_acceptable(q) -> bool:
+    """출제할 수 있는 퀴즈인지 (질문/해설 존재, 객관식 보기 4개 중복 없음 + 정답 인덱스 범위, 단답 정답 존재)"""
+    if not (q.question or "").strip() or not (q.rationale or "").strip():
+        return False
+    if isinstance(q, MultipleChoice4):
+        return len(q.options) == 4 and len(set(q.options)) == 4 and 0 <= q.answer_index < 4
+    if isinstance(q, ShortAnswer):
+        return any(a.strip() for a in q.answer)
+    return True
+
 def pick_one_quiz(context: str, quiz_type: str, k: int = 3, is_term_quiz: bool = False):
-    cands = generate_quiz_candidates(context, quiz_type, k, is_term_quiz=is_term_quiz)
-    def score(q):
-        rationale_len = len(getattr(q, "rationale", "") or "")
-        uniq_opts = len(set(getattr(q, "options", []) or []))
-        return rationale_len + uniq_opts
-    cands.sort(key=score, reverse=True)
-    return (random.choice(cands[:2]) if len(cands) >= 2 else (cands[0] if cands else None))
-
-def pick_many_quizzes(context: str, quiz_type: str, n: int = 2, k: int = 4, is_term_quiz: bool = False):
-    quizzes, seen = [], set()
-    max_trials = n * 5
-    trials = 0
-    while len(quizzes) < n and trials < max_trials:
-        trials += 1
-        q = pick_one_quiz(context, quiz_type, k=k, is_term_quiz=is_term_quiz)
-        if not q:
-            continue
-        if q.question in seen:
-            continue
-        seen.add(q.question)
-        quizzes.append(q)
-    return quizzes
+    """후보 k개를 모아 점수(_quiz_score)가 가장 높은 1개 (deadline을 넘기면 그때까지 모인 것 중 최고)"""
+    quizzes = pick_many_quizzes(context, quiz_type, n=1, k=k, is_term_quiz=is_term_quiz, collect=k)
+    return quizzes[0] if quizzes else None
+
+def pick_many_quizzes(context: str, quiz_type: str, n: int = 2, k: int = 4, is_term_quiz: bool = False,
+                      deadline: float = QUIZ_DEADLINE_SEC, collect: Optional[int] = None):
+    """
+    후보 퀴즈를 동시에 생성해 질문이 서로 다른 n개를 고른다.
+    - 받아들일 만한 후보를 collect개(기본 n개) 모을 때까지 생성하고, 점수 상위 n개를 반환
+    - 동시에 진행하는 생성은 (남은 개수 + QUIZ_HEDGE)개, 최대 QUIZ_MAX_WORKERS개
+    - 생성 시도는 최대 max(n * k, collect)회, 전체 시간은 deadline(초)까지. 넘으면 모인 것만 반환
+    - 마감 후 남은 호출은 취소되지 않고 QUIZ_CALL_TIMEOUT_SEC 안에 끝난다 (결과는 버림)
+    """
+    if n <= 0:
+        return []
+    target = max(n, collect or n)
+    max_calls = max(n * max(1, k), target)
+    workers = max(1, min(QUIZ_MAX_WORKERS, target + QUIZ_HEDGE, max_calls))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quiz")
+    accepted: Dict[str, Any] = {}
+    pending = set()
+    submitted = 0
+    started = time.time()
+    try:
+        while True:
+            need = target - len(accepted)
+            while need > 0 and submitted < max_calls and len(pending) < min(workers, need + QUIZ_HEDGE):
+                pending.add(executor.submit(generate_quiz, context, quiz_type, is_term_quiz))
+                submitted += 1
+            if need <= 0 or not pending:
+                break
+            remaining = deadline - (time.time() - started)
+            if remaining <= 0:
+                dprint(f"Quiz deadline ({deadline:.0f}s) -> {len(accepted)}/{target} ready")
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for fut in done:
+                q = fut.result()  # generate_quiz는 실패 시 None
+                if q is None:
+                    continue
+                if not _is_acceptable(q):
+                    dprint(f"Reject malformed quiz: {q.question[:20]}...")
+                elif q.question not in accepted:
+                    accepted[q.question] = q
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    dprint(f"Picked {min(len(accepted), n)}/{n} quizzes from {submitted} calls in {time.time() - started:.1f}s")
+    return sorted(accepted.values(), key=_quiz_score, reverse=True)[:n]
+
+def pick_quizzes_batched(context: str, quiz_type: str, n: int = 2, candidates: int = QUIZ_BATCH_CANDIDATES,
+                         is_term_quiz: bool = False, deadline: float = QUIZ_BATCH_DEADLINE_SEC):
+    """
+    후보 candidates개를 한 번의 호출로 받아 로컬에서 검증/중복 제거/점수순 정렬 후 n개를 고른다.
+    모자라면 모자란 만큼만 pick_many_quizzes(문항별 병렬 생성)로 채운다.
+    """
+    if n <= 0:
+        return []
+    accepted: Dict[str, Any] = {}
+    for q in generate_quiz_batch(context, quiz_type, max(n, candidates), is_term_quiz=is_term_quiz):
+        if _is_acceptable(q) and q.question not in accepted:
+            accepted[q.question] = q
+    picked = sorted(accepted.values(), key=_quiz_score, reverse=True)[:n]
+
+    if len(picked) < n:
+        dprint(f"Batch gave {len(picked)}/{n} usable quizzes -> top up individually")
+        seen = {q.question for q in picked}
+        extra = pick_many_quizzes(context, quiz_type, n=n - len(picked), k=2,
+                                  is_term_quiz=is_term_quiz, deadline=deadline)
+        picked += [q for q in extra if q.question not in seen]
+    return picked
+
+def _to_api_dict(qm, q_type_api: str) -> Dict[str, Any]:
+    """Pydantic 퀴즈 -> 데일리 파이프라인/DB 저장용 dict (explanation, type, 문자열 answer)"""
+    q_dict = qm.model_dump()
+
+    # Pydantic 모델의 'rationale'을 API가 요구하는 'explanation'으로 매핑
+    q_dict["explanation"] = q_dict.get("rationale", "")
+
+    # API가 요구하는 'type' 필드 추가
+    q_dict["type"] = q_type_api
+
+    # 'answer' 필드 통일 (daily_job.py가 쓰기 편하도록)
+    if q_type_api == "OX":
+        q_dict["answer"] = "O" if q_dict.get("answer") else "X"
+    elif q_type_api == "MC4":
+        idx = q_dict.get("answer_index", -1)
+        opts = q_dict.get("options", [])
+        if 0 <= idx < len(opts):
+            q_dict["answer"] = opts[idx] # 정답 텍스트
+        else:
+            q_dict["answer"] = "" # 오류
+    elif q_type_api == "ShortAnswer":
+        q_dict["answer"] = ", ".join(q_dict.get("answer", [])) # 리스트를 문자열로
+    return q_dict
+
+# ------------------------------------------------------------
+# 미리 만들어 둔 퀴즈 풀 (DB)
+# 에이전트는 Django를 모르므로 services.py가 조회/저장 함수를 등록한다.
+#   take(user_id, quiz_type, urls) -> active_quiz dict(+pool_id) | None (출제 기록은 take가 남김)
+#   exists(url) -> 보충한 퀴즈를 붙일 요약이 있는지
+#   store(user_id, quiz_type, url, quizzes) -> 저장 개수
+# 풀의 등급 키는 Django 쪽이 사용자 프로필에서 정한다 (에이전트가 받는 profile과 무관).
+# 등록되지 않았으면(cli_main 등) 항상 실시간 생성한다.
+# ------------------------------------------------------------
+_pool_take = None
+_pool_exists = None
+_pool_store = None
+_refill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quiz_refill")
+_refill_inflight = set()
+_refill_lock = threading.Lock()
+
+def register_quiz_pool(take, exists=None, store=None):
+    global _pool_take, _pool_exists, _pool_store
+    _pool_take, _pool_exists, _pool_store = take, exists, store
+
+def _take_from_pool(user_id, quiz_type: str, urls: List[str]) -> Optional[Dict[str, Any]]:
+    if _pool_take is None or not user_id:
+        return None
+    try:
+        return _pool_take(user_id, quiz_type, urls)
+    except Exception as e:
+        dprint(f"Quiz pool lookup failed: {e}")
+        return None
+
+def _refill_pool(user_id, quiz_type: str, url: str, context_text: str):
+    try:
+        # 퀴즈를 붙일 요약이 없으면(채팅에서 찾은 기사) 생성해도 저장되지 않으므로 호출하지 않는다
+        if not _pool_exists(url):
+            dprint(f"Quiz pool refill skipped: no summary for {url}")
+            return
+        qs_models = pick_quizzes_batched(context_text, quiz_type=quiz_type, n=QUIZ_POOL_REFILL)
+        saved = _pool_store(user_id, quiz_type, url, [_to_api_dict(qm, quiz_type) for qm in qs_models])
+        dprint(f"Quiz pool refilled: {saved} x {quiz_type} for {url}")
+    except Exception as e:
+        dprint(f"Quiz pool refill failed: {e}")
+    finally:
+        with _refill_lock:
+            _refill_inflight.discard((url, quiz_type))
+
+def _schedule_refill(user_id, quiz_type: str, url: str, context_text: str):
+    """같은 (기사, 유형) 보충은 한 번에 하나만 백그라운드로 돌린다"""
+    if _pool_store is None or _pool_exists is None or QUIZ_POOL_REFILL <= 0 or not user_id or not url or not context_text:
+        return
+    key = (url, quiz_type)
+    with _refill_lock:
+        if key in _refill_inflight:
+            return
+        _refill_inflight.add(key)
+    _refill_executor.submit(_refill_pool, user_id, quiz_type, url, context_text)
 
 # --- 4. [신규 추가] 그래프 호환을 위한 헬퍼 ---
 
 def analyze_user_intent(text: str) -> Dict:
     """사용자 의도를 '퀴즈 요청'과 '정답 제출'로 분리"""
-    llm_analyzer = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    llm_analyzer = get_chat_model("gpt-4o-mini", temperature=0)
     
     sys_msg = (
         "너는 사용자의 발화 의도를 분석하는 모델이다.\n"
@@ -309,7 +507,7 @@ def analyze_user_intent(text: str) -> Dict:
     )
 
     try:
-        res = llm_analyzer.invoke([("system", sys_msg), ("user", text)])
+        res = invoke_llm(llm_analyzer, [("system", sys_msg), ("user", text)], label="quiz_intent")
         raw = res.content.strip()
         if "```json" in raw: raw = raw.split("```json")[1].split("```")[0]
         elif "```" in raw: raw = raw.split("```")[1].split("```")[0]
@@ -446,9 +644,6 @@ def handle(text: str, profile: Optional[Dict[str, Any]] = None, state: Optional[
     # --- CASE B: 퀴즈 출제 ---
     dprint("Requesting new quiz.")
     summaries = ctx.get("summaries", [])
-    if not summaries:
-        dprint("No summaries found.")
-        return AIMessage(content="[quiz] 퀴즈를 만들 기사가 없어요. 뉴스 검색과 요약을 먼저 해주세요.")
 
     # quiz.py __main__의 레벨별 유형 매핑 적용
     level_to_type_map = {
@@ -464,35 +659,53 @@ def handle(text: str, profile: Optional[Dict[str, Any]] = None, state: Optional[
     
     # 사용자가 타입을 지정하지 않으면, 레벨에 따라 자동 설정
     target_quiz_type = req_type if req_type else level_to_type_map.get(level, "MC4")
-    
-    # 컨텍스트 선택 (가장 최근 요약본)
-    target_article = summaries[-1]
-    # quiz.py의 생성 함수는 '요약문' 텍스트를 받음
-    context_text = target_article.get("summary_5sentences", "")
-    if not context_text:
-        context_text = target_article.get("title", "") # 요약이 없으면 제목이라도
+
+    # 1) 미리 만들어 둔 풀에서 출제 (용어 퀴즈는 풀에 없음)
+    #    대화 중 요약이 있으면 그 기사, 없으면 사용자의 데일리 요약에서 찾는다
+    user_id = profile.get("user") if isinstance(profile, dict) else getattr(profile, "user_id", None)
+    target_article = summaries[-1] if summaries else {}
+    target_url = target_article.get("url", "")
+    active_quiz_data = None
+    if not req_is_term:
+        active_quiz_data = _take_from_pool(user_id, target_quiz_type, [target_url] if target_url else [])
+        if active_quiz_data:
+            dprint(f"Served quiz from pool: {active_quiz_data['pool_id']}")
+
+    # 2) 풀이 비었으면 실시간 생성 + 백그라운드 보충
+    if active_quiz_data is None:
+        if not summaries:
+            dprint("No summaries found.")
+            return AIMessage(content="[quiz] 퀴즈를 만들 기사가 없어요. 뉴스 검색과 요약을 먼저 해주세요.")
+
+        # quiz.py의 생성 함수는 '요약문' 텍스트를 받음
+        context_text = target_article.get("summary_5sentences", "")
+        if not context_text:
+            context_text = target_article.get("title", "") # 요약이 없으면 제목이라도
+            
+        dprint(f"Generating 1 quiz (requested {req_count}) of type '{target_quiz_type}' (is_term={req_is_term}) for level '{level}'...")
         
-    dprint(f"Generating {req_count} quiz(zes) of type '{target_quiz_type}' (is_term={req_is_term}) for level '{level}'...")
-    
-    quizzes = pick_many_quizzes(
-        context_text, 
-        target_quiz_type, 
-        n=req_count, 
-        k=4, 
-        is_term_quiz=req_is_term
-    )
-    
-    if not quizzes:
-        dprint("Failed to generate any quiz.")
-        return AIMessage(content="[quiz] 문제를 생성하지 못했어요. (요약 내용이 너무 짧거나 오류 발생)")
+        # 대화형이라 한 번에 1문제만 출제하므로 1개만 생성한다 (나머지를 만들고 버리지 않음)
+        quizzes = pick_many_quizzes(
+            context_text, 
+            target_quiz_type, 
+            n=1, 
+            k=4, 
+            is_term_quiz=req_is_term
+        )
+        if not req_is_term:
+            _schedule_refill(user_id, target_quiz_type, target_url, context_text)
+        
+        if not quizzes:
+            dprint("Failed to generate any quiz.")
+            return AIMessage(content="[quiz] 문제를 생성하지 못했어요. (요약 내용이 너무 짧거나 오류 발생)")
 
-    # (N개 요청했어도 일단 1개만 출제하고 나머지는 버림 - 대화형이므로)
-    first_q_model = quizzes[0]
-    
-    # Pydantic 모델을 state에 저장하기 위해 dict로 변환
-    # [중요] Pydantic 모델 클래스 이름을 저장해야 채점 시 타입을 알 수 있음
-    active_quiz_data = first_q_model.model_dump()
-    active_quiz_data["type_str"] = first_q_model.__class__.__name__ # 'OXQuiz', 'MultipleChoice4', 'ShortAnswer'
+        # (N개 요청했어도 일단 1개만 출제 - 대화형이므로)
+        first_q_model = quizzes[0]
+        
+        # Pydantic 모델을 state에 저장하기 위해 dict로 변환
+        # [중요] Pydantic 모델 클래스 이름을 저장해야 채점 시 타입을 알 수 있음
+        active_quiz_data = first_q_model.model_dump()
+        active_quiz_data["type_str"] = first_q_model.__class__.__name__ # 'OXQuiz', 'MultipleChoice4', 'ShortAnswer'
     
     ctx["active_quiz"] = active_quiz_data
     dprint(f"Saved active quiz to context. Type: {active_quiz_data['type_str']}")
@@ -557,41 +770,17 @@ def build_daily_quizzes(state: Dict[str, Any], profile: Dict) -> List[Dict]:
             context_text = item.get("title", "")
             
         # ✅ [핵심 수정] 
-        # 1. pick_many_quizzes 함수를 호출 (generate_quiz 대신)
+        # 1. 후보 여러 개를 한 번의 호출로 받아 로컬에서 고른다 (문맥/지시문 1회 전송)
         # 2. 'q_type=...' -> 'quiz_type=...' (올바른 인자명 사용)
-        qs_models = pick_many_quizzes(
+        qs_models = pick_quizzes_batched(
             context_text, 
             quiz_type=q_type_api, 
             n=q_count, 
-            k=4, 
-            is_term_quiz=False
+            is_term_quiz=False,
         )
         
         # Pydantic 모델을 DB 저장을 위해 dict로 변환
-        qs_data = []
-        for qm in qs_models:
-            q_dict = qm.model_dump()
-            
-            # Pydantic 모델의 'rationale'을 API가 요구하는 'explanation'으로 매핑
-            q_dict["explanation"] = q_dict.get("rationale", "")
-            
-            # API가 요구하는 'type' 필드 추가
-            q_dict["type"] = q_type_api 
-
-            # 'answer' 필드 통일 (daily_job.py가 쓰기 편하도록)
-            if q_type_api == "OX":
-                q_dict["answer"] = "O" if q_dict.get("answer") else "X"
-            elif q_type_api == "MC4":
-                idx = q_dict.get("answer_index", -1)
-                opts = q_dict.get("options", [])
-                if 0 <= idx < len(opts):
-                    q_dict["answer"] = opts[idx] # 정답 텍스트
-                else:
-                    q_dict["answer"] = "" # 오류
-            elif q_type_api == "ShortAnswer":
-                q_dict["answer"] = ", ".join(q_dict.get("answer", [])) # 리스트를 문자열로
-
-            qs_data.append(q_dict)
+        qs_data = [_to_api_dict(qm, q_type_api) for qm in qs_models]
 
         item["quizzes"] = qs_data 
         all_quizzes.append({"title": item.get("title"), "questions": qs_data})
@@ -6,9 +6,14 @@ import json, time, re
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 
+try:
+    from ..common.llm import get_chat_model, invoke_llm
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common.llm import get_chat_model, invoke_llm
+
 # ============================================================
 # 🔧 디버그 설정
 # ============================================================
@@ -22,7 +27,7 @@ def dprint(*args, **kwargs):
 # 1. [Helper] 사용자 의도 파악 (출제 vs 정답제출)
 # ============================================================
 def analyze_user_intent(text: str) -> Dict:
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
     
     sys_msg = (
         "너는 사용자의 발화 의도를 분석하는 모델이다.\n"
@@ -41,7 +46,7 @@ def analyze_user_intent(text: str) -> Dict:
     )
 
     try:
-        res = llm.invoke([("system", sys_msg), ("user", text)])
+        res = invoke_llm(llm, [("system", sys_msg), ("user", text)], label="quiz_intent")
         raw = res.content.strip()
         if "```json" in raw: raw = raw.split("```json")[1].split("```")[0]
         elif "```" in raw: raw = raw.split("```")[1].split("```")[0]
@@ -109,13 +114,13 @@ def generate_quiz(summary_item: Dict, level: str, q_type: str = None, count: int
     title = summary_item.get("title", "")
     dprint(f"Generatng {count} quizzes ({q_type or 'Auto'}) for: {title}")
 
-    model = ChatOpenAI(model="gpt-4o-mini", temperature=0.5, model_kwargs={"response_format": {"type": "json_object"}})
+    model = get_chat_model("gpt-4o-mini", temperature=0.5, json_mode=True)
     prompt = build_quiz_prompt(level, q_type)
     chain = prompt | model | JsonOutputParser()
     
     try:
         # invoke
-        res = chain.invoke({"summary": summary_text, "terms": terms_text})
+        res = invoke_llm(chain, {"summary": summary_text, "terms": terms_text}, label="quiz")
         
         quizzes = res.get("quizzes", [])
         return quizzes[:count]
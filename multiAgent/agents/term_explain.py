@@ -6,9 +6,15 @@ import json, time
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
 from langchain_core.messages import AIMessage
 
+try:
+    from ..common.llm import get_chat_model, invoke_llm
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common.llm import get_chat_model, invoke_llm
+
 # ============================================================
 # 🔧 디버그 설정
 # ============================================================
@@ -22,7 +28,7 @@ def dprint(*args, **kwargs):
 # 1. [Helper] 사용자 입력에서 '궁금한 용어' 추출하기
 # ============================================================
 def extract_user_target_term(user_text: str) -> Optional[str]:
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
     
     sys_msg = (
         "너는 사용자 질문에서 '설명 대상이 되는 핵심 단어(용어)'를 추출하는 분석기다.\n"
@@ -37,10 +43,10 @@ def extract_user_target_term(user_text: str) -> Optional[str]:
     )
     
     try:
-        res = llm.invoke([
+        res = invoke_llm(llm, [
             ("system", sys_msg),
             ("user", user_text)
-        ])
+        ], label="term_extract")
         text = res.content.strip()
         if "```json" in text: text = text.split("```json")[1].split("```")[0]
         elif "```" in text: text = text.split("```")[1].split("```")[0]
@@ -57,6 +63,7 @@ def extract_user_target_term(user_text: str) -> Optional[str]:
 # ============================================================
 # 2. [Mode A] 문맥 기반 설명 (Context-aware)
 # ============================================================
+@lru_cache(maxsize=None)
 def build_contextual_prompt(level: str) -> ChatPromptTemplate:
     style_guide = {
         "씨앗": "유치원생도 이해할 수 있는 아주 쉬운 비유를 들어 설명해줘.",
@@ -91,12 +98,12 @@ def explain_contextual(summary_text: str, terms: List[str], level: str) -> List[
     """기사 문맥을 반영하여 설명"""
     if not terms: return []
     
-    model = ChatOpenAI(model="gpt-4o-mini", temperature=0.3, model_kwargs={"response_format": {"type": "json_object"}})
+    model = get_chat_model("gpt-4o-mini", temperature=0.3, json_mode=True)
     prompt = build_contextual_prompt(level)
     chain = prompt | model | JsonOutputParser()
 
     try:
-        res = chain.invoke({"summary": summary_text, "terms": ", ".join(terms)})
+        res = invoke_llm(chain, {"summary": summary_text, "terms": ", ".join(terms)}, label="term_explain")
         return res.get("explanations", [])
     except Exception as e:
         dprint(f"Contextual explain error: {e}")
@@ -126,11 +133,11 @@ def explain_general(term: str, level: str) -> Dict:
         "}}"
     )
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, model_kwargs={"response_format": {"type": "json_object"}})
+    llm = get_chat_model("gpt-4o-mini", temperature=0, json_mode=True)
     
     try:
         msg = system_tmpl.format(term=term)
-        res = llm.invoke([("system", msg), ("human", f"질문: {term}")])
+        res = invoke_llm(llm, [("system", msg), ("human", f"질문: {term}")], label="term_explain")
         return json.loads(res.content)
     except Exception as e:
         dprint(f"General explain error: {e}")
@@ -0,0 +1,136 @@
+"""
+bench_fixtures.py — 벤치마크용 합성 HTTP 픽스처 생성기
+
+실제 네트워크 없이 bench_pipeline을 돌릴 수 있도록, 피드마다 RSS XML과
+기사 HTML(매체별 추출기가 읽는 본문 컨테이너 포함)을 http_fixtures 형식으로 써 둔다.
+pubDate를 넣지 않으므로 기사는 색인 시각 기준으로 항상 '최근' 풀에 들어간다.
+실제 기사로 측정하려면 bench_pipeline --record 로 기록한 픽스처를 쓴다.
+"""
+from pathlib import Path
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from . import http_fixtures
+
+# (제목, 본문 문장들) — 주제별로 문장을 따로 써서 근접 중복 제거에 걸리지 않게 한다
+ARTICLES: List[Tuple[str, List[str]]] = [
+    ("한국은행 기준금리 동결…물가 둔화에도 가계부채 부담", [
+        "한국은행 금융통화위원회가 기준금리를 연 3.25%로 동결했다.",
+        "소비자물가 상승률이 2%대 초반으로 내려왔지만 수도권 주택담보대출 증가세가 이어진 점이 발목을 잡았다.",
+        "총재는 기자간담회에서 금리 인하 시점은 가계부채 흐름과 환율을 함께 보고 판단하겠다고 말했다.",
+        "시장에서는 연내 한 차례 인하 가능성을 여전히 높게 보고 있다.",
+    ]),
+    ("원·달러 환율 1,400원 돌파…수입물가 상승 우려", [
+        "원·달러 환율이 장중 1,400원을 넘어서며 약 반년 만에 최고 수준을 기록했다.",
+        "미국 국채 금리 상승과 달러 강세가 겹치면서 외국인 투자자의 주식 순매도가 늘었다.",
+        "환율이 오르면 원유와 곡물 같은 수입 원자재 가격이 올라 국내 물가에 부담이 된다.",
+        "외환당국은 시장 변동성이 과도할 경우 안정 조치를 하겠다는 구두 개입에 나섰다.",
+    ]),
+    ("반도체 수출 석 달 연속 증가…AI 서버 메모리 수요 견인", [
+        "지난달 반도체 수출액이 전년 같은 달보다 30% 가까이 늘며 석 달 연속 증가했다.",
+        "인공지능 서버에 들어가는 고대역폭메모리(HBM) 수요가 가격 상승을 이끌었다.",
+        "전체 수출에서 반도체가 차지하는 비중도 20%를 넘어섰다.",
+        "다만 중국 경기 둔화와 미국의 수출 통제가 하반기 변수로 꼽힌다.",
+    ]),
+    ("서울 아파트 거래량 급증…전세가율 다시 상승", [
+        "서울 아파트 매매 거래량이 한 달 새 40% 넘게 늘었다.",
+        "대출 규제 시행을 앞두고 미리 집을 사려는 수요가 몰린 영향으로 풀이된다.",
+        "전셋값이 매맷값보다 빠르게 오르면서 전세가율도 다시 올라가고 있다.",
+        "정부는 공급 확대 대책과 함께 투기 수요 점검을 강화하겠다고 밝혔다.",
+    ]),
+    ("소비자물가 상승률 2.1%…농산물·외식 물가는 여전히 높아", [
+        "통계청이 발표한 지난달 소비자물가 상승률은 2.1%로 목표 수준에 가까워졌다.",
+        "석유류 가격 하락이 전체 물가를 끌어내렸지만 사과와 배추 등 농산물 가격은 두 자릿수 상승률을 보였다.",
+        "외식 물가도 인건비와 재료비 부담으로 3%대 오름세를 유지했다.",
+        "체감 물가와 지표 물가의 차이가 크다는 지적이 나온다.",
+    ]),
+    ("취업자 수 증가폭 둔화…청년 고용률 하락", [
+        "지난달 취업자 수는 전년 대비 17만 명 늘어 증가폭이 석 달째 줄었다.",
+        "고령층 취업자는 늘었지만 15~29세 청년층 고용률은 0.5%포인트 떨어졌다.",
+        "제조업과 건설업 일자리가 감소한 반면 보건·복지 서비스업은 증가했다.",
+        "전문가들은 경기 회복이 고용으로 이어지기까지 시간이 더 걸릴 것으로 본다.",
+    ]),
+    ("국제유가 배럴당 80달러 아래로…산유국 증산 영향", [
+        "국제유가가 산유국들의 증산 결정 이후 배럴당 80달러 아래로 내려왔다.",
+        "석유수출국기구와 주요 산유국 협의체는 감산 규모를 단계적으로 줄이기로 했다.",
+        "유가 하락은 항공과 해운 업종의 비용 부담을 덜어 줄 것으로 기대된다.",
+        "반면 정유사들은 정제마진 축소로 실적 둔화를 걱정하고 있다.",
+    ]),
+    ("코스피 2,700선 회복…외국인 순매수 전환", [
+        "코스피가 외국인 순매수에 힘입어 2,700선을 회복했다.",
+        "외국인은 반도체와 자동차 대형주를 중심으로 하루 만에 5천억 원어치를 사들였다.",
+        "시가총액 상위 종목들이 일제히 오르며 지수 상승을 이끌었다.",
+        "증권가에서는 기업 밸류업 정책이 투자 심리를 개선했다는 분석이 나온다.",
+    ]),
+    ("가계대출 한 달 새 5조 원 증가…스트레스 DSR 확대", [
+        "은행권 가계대출 잔액이 한 달 동안 5조 원 넘게 불어났다.",
+        "주택담보대출이 증가분의 대부분을 차지했고 신용대출도 소폭 늘었다.",
+        "금융당국은 금리 상승 가능성을 반영해 대출 한도를 계산하는 스트레스 총부채원리금상환비율(DSR) 적용 범위를 넓히기로 했다.",
+        "은행들은 대출 금리를 올리거나 만기를 줄이는 방식으로 속도 조절에 나섰다.",
+    ]),
+    ("무역수지 14개월 연속 흑자…자동차·선박 수출 호조", [
+        "무역수지가 14개월 연속 흑자를 이어갔다.",
+        "자동차 수출은 친환경차 판매 호조로 역대 같은 달 최대치를 기록했고 선박 수출도 크게 늘었다.",
+        "에너지 수입액은 유가 안정으로 10% 넘게 감소했다.",
+        "정부는 연간 수출 목표 달성이 가능할 것으로 내다봤다.",
+    ]),
+    ("전기차 배터리 소재 가격 급락…2차전지 업계 수익성 비상", [
+        "리튬과 니켈 등 배터리 핵심 광물 가격이 1년 새 절반 가까이 떨어졌다.",
+        "전기차 수요 증가세가 둔화하면서 배터리 재고가 쌓인 탓이다.",
+        "양극재 기업들은 원재료 가격이 판매가에 반영되는 구조 때문에 매출이 줄고 있다.",
+        "업계는 에너지저장장치(ESS) 시장으로 판로를 넓혀 돌파구를 찾고 있다.",
+    ]),
+    ("정부, 내년 예산 680조 원 편성…재정건전성 기조 유지", [
+        "정부가 내년도 예산안을 680조 원 규모로 편성해 국회에 제출했다.",
+        "총지출 증가율은 3%대로 억제해 재정건전성 기조를 이어가기로 했다.",
+        "저출생 대응과 연구개발(R&D) 예산은 늘리고 효과가 낮은 보조금 사업은 줄였다.",
+        "국가채무 비율은 국내총생산(GDP) 대비 40%대 후반으로 예상된다.",
+    ]),
+]
+
+# 피드 도메인 -> (기사 URL 형식, 본문 컨테이너 HTML 시작 태그) — extractors.py 기본 매체 등록과 맞춘다
+DOMAIN_LAYOUTS: Dict[str, Tuple[str, str]] = {
+    "hankyung.com": ("https://www.hankyung.com/article/bench{n:04d}", '<div id="articletxt">'),
+    "yna.co.kr": ("https://www.yna.co.kr/view/BENCH{n:04d}", '<div class="story-news article">'),
+    "mk.co.kr": ("https://www.mk.co.kr/news/economy/bench{n:04d}", '<div class="news_cnt_detail_wrap">'),
+}
+
+
+def _domain_of(url: str) -> str:
+    host = url.split("/")[2].split(":")[0].lower()
+    return next((d for d in DOMAIN_LAYOUTS if host == d or host.endswith("." + d)), host)
+
+
+def _write(url: str, body: str) -> None:
+    path = http_fixtures.fixture_path(url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body.encode("utf-8"))
+    with open(path.parent / "_index.tsv", "a", encoding="utf-8") as f:
+        f.write(f"{path.name}\t{url}\n")
+
+
+def generate(fixture_dir: str, feeds: List[str]) -> int:
+    """feeds마다 RSS와 기사 HTML을 fixture_dir에 쓰고 기사 수를 돌려준다. (ARTICLES를 피드에 돌아가며 배정)"""
+    prev_dir = http_fixtures.HTTP_FIXTURES_DIR
+    http_fixtures.HTTP_FIXTURES_DIR = str(fixture_dir)
+    try:
+        Path(fixture_dir).mkdir(parents=True, exist_ok=True)
+        (Path(fixture_dir) / "_index.tsv").unlink(missing_ok=True)
+        items_by_feed: Dict[str, List[str]] = {feed: [] for feed in feeds}
+        for n, (title, sentences) in enumerate(ARTICLES, 1):
+            feed = feeds[(n - 1) % len(feeds)]
+            url_fmt, open_tag = DOMAIN_LAYOUTS.get(_domain_of(feed), next(iter(DOMAIN_LAYOUTS.values())))
+            url = url_fmt.format(n=n)
+            paragraphs = "".join(f"<p>{escape(s)}</p>" for s in sentences)
+            _write(url, f'<html><head><meta charset="utf-8"><title>{escape(title)}</title></head>'
+                        f"<body>{open_tag}{paragraphs}</div></body></html>")
+            items_by_feed[feed].append(
+                f"<item><title>{escape(title)}</title><link>{escape(url)}</link>"
+                f"<description>{escape(sentences[0])}</description></item>"
+            )
+        for feed, items in items_by_feed.items():
+            _write(feed, '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+                         f"<title>bench {escape(_domain_of(feed))}</title>{''.join(items)}</channel></rss>")
+        return len(ARTICLES)
+    finally:
+        http_fixtures.HTTP_FIXTURES_DIR = prev_dir
@@ -0,0 +1,90 @@
+"""
+content_store.py — 스크랩한 기사 본문 저장소 (정규화 URL 기준)
+
+같은 기사를 데일리 작업/챗봇 요청마다 다시 내려받지 않도록
+본문을 zlib 압축해 저장하고, 네트워크 요청 전에 먼저 조회한다.
+추출 로직이 바뀌면 extractor_version이 달라져 자동으로 다시 스크랩된다.
+"""
+import hashlib
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .localdb import ensure_schema
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS article_content (
+    url_key           TEXT PRIMARY KEY,
+    url               TEXT NOT NULL,
+    content           BLOB NOT NULL,
+    content_hash      TEXT NOT NULL,
+    extractor_version TEXT NOT NULL,
+    fetched_at        REAL NOT NULL
+);
+"""
+
+# 같은 기사인데 URL만 달라지게 만드는 추적용 파라미터
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref", "from", "cmpid"}
+_TRACKING_PREFIXES = ("utm_",)
+
+
+@dataclass
+class StoredContent:
+    url: str
+    content: str
+    content_hash: str
+    extractor_version: str
+    fetched_at: float
+
+
+def canonicalize_url(url: str) -> str:
+    """스킴/호스트 소문자화, 기본 포트·프래그먼트·추적 파라미터 제거, 쿼리 정렬"""
+    parts = urlsplit((url or "").strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+
+
+def _conn():
+    return ensure_schema("article_content", _DDL)
+
+
+def get(url: str, extractor_version: Optional[str] = None) -> Optional[StoredContent]:
+    """저장된 본문 조회. extractor_version이 다르면 없는 것으로 본다."""
+    row = _conn().execute(
+        "SELECT url, content, content_hash, extractor_version, fetched_at "
+        "FROM article_content WHERE url_key = ?",
+        (canonicalize_url(url),),
+    ).fetchone()
+    if not row:
+        return None
+    stored = StoredContent(row[0], zlib.decompress(row[1]).decode("utf-8"), row[2], row[3], row[4])
+    if extractor_version is not None and stored.extractor_version != extractor_version:
+        return None
+    return stored
+
+
+def put(url: str, content: str, extractor_version: str) -> StoredContent:
+    stored = StoredContent(url, content, content_hash(content), extractor_version, time.time())
+    _conn().execute(
+        "INSERT OR REPLACE INTO article_content "
+        "(url_key, url, content, content_hash, extractor_version, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+        (canonicalize_url(url), url, zlib.compress(content.encode("utf-8")),
+         stored.content_hash, extractor_version, stored.fetched_at),
+    )
+    return stored
@@ -0,0 +1,101 @@
+"""
+embeddings.py — 기사/관심사 임베딩 + 로컬 벡터 캐시
+
+기사는 수집 시점에 한 번만 임베딩하고 (본문 해시, 모델) 기준으로 sqlite에 저장한다.
+큐레이션 단계는 캐시된 벡터와 사용자 관심사 벡터의 코사인 유사도만 계산하므로
+풀 크기가 커져도 LLM 프롬프트가 커지지 않는다.
+"""
+import os
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .content_store import content_hash
+from .llm import get_embeddings
+from .llm_retry import call_with_retry
+from .localdb import ensure_schema
+from .token_budget import count_tokens
+
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+# 기사 임베딩에 넣을 본문 앞부분 길이 (리드 문단이면 주제 판별에 충분)
+EMBED_MAX_CHARS = int(os.getenv("EMBED_MAX_CHARS", "2000"))
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    text_hash  TEXT NOT NULL,
+    model      TEXT NOT NULL,
+    dim        INTEGER NOT NULL,
+    vector     BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (text_hash, model)
+);
+"""
+
+
+def _conn():
+    return ensure_schema("embeddings", _DDL)
+
+
+def _normalize(mat: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    return np.divide(mat, norms, out=np.zeros_like(mat), where=norms > 0)
+
+
+def doc_text(title: str, summary: str = "", content: str = "") -> str:
+    """기사 임베딩 입력: 제목 + RSS 요약 + 본문 앞부분"""
+    return "\n".join(t for t in (title, summary, (content or "")[:EMBED_MAX_CHARS]) if t)
+
+
+def _load_cached(hashes: List[str], model: str) -> Dict[str, np.ndarray]:
+    found: Dict[str, np.ndarray] = {}
+    conn = _conn()
+    uniq = list(dict.fromkeys(hashes))
+    for i in range(0, len(uniq), 500):
+        chunk = uniq[i:i + 500]
+        marks = ",".join("?" * len(chunk))
+        for h, dim, blob in conn.execute(
+            f"SELECT text_hash, dim, vector FROM embedding_cache WHERE model = ? AND text_hash IN ({marks})",
+            [model] + chunk,
+        ):
+            found[h] = np.frombuffer(blob, dtype=np.float32, count=dim)
+    return found
+
+
+def embed_texts(texts: Sequence[str], model: str = EMBEDDING_MODEL) -> np.ndarray:
+    """
+    (n, d) 단위 벡터 행렬. 캐시에 없는 텍스트만 EMBED_BATCH_SIZE 단위로 API 호출 후 저장.
+    빈 입력이면 (0, 0) 배열.
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    hashes = [content_hash(t or "") for t in texts]
+    cached = _load_cached(hashes, model)
+
+    missing = list(dict.fromkeys(h for h in hashes if h not in cached))
+    if missing:
+        text_of = {h: t for h, t in zip(hashes, texts)}
+        conn = _conn()
+        for i in range(0, len(missing), EMBED_BATCH_SIZE):
+            batch = missing[i:i + EMBED_BATCH_SIZE]
+            inputs = [text_of[h] or " " for h in batch]
+            raw = call_with_retry(lambda: get_embeddings(model).embed_documents(inputs), label="embedding",
+                                  est_tokens=sum(count_tokens(t) for t in inputs))
+            vecs = _normalize(np.asarray(raw, dtype=np.float32))
+            now = time.time()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (text_hash, model, dim, vector, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(h, model, v.shape[0], v.tobytes(), now) for h, v in zip(batch, vecs)],
+            )
+            cached.update(zip(batch, vecs))
+
+    return np.vstack([cached[h] for h in hashes]).astype(np.float32, copy=False)
+
+
+def cosine_matrix(queries: np.ndarray, docs: np.ndarray) -> np.ndarray:
+    """(U, d) x (N, d) 단위 벡터 -> (U, N) 코사인 유사도"""
+    if queries.size == 0 or docs.size == 0:
+        return np.zeros((len(queries), len(docs)), dtype=np.float32)
+    return queries @ docs.T
@@ -0,0 +1,101 @@
+"""
+extractors.py — 매체별 기사 본문 추출기 레지스트리
+
+- 도메인마다 Extractor(본문 컨테이너 태그/속성, 제거할 요소, 후처리)를 등록한다.
+- 페이지 전체가 아니라 SoupStrainer로 본문 컨테이너만 트리로 만든다. (lxml이 있으면 사용)
+- 모든 추출기는 http_session의 공용 세션 하나로 요청한다.
+새 매체는 register_extractor(...) 한 줄로 추가한다.
+"""
+import os
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Union
+
+import bs4
+
+from . import http_session
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+SCRAPE_TIMEOUT = float(os.getenv("SCRAPE_TIMEOUT", "15"))
+DEFAULT_DROP = "script, style, figure, aside"
+
+
+@dataclass(frozen=True)
+class Extractor:
+    domain: str                      # 'hankyung.com' 처럼 접미사로 매칭
+    tag: str                         # 본문 컨테이너 태그
+    attrs: Dict                      # 본문 컨테이너 속성 (SoupStrainer 인자)
+    drop: str = DEFAULT_DROP         # 컨테이너 안에서 제거할 CSS 선택자
+    one_line: bool = False           # True면 줄바꿈을 공백 하나로 합침
+    postprocess: Optional[Callable[[str], str]] = None
+
+    def extract(self, html: Union[str, bytes]) -> str:
+        strainer = bs4.SoupStrainer(self.tag, attrs=self.attrs)
+        soup = bs4.BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+        if self.drop:
+            for bad in soup.select(self.drop):
+                bad.decompose()
+        for br in soup.find_all("br"):
+            br.replace_with("\n")
+
+        text = soup.get_text("\n", strip=True)
+        if self.one_line:
+            text = " ".join(s.strip() for s in text.split("\n") if s.strip())
+        else:
+            text = re.sub(r"\n{3,}", "\n\n", text)
+        if self.postprocess:
+            text = self.postprocess(text)
+        return text.strip()
+
+
+_REGISTRY: Dict[str, Extractor] = {}
+
+
+def register_extractor(domain: str, tag: str, attrs: Dict, **kwargs) -> Extractor:
+    ex = Extractor(domain=domain, tag=tag, attrs=attrs, **kwargs)
+    _REGISTRY[domain] = ex
+    return ex
+
+
+def find_extractor(url: str) -> Optional[Extractor]:
+    host = url.split("/")[2] if "://" in url else url
+    host = host.split(":")[0].lower()
+    for domain, ex in _REGISTRY.items():
+        if host == domain or host.endswith("." + domain):
+            return ex
+    return None
+
+
+def fetch_html(url: str, timeout: float = SCRAPE_TIMEOUT) -> bytes:
+    # bytes 그대로 넘겨야 bs4가 meta charset(EUC-KR 등)을 보고 디코딩한다
+    resp = http_session.get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+def scrape(url: str, timeout: float = SCRAPE_TIMEOUT) -> str:
+    """등록된 추출기로 본문을 가져온다. 미등록 매체는 빈 문자열"""
+    ex = find_extractor(url)
+    if ex is None:
+        return ""
+    return ex.extract(fetch_html(url, timeout=timeout))
+
+
+# ------------------------------------------------------------------------------
+# 기본 매체 등록
+# ------------------------------------------------------------------------------
+def _strip_brackets(text: str) -> str:
+    # 연합뉴스: [서울=연합뉴스], [사진] 등 대괄호 표기 제거
+    return re.sub(r"\[[^\]]*\]", "", text)
+
+
+register_extractor("hankyung.com", "div", {"id": "articletxt"}, one_line=True)
+register_extractor("yna.co.kr", "div", {"class": "story-news article"},
+                   one_line=True, postprocess=_strip_brackets)
+register_extractor("mk.co.kr", "div", {"class": "news_cnt_detail_wrap"},
+                   drop=".ad_wrap, .ad_wrap_ad_wide, " + DEFAULT_DROP)
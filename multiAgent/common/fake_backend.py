@@ -0,0 +1,350 @@
+"""
+fake_backend.py — 오프라인 결정적(deterministic) LLM / 임베딩 / 웹 검색 백엔드
+
+LLM_BACKEND=fake 일 때 common.llm이 OpenAI/Tavily 대신 이 모듈의 객체를 돌려준다.
+- 같은 입력이면 항상 같은 출력 (난수 없음) -> 벤치마크/회귀 비교 가능
+- 호출 단계(invoke_llm의 label)별로 에이전트가 기대하는 JSON/구조화 출력을 만든다.
+  PydanticOutputParser 형식 지시문이 프롬프트에 있으면 그 JSON 스키마로 응답을 합성한다.
+- 네트워크 지연은 FAKE_*_LATENCY_MS 만큼 sleep으로 흉내 낸다.
+"""
+import json
+import os
+import re
+import time
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+from .llm_retry import current_label
+
+FAKE_LLM_LATENCY_MS = float(os.getenv("FAKE_LLM_LATENCY_MS", "200"))
+FAKE_EMBED_LATENCY_MS = float(os.getenv("FAKE_EMBED_LATENCY_MS", "30"))
+FAKE_SEARCH_LATENCY_MS = float(os.getenv("FAKE_SEARCH_LATENCY_MS", "300"))
+FAKE_EMBED_DIM = int(os.getenv("FAKE_EMBED_DIM", "256"))
+
+_WORD_RE = re.compile(r"[가-힣A-Za-z0-9]+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+|(?<=다\.)|\n+")
+_SCHEMA_RE = re.compile(r"```\s*(\{.*?\})\s*```", re.S)
+_PARTICLE_RE = re.compile(r"(이란|란|이야|야|이|가|은|는|을|를|의|에|뜻|가요)$")
+_ANSWER_RE = re.compile(r"^\s*(?:정답은\s*)?([OoXx]|\d)\s*(?:번|야|이야|입니다)?\s*$")
+_GREETING_RE = re.compile(r"^\s*(안녕|하이|헬로|hello|반가워|고마워|감사)", re.I)
+_STOPWORDS = {"뉴스", "기사", "요약", "요약해줘", "찾아줘", "알려줘", "보여줘", "설명해줘", "퀴즈", "내줘",
+              "오늘", "최근", "관련", "방금", "어려운", "용어", "뭐야", "무엇", "좀", "해줘"}
+_LEVELS = ("씨앗", "새싹", "나무", "숲")
+
+
+def _sleep(ms: float) -> None:
+    if ms > 0:
+        time.sleep(ms / 1000.0)
+
+
+def _stable_hash(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+# ---------------------------
+# 입력 텍스트 다루기
+# ---------------------------
+def _split_messages(messages: Any) -> Tuple[str, str]:
+    """(system 텍스트, 마지막 사용자 텍스트). BaseMessage / (role, text) / {"role", "content"} 모두 허용"""
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+    if isinstance(messages, str):
+        return "", messages
+    system, user = [], ""
+    for m in messages or []:
+        if isinstance(m, BaseMessage):
+            role, content = ("system" if isinstance(m, SystemMessage) else
+                             "user" if isinstance(m, HumanMessage) else "ai"), m.content
+        elif isinstance(m, dict):
+            role, content = m.get("role", "user"), m.get("content", "")
+        else:
+            role, content = m[0], m[1]
+        if role == "system":
+            system.append(str(content))
+        elif role in ("user", "human"):
+            user = str(content)
+    return "\n".join(system), user
+
+
+def _sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENT_RE.split(text or "") if s and len(s.strip()) > 5]
+
+
+def _keywords(text: str, n: int = 3) -> List[str]:
+    """자주 나오는 두 글자 이상 단어 (동률이면 먼저 나온 순서)"""
+    words = [_PARTICLE_RE.sub("", w) for w in _WORD_RE.findall(text or "")]
+    counts = Counter(w for w in words if len(w) >= 2 and w not in _STOPWORDS)
+    return [w for w, _ in counts.most_common(n)]
+
+
+def _first_keyword(text: str) -> Optional[str]:
+    for w in _WORD_RE.findall(text or ""):
+        w = _PARTICLE_RE.sub("", w)
+        if len(w) >= 2 and w not in _STOPWORDS:
+            return w
+    return None
+
+
+def _after(marker: str, text: str) -> str:
+    i = text.find(marker)
+    return text[i + len(marker):] if i >= 0 else text
+
+
+# ---------------------------
+# 단계별 응답
+# ---------------------------
+def _summary_payload(body: str) -> Dict[str, Any]:
+    sents = _sentences(body) or [body[:100] or "본문 요약"]
+    five = (sents * 5)[:5]
+    return {
+        "summary_5sentences": " ".join(s[:120] for s in five),
+        "key_points": [s[:60] for s in sents[:3]],
+        "metrics": [],
+        "term_candidates": _keywords(body, 3) or ["경제"],
+    }
+
+
+def _respond_summary(system: str, user: str) -> Dict[str, Any]:
+    body = _after("본문:", user).split("\n\n제약")[0]
+    levels = [lv for lv in _LEVELS if f'"{lv}"' in system]
+    if len(levels) >= 2:
+        return {lv: _summary_payload(body) for lv in levels}
+    return _summary_payload(body)
+
+
+def _respond_summary_map(system: str, user: str) -> Dict[str, Any]:
+    sents = _sentences(user) or [user[:100]]
+    return {"points": [s[:120] for s in sents[:4]], "metrics": [], "term_candidates": _keywords(user, 2)}
+
+
+def _respond_quiz(system: str, user: str) -> Dict[str, Any]:
+    m = re.search(r"형식: (\w+)", system)
+    q_type = m.group(1) if m else "choice"
+    kw = _first_keyword(_after("뉴스 요약:", user)) or "경제"
+    quiz = {"type": q_type, "question": f"{kw}에 대한 설명으로 옳은 것은?", "explanation": f"{kw} 관련 해설"}
+    if q_type == "OX":
+        quiz.update(options=["O", "X"], answer="O")
+    elif q_type == "short":
+        quiz.update(options=[], answer=kw)
+    else:
+        quiz.update(options=[f"{kw} 보기{i}" for i in range(1, 5)], answer=f"{kw} 보기1")
+    return {"quizzes": [quiz]}
+
+
+def _respond_quiz_intent(system: str, user: str) -> Dict[str, Any]:
+    m = _ANSWER_RE.match(user)
+    if m:
+        return {"action": "ANSWER", "user_answer": m.group(1).upper()}
+    if "모르" in user or "포기" in user:
+        return {"action": "GIVEUP"}
+    # quiz.py는 OX/MC4/ShortAnswer, quiz2.py는 OX/choice/short 이름을 쓴다
+    names = ("MC4", "ShortAnswer") if "MC4" in system else ("choice", "short")
+    q_type = "OX" if "OX" in user.upper() else names[0] if "객관식" in user else names[1] if "단답" in user else None
+    count = re.search(r"(\d)\s*개", user)
+    return {"action": "REQUEST", "type": q_type, "count": int(count.group(1)) if count else 1,
+            "is_term": "용어" in user}
+
+
+def _respond_term_extract(system: str, user: str) -> Dict[str, Any]:
+    return {"term": _first_keyword(user)}
+
+
+def _respond_term_explain(system: str, user: str) -> Dict[str, Any]:
+    if "explanations" in system:
+        terms = [t.strip() for t in _after("설명할 용어들:", user).split(",") if t.strip()]
+        return {"explanations": [{"term": t, "definition": f"{t}은(는) 기사 맥락에서 쓰인 경제 용어입니다."}
+                                 for t in terms]}
+    term = _after("질문:", user).strip() or "경제"
+    return {"term": term, "definition": f"{term}은(는) 경제 활동과 관련된 개념입니다."}
+
+
+def _respond_news_query(system: str, user: str) -> Dict[str, Any]:
+    k = re.search(r"(\d)\s*개", user)
+    return {"keyword": _first_keyword(user), "k": min(5, int(k.group(1))) if k else 1, "reason": "fake"}
+
+
+def _respond_curation(system: str, user: str) -> Dict[str, Any]:
+    k = re.search(r"기사 (\d+)개", system)
+    n = len(re.findall(r"^\d+\. ", _after("[후보 뉴스 제목]", user), re.M))
+    return {"final_indices": list(range(1, min(int(k.group(1)) if k else 3, n) + 1))}
+
+
+_JSON_RESPONDERS = {
+    "summary": _respond_summary,
+    "summary_multi": _respond_summary,
+    "summary_map": _respond_summary_map,
+    "quiz": _respond_quiz,
+    "quiz_intent": _respond_quiz_intent,
+    "term_extract": _respond_term_extract,
+    "term_explain": _respond_term_explain,
+    "news_query": _respond_news_query,
+    "curation": _respond_curation,
+}
+
+
+# ---------------------------
+# JSON 스키마 -> 예시 인스턴스 (PydanticOutputParser / with_structured_output 용)
+# ---------------------------
+def _from_schema(schema: Dict, defs: Dict, name: str, seed: str) -> Any:
+    if "$ref" in schema:
+        return _from_schema(defs[schema["$ref"].split("/")[-1]], defs, name, seed)
+    if "anyOf" in schema:
+        options = [s for s in schema["anyOf"] if s.get("type") != "null"] or schema["anyOf"]
+        return _from_schema(options[0], defs, name, seed)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        return {k: _from_schema(v, defs, k, seed) for k, v in schema.get("properties", {}).items()}
+    if kind == "array":
+        item = schema.get("items", {})
+        is_obj = "$ref" in item or item.get("type") == "object"
+        n = 4 if name == "options" else max(schema.get("minItems", 0), 3 if is_obj else 2)
+        if item.get("type") == "string":
+            return [f"{seed} {name}{i + 1}" for i in range(n)]
+        # 객체 목록(배치 퀴즈 등)은 항목마다 내용이 달라야 중복 제거 후에도 남는다
+        return [_from_schema(item, defs, name, f"{seed} {i + 1}" if is_obj else seed) for i in range(n)]
+    if kind == "integer":
+        return 0
+    if kind == "number":
+        return 0.0
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    return f"{seed} {name}"
+
+
+def _schema_instance(schema: Dict, seed: str) -> Dict:
+    return _from_schema(schema, schema.get("$defs", {}), "root", seed)
+
+
+def _respond_route(system: str, user: str) -> Dict[str, Any]:
+    if "is_quiz_active): True" in system and _ANSWER_RE.match(user):
+        return {"intents": ["quiz"]}
+    intents = []
+    if ("뉴스" in user or "기사" in user) and ("찾" in user or "검색" in user or "보여" in user):
+        intents.append("news_find")
+    if "요약" in user:
+        intents.append("news_summary")
+    if "뜻" in user or "용어" in user or "뭐야" in user:
+        intents.append("term_explain")
+    if "퀴즈" in user:
+        intents.append("quiz")
+    return {"intents": intents or ["qa"]}
+
+
+def _respond_qa_route(system: str, user: str) -> Dict[str, Any]:
+    if _GREETING_RE.match(user):
+        return {"mode": "smalltalk", "forced_index": None, "reason": "fake"}
+    if "has_summaries=True" in system and ("요약" in user or "번째" in user or "오늘" in user):
+        return {"mode": "internal", "forced_index": None, "reason": "fake"}
+    return {"mode": "web", "forced_index": None, "reason": "fake"}
+
+
+def _structured_payload(schema: type, system: str, user: str) -> Dict[str, Any]:
+    fields = getattr(schema, "model_fields", {})
+    if "intents" in fields:
+        return _respond_route(system, user)
+    if "mode" in fields and "forced_index" in fields:
+        return _respond_qa_route(system, user)
+    return _schema_instance(schema.model_json_schema(), _first_keyword(user) or "경제")
+
+
+def respond(label: str, messages: Any) -> str:
+    """단계 라벨 + 프롬프트 -> 응답 문자열"""
+    system, user = _split_messages(messages)
+    schema = _SCHEMA_RE.search(system + "\n" + user)
+    if schema:
+        try:
+            payload = _schema_instance(json.loads(schema.group(1)), _first_keyword(_after("[내용]", user)) or "경제")
+            return json.dumps(payload, ensure_ascii=False)
+        except ValueError:
+            pass
+    responder = _JSON_RESPONDERS.get(label)
+    if responder is not None:
+        return json.dumps(responder(system, user), ensure_ascii=False)
+    if "JSON" in system:
+        return "{}"
+    return f"[오프라인 응답] '{user[:40]}'에 대한 답변입니다."
+
+
+# ---------------------------
+# 백엔드 객체
+# ---------------------------
+class FakeChatModel(BaseChatModel):
+    """ChatOpenAI 대체. prompt | model | parser 체인과 with_structured_output을 그대로 지원한다."""
+
+    model_name: str = "fake"
+    latency_ms: float = FAKE_LLM_LATENCY_MS
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        _sleep(self.latency_ms)
+        text = respond(current_label(), messages)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def with_structured_output(self, schema: Any, **kwargs: Any):
+        def _run(inputs: Any) -> Any:
+            _sleep(self.latency_ms)
+            system, user = _split_messages(inputs)
+            return schema.model_validate(_structured_payload(schema, system, user))
+        return RunnableLambda(_run)
+
+
+class FakeEmbeddings(Embeddings):
+    """단어/글자 2-gram 해싱 임베딩 (같은 단어를 공유하면 코사인 유사도가 올라간다)"""
+
+    def __init__(self, dim: int = FAKE_EMBED_DIM, latency_ms: float = FAKE_EMBED_LATENCY_MS):
+        self.dim = dim
+        self.latency_ms = latency_ms
+
+    def _vector(self, text: str) -> List[float]:
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for w in _WORD_RE.findall((text or "").lower()):
+            feats = [w] + [w[i:i + 2] for i in range(len(w) - 1)]
+            for f in feats:
+                h = _stable_hash(f)
+                vec[h % self.dim] += 1.0 if (h >> 16) & 1 else -1.0
+        norm = float(np.linalg.norm(vec))
+        return (vec / norm if norm else vec).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        _sleep(self.latency_ms)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class FakeSearchTool:
+    """TavilySearchResults 대체: invoke({"query": ...}) -> [{"title", "url", "content"}]"""
+
+    def __init__(self, max_results: int = 1, latency_ms: float = FAKE_SEARCH_LATENCY_MS):
+        self.max_results = max_results
+        self.latency_ms = latency_ms
+
+    def invoke(self, inputs: Dict[str, Any]) -> List[Dict[str, str]]:
+        _sleep(self.latency_ms)
+        query = str(inputs.get("query", "") if isinstance(inputs, dict) else inputs)
+        key = _stable_hash(query)
+        return [
+            {"title": f"{query} 관련 검색 결과 {i + 1}",
+             "url": f"https://search.invalid/{key:08x}/{i + 1}",
+             "content": f"{query}에 대한 오프라인 검색 결과 본문 {i + 1}입니다."}
+            for i in range(self.max_results)
+        ]
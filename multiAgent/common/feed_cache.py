@@ -0,0 +1,95 @@
+"""
+feed_cache.py — RSS 조건부 GET 캐시 (ETag / Last-Modified)
+
+피드 URL별로 마지막 응답 본문과 검증자(ETag, Last-Modified)를 저장한다.
+- TTL 이내면 네트워크 없이 캐시 본문을 반환
+- TTL이 지났으면 조건부 요청을 보내고 304면 캐시 본문을 재사용
+- 네트워크 오류 시 오래된 캐시라도 있으면 그것을 반환
+"""
+import os
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from . import http_session
+from .localdb import ensure_schema
+
+FEED_CACHE_TTL_SEC = int(os.getenv("FEED_CACHE_TTL_SEC", "300"))
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS feed_cache (
+    feed_url      TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    body          BLOB NOT NULL,
+    fetched_at    REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedFeed:
+    feed_url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    fetched_at: float
+
+    def is_fresh(self, ttl: int = FEED_CACHE_TTL_SEC) -> bool:
+        return ttl > 0 and (time.time() - self.fetched_at) < ttl
+
+
+def _conn():
+    return ensure_schema("feed_cache", _DDL)
+
+
+def get(feed_url: str) -> Optional[CachedFeed]:
+    row = _conn().execute(
+        "SELECT etag, last_modified, body, fetched_at FROM feed_cache WHERE feed_url = ?",
+        (feed_url,),
+    ).fetchone()
+    if not row:
+        return None
+    etag, last_modified, body, fetched_at = row
+    return CachedFeed(feed_url, etag, last_modified, zlib.decompress(body), fetched_at)
+
+
+def put(feed_url: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+    _conn().execute(
+        "INSERT OR REPLACE INTO feed_cache (feed_url, etag, last_modified, body, fetched_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (feed_url, etag, last_modified, zlib.compress(body), time.time()),
+    )
+
+
+def touch(feed_url: str) -> None:
+    _conn().execute("UPDATE feed_cache SET fetched_at = ? WHERE feed_url = ?", (time.time(), feed_url))
+
+
+def fetch_feed_body(feed_url: str, headers: Dict[str, str], timeout: float,
+                    ttl: int = FEED_CACHE_TTL_SEC) -> bytes:
+    """캐시를 거쳐 피드 XML 본문(bytes)을 돌려준다."""
+    cached = get(feed_url)
+    if cached and cached.is_fresh(ttl):
+        return cached.body
+
+    req_headers = dict(headers)
+    if cached and cached.etag:
+        req_headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        req_headers["If-Modified-Since"] = cached.last_modified
+
+    try:
+        resp = http_session.get(feed_url, headers=req_headers, timeout=timeout)
+        if resp.status_code == 304 and cached:
+            touch(feed_url)
+            return cached.body
+        resp.raise_for_status()
+    except Exception:
+        if cached:
+            return cached.body
+        raise
+
+    put(feed_url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), resp.content)
+    return resp.content
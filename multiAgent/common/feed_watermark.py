@@ -0,0 +1,80 @@
+"""
+feed_watermark.py — 피드별 수집 워터마크 (증분 수집)
+
+피드마다 '지금까지 처리한 가장 최신 발행 시각'과 최근 처리한 링크(GUID 대용) 집합을 저장해
+다음 수집 때는 새로 올라온 항목만 스크랩/색인하도록 한다.
+"""
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Set
+
+from .localdb import ensure_schema
+
+# 최근 링크 보관 개수 (피드 1회 응답 크기보다 넉넉하게)
+MAX_SEEN_LINKS = 500
+# 발행 시각이 워터마크보다 이만큼 이상 과거면 링크 기록이 없어도 오래된 항목으로 본다
+STALE_SKEW_SEC = 86400
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS feed_watermark (
+    feed_url       TEXT PRIMARY KEY,
+    last_published INTEGER NOT NULL DEFAULT 0,
+    seen_links     TEXT NOT NULL DEFAULT '[]',
+    updated_at     REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class Watermark:
+    feed_url: str
+    last_published: int = 0
+    seen_links: List[str] = field(default_factory=list)
+
+    @property
+    def seen(self) -> Set[str]:
+        return set(self.seen_links)
+
+
+def _conn():
+    return ensure_schema("feed_watermark", _DDL)
+
+
+def get(feed_url: str) -> Watermark:
+    row = _conn().execute(
+        "SELECT last_published, seen_links FROM feed_watermark WHERE feed_url = ?", (feed_url,)
+    ).fetchone()
+    if not row:
+        return Watermark(feed_url)
+    return Watermark(feed_url, row[0], json.loads(row[1]))
+
+
+def filter_new(feed_url: str, docs: Iterable) -> List:
+    """url/published_at 속성을 가진 항목 중 아직 처리하지 않은 것만 반환"""
+    wm = get(feed_url)
+    seen = wm.seen
+    out = []
+    for d in docs:
+        if d.url in seen:
+            continue
+        ts = int(getattr(d, "published_at", 0) or 0)
+        if ts and wm.last_published and ts < wm.last_published - STALE_SKEW_SEC:
+            continue
+        out.append(d)
+    return out
+
+
+def advance(feed_url: str, docs: Iterable) -> None:
+    """처리 완료한 항목으로 워터마크를 전진"""
+    docs = list(docs)
+    if not docs:
+        return
+    wm = get(feed_url)
+    last = max([wm.last_published] + [int(getattr(d, "published_at", 0) or 0) for d in docs])
+    links = [d.url for d in docs if d.url not in wm.seen] + wm.seen_links
+    _conn().execute(
+        "INSERT OR REPLACE INTO feed_watermark (feed_url, last_published, seen_links, updated_at) "
+        "VALUES (?, ?, ?, ?)",
+        (feed_url, last, json.dumps(links[:MAX_SEEN_LINKS], ensure_ascii=False), time.time()),
+    )
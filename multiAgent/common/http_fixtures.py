@@ -0,0 +1,70 @@
+"""
+http_fixtures.py — 저장된 HTTP 응답(RSS/기사 HTML) 기록 / 재생
+
+HTTP_FIXTURES_DIR를 지정하면 http_session.get이 이 모듈을 거친다.
+- replay: 네트워크 없이 저장된 본문을 돌려준다. 없으면 404 응답.
+- record: 실제로 요청한 뒤 200 응답 본문을 저장한다. (벤치마크용 픽스처 만들기)
+파일 이름은 <호스트>__<URL+쿼리 sha1 앞 16자>.bin 이고, _index.tsv에 URL과 파일 이름을 남긴다.
+"""
+import hashlib
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+
+HTTP_FIXTURES_DIR = os.getenv("HTTP_FIXTURES_DIR", "")
+HTTP_FIXTURES_MODE = os.getenv("HTTP_FIXTURES_MODE", "replay")  # replay | record
+
+stats: Counter = Counter()  # hits / misses / recorded
+_lock = threading.Lock()
+
+
+def replaying() -> bool:
+    return bool(HTTP_FIXTURES_DIR) and HTTP_FIXTURES_MODE == "replay"
+
+
+def recording() -> bool:
+    return bool(HTTP_FIXTURES_DIR) and HTTP_FIXTURES_MODE == "record"
+
+
+def _full_url(url: str, params: Optional[Dict] = None) -> str:
+    if not params:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()))}"
+
+
+def fixture_path(url: str, params: Optional[Dict] = None) -> Path:
+    full = _full_url(url, params)
+    host = (url.split("/")[2] if "://" in url else url).split(":")[0].lower()
+    return Path(HTTP_FIXTURES_DIR) / f"{host}__{hashlib.sha1(full.encode('utf-8')).hexdigest()[:16]}.bin"
+
+
+def replay(url: str, params: Optional[Dict] = None) -> requests.Response:
+    path = fixture_path(url, params)
+    resp = requests.Response()
+    resp.url = _full_url(url, params)
+    if path.exists():
+        resp.status_code, resp.reason, resp._content = 200, "OK", path.read_bytes()
+        key = "hits"
+    else:
+        resp.status_code, resp.reason, resp._content = 404, "Not Found", b""
+        key = "misses"
+    with _lock:
+        stats[key] += 1
+    return resp
+
+
+def record(url: str, params: Optional[Dict], resp: requests.Response) -> None:
+    if resp.status_code != 200:
+        return
+    path = fixture_path(url, params)
+    with _lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(resp.content)
+        with open(path.parent / "_index.tsv", "a", encoding="utf-8") as f:
+            f.write(f"{path.name}\t{_full_url(url, params)}\n")
+        stats["recorded"] += 1
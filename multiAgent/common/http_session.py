@@ -0,0 +1,82 @@
+"""
+http_session.py — 외부 요청 공용 HTTP 세션
+
+스크랩/RSS/DB API가 모두 이 세션 하나를 공유해서
+같은 매체(호스트)로 가는 요청은 keep-alive 커넥션을 재사용한다.
+- 호스트별 커넥션 풀 크기 지정 (병렬 스크랩 동시성 이상으로)
+- 연결 오류/5xx/429는 지수 백오프로 재시도 (Retry-After 존중)
+- gzip/deflate 압축 응답 사용
+- 도메인별 속도 제한/서킷 브레이커(politeness.scheduler)를 거쳐 요청
+- HTTP_FIXTURES_DIR가 있으면 저장된 응답을 재생/기록 (http_fixtures, 오프라인 벤치마크용)
+"""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import http_fixtures
+from .politeness import scheduler
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))  # 풀을 유지할 호스트 수
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))          # 호스트당 최대 커넥션 수
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "0.5"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+
+UA_HEADERS = {"User-Agent": os.getenv("USER_AGENT", "NewsTutorAgent/1.0")}
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(UA_HEADERS)
+    s.headers["Accept-Encoding"] = "gzip, deflate"
+    return s
+
+
+session = _build_session()
+
+
+def _host_of(url: str) -> str:
+    return (url.split("/")[2] if "://" in url else url).split(":")[0].lower()
+
+
+def get(url: str, polite: bool = True, **kwargs) -> requests.Response:
+    """
+    공용 세션 GET. polite=True면 도메인 스케줄러로 속도를 맞추고 결과를 보고한다.
+    서킷이 열린 도메인이면 politeness.DomainCircuitOpen을 던진다.
+    """
+    if http_fixtures.replaying():
+        return http_fixtures.replay(url, kwargs.get("params"))
+
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    if not polite:
+        resp = session.get(url, **kwargs)
+    else:
+        host = _host_of(url)
+        scheduler.acquire(host)
+        try:
+            resp = session.get(url, **kwargs)
+        except requests.RequestException:
+            scheduler.record(host, None)
+            raise
+        scheduler.record(host, resp.status_code)
+
+    if http_fixtures.recording():
+        http_fixtures.record(url, kwargs.get("params"), resp)
+    return resp
@@ -0,0 +1,104 @@
+"""
+llm.py — 에이전트 공용 LLM 클라이언트 레지스트리
+
+함수마다 ChatOpenAI(...)를 새로 만들면 호출할 때마다 클라이언트 객체와 HTTP 커넥션을 새로 만든다.
+같은 설정(모델, temperature, JSON 모드 등)의 클라이언트는 프로세스당 하나만 만들어
+모든 스레드가 공유하고, 모든 클라이언트는 커넥션 풀을 가진 httpx.Client 하나를 함께 쓴다.
+
+재시도는 클라이언트(max_retries) 대신 llm_retry.invoke_llm이 맡는다. (429 retry-after, 백오프, RPM/TPM 제한)
+
+LLM_BACKEND=fake면 OpenAI/Tavily 대신 fake_backend의 결정적 가짜 객체를 돌려준다. (오프라인 벤치마크)
+에이전트 모듈이 import 시점에 클라이언트를 만들기도 하므로 환경 변수는 import 전에 지정해야 한다.
+"""
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+from .llm_retry import call_with_retry, invoke_llm, is_retryable, llm_stats, reset_llm_stats  # noqa: F401
+
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "10"))
+LLM_HTTP_TIMEOUT = float(os.getenv("LLM_HTTP_TIMEOUT", "120"))
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")  # openai | fake
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_chat_models: Dict[Tuple, Any] = {}
+_embeddings: Dict[Optional[str], Any] = {}
+
+
+def http_client() -> httpx.Client:
+    """OpenAI 호출용 공용 커넥션 풀 (keep-alive 재사용)"""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS,
+                                    max_keepalive_connections=LLM_MAX_KEEPALIVE),
+                timeout=LLM_HTTP_TIMEOUT,
+            )
+        return _http_client
+
+
+def get_chat_model(model: str = "gpt-4o-mini", temperature: float = 0.0,
+                   json_mode: bool = False, timeout: Optional[float] = None, **kwargs) -> ChatOpenAI:
+    """
+    설정별로 캐시된 ChatOpenAI. kwargs는 top_p, presence_penalty 같은 스칼라 인자만 받는다.
+    json_mode=True면 response_format=json_object.
+    """
+    key = ("chat", model, temperature, json_mode, timeout, tuple(sorted(kwargs.items())))
+    client = http_client()
+    with _lock:
+        if key not in _chat_models:
+            extra: Dict[str, Any] = dict(kwargs)
+            if json_mode:
+                extra["model_kwargs"] = {"response_format": {"type": "json_object"}}
+            if timeout is not None:
+                extra["timeout"] = timeout
+            if LLM_BACKEND == "fake":
+                from .fake_backend import FakeChatModel
+                _chat_models[key] = FakeChatModel(model_name=model)
+                return _chat_models[key]
+            extra.setdefault("max_retries", 0)
+            _chat_models[key] = ChatOpenAI(model=model, temperature=temperature, http_client=client, **extra)
+        return _chat_models[key]
+
+
+def get_structured_model(schema: type, model: str = "gpt-4o-mini", temperature: float = 0.0):
+    """with_structured_output(schema) 러너블도 스키마별로 한 번만 만든다."""
+    key = ("structured", schema, model, temperature)
+    with _lock:
+        cached = _chat_models.get(key)
+    if cached is not None:
+        return cached
+    runnable = get_chat_model(model, temperature).with_structured_output(schema)
+    with _lock:
+        return _chat_models.setdefault(key, runnable)
+
+
+def get_embeddings(model: Optional[str] = None) -> OpenAIEmbeddings:
+    """model=None이면 langchain 기본 임베딩 모델"""
+    client = http_client()
+    with _lock:
+        if model not in _embeddings:
+            if LLM_BACKEND == "fake":
+                from .fake_backend import FakeEmbeddings
+                _embeddings[model] = FakeEmbeddings()
+                return _embeddings[model]
+            kwargs: Dict[str, Any] = {"http_client": client}
+            if model:
+                kwargs["model"] = model
+            _embeddings[model] = OpenAIEmbeddings(**kwargs)
+        return _embeddings[model]
+
+
+def get_search_tool(max_results: int = 1):
+    """웹 검색 도구 (invoke({"query": ...}) -> [{"title", "url", "content"}, ...])"""
+    if LLM_BACKEND == "fake":
+        from .fake_backend import FakeSearchTool
+        return FakeSearchTool(max_results=max_results)
+    from langchain_community.tools.tavily_search import TavilySearchResults
+    return TavilySearchResults(max_results=max_results)
@@ -0,0 +1,198 @@
+"""
+llm_retry.py — LLM 호출 공용 재시도 / 속도 제한 / 카운터
+
+- 호출 전: 분당 요청 수(RPM)·토큰 수(TPM) 토큰 버킷에서 몫을 예약하고 모자라면 기다린다.
+- 429: 응답의 retry-after(-ms) 만큼 프로세스 전체 호출을 멈춘 뒤 재시도한다.
+- 타임아웃/연결 오류/5xx: 지수 백오프 + 지터로 재시도한다.
+- 그 밖의 오류(400, 파싱 실패 등)는 재시도하지 않고 바로 올린다.
+- 라벨(단계)별 호출/재시도/실패/429/대기 시간/응답 시간 카운터를 남긴다. (llm_stats)
+"""
+import os
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+from .token_budget import count_tokens
+
+LLM_MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", "5"))
+LLM_BACKOFF_BASE_SEC = float(os.getenv("LLM_BACKOFF_BASE_SEC", "1.0"))
+LLM_BACKOFF_MAX_SEC = float(os.getenv("LLM_BACKOFF_MAX_SEC", "30"))
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "500"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "200000"))
+# 응답 토큰은 미리 알 수 없으므로 TPM 예약 시 고정값으로 더한다
+LLM_EST_OUTPUT_TOKENS = int(os.getenv("LLM_EST_OUTPUT_TOKENS", "600"))
+
+
+class TokenBucket:
+    """분당 rate_per_min 만큼 차오르는 버킷. reserve()는 기다려야 할 초를 돌려준다 (음수 잔량 허용)"""
+
+    def __init__(self, rate_per_min: float):
+        self.capacity = float(rate_per_min)
+        self.rate = float(rate_per_min) / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return max(0.0, -self.tokens / self.rate) if self.rate > 0 else 0.0
+
+
+class RateLimiter:
+    def __init__(self, rpm: int = LLM_RPM_LIMIT, tpm: int = LLM_TPM_LIMIT):
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm)
+        self._paused_until = 0.0
+
+    def acquire(self, tokens: int) -> float:
+        """몫을 예약하고 필요한 만큼 기다린다. 기다린 초를 반환"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._requests.reserve(1, now), self._tokens.reserve(tokens, now),
+                       self._paused_until - now)
+        if wait > 0:
+            time.sleep(wait)
+        return max(0.0, wait)
+
+    def pause(self, seconds: float) -> None:
+        """429 retry-after: 모든 스레드의 다음 호출을 seconds 뒤로 미룬다"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+limiter = RateLimiter()
+
+_stats_lock = threading.Lock()
+_stats: Counter = Counter()
+# 지금 호출 중인 단계 라벨 (가짜 백엔드가 단계별 응답을 고를 때 사용)
+_current_label: ContextVar[str] = ContextVar("llm_label", default="")
+
+
+def current_label() -> str:
+    return _current_label.get()
+
+
+def _count(label: str, key: str, n: float = 1) -> None:
+    with _stats_lock:
+        _stats[f"{label}.{key}"] += n
+        _stats[f"total.{key}"] += n
+
+
+def llm_stats() -> Dict[str, float]:
+    """{'summary.calls': 3, 'summary.retries': 1, 'total.calls': ..., ...}"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_llm_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def _status_code(e: Exception) -> Optional[int]:
+    code = getattr(e, "status_code", None)
+    if code is None:
+        code = getattr(getattr(e, "response", None), "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def _retry_after(e: Exception) -> Optional[float]:
+    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def is_rate_limited(e: Exception) -> bool:
+    if openai is not None and isinstance(e, openai.RateLimitError):
+        # 잔액 부족(insufficient_quota)은 기다려도 풀리지 않는다
+        return getattr(e, "code", None) != "insufficient_quota"
+    return _status_code(e) == 429
+
+
+def is_retryable(e: Exception) -> bool:
+    if is_rate_limited(e):
+        return True
+    if openai is not None and isinstance(e, (openai.APITimeoutError, openai.APIConnectionError,
+                                             openai.InternalServerError)):
+        return True
+    code = _status_code(e)
+    if code is not None:
+        return code >= 500
+    return isinstance(e, (TimeoutError, ConnectionError))
+
+
+def backoff_delay(attempt: int) -> float:
+    """attempt(0부터)번째 재시도 대기: base * 2^attempt 상한 적용 후 [50%, 100%] 지터"""
+    delay = min(LLM_BACKOFF_MAX_SEC, LLM_BACKOFF_BASE_SEC * (2 ** attempt))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _estimate_tokens(inputs: Any) -> int:
+    if isinstance(inputs, dict):
+        text = " ".join(str(v) for v in inputs.values())
+    elif isinstance(inputs, (list, tuple)):
+        text = " ".join(str(m) for m in inputs)
+    else:
+        text = str(inputs)
+    return count_tokens(text) + LLM_EST_OUTPUT_TOKENS
+
+
+def call_with_retry(fn: Callable[[], Any], label: str = "llm", est_tokens: int = LLM_EST_OUTPUT_TOKENS,
+                    max_attempts: int = LLM_MAX_ATTEMPTS, slots: Any = None) -> Any:
+    """
+    fn()을 속도 제한 + 재시도 정책으로 호출한다. 재시도할 수 없거나 다 쓰면 마지막 예외를 올린다
+    slots(세마포어 등)를 주면 시도 1회마다 잡았다 놓는다. 백오프/429 대기 중에는 슬롯을 쥐고 있지 않는다.
+    """
+    for attempt in range(max_attempts):
+        waited = limiter.acquire(est_tokens)
+        if waited:
+            _count(label, "throttle_wait_sec", waited)
+        token = _current_label.set(label)
+        try:
+            with slots if slots is not None else nullcontext():
+                _count(label, "calls")
+                started = time.monotonic()
+                try:
+                    return fn()
+                finally:
+                    _count(label, "latency_sec", time.monotonic() - started)
+        except Exception as e:
+            err = e
+        finally:
+            _current_label.reset(token)
+
+        if not is_retryable(err) or attempt == max_attempts - 1:
+            _count(label, "failures")
+            raise err
+        delay = backoff_delay(attempt)
+        if is_rate_limited(err):
+            _count(label, "rate_limited")
+            hint = _retry_after(err)
+            if hint is not None:
+                delay = max(delay, hint)
+            limiter.pause(delay)
+        _count(label, "retries")
+        time.sleep(delay)
+
+def invoke_llm(runnable: Any, inputs: Any, label: str = "llm", max_attempts: int = LLM_MAX_ATTEMPTS,
+               slots: Any = None) -> Any:
+    """runnable.invoke(inputs)를 공용 정책으로 호출 (체인/구조화 출력 러너블 모두)"""
+    return call_with_retry(lambda: runnable.invoke(inputs), label=label,
+                           est_tokens=_estimate_tokens(inputs), max_attempts=max_attempts, slots=slots)
@@ -0,0 +1,42 @@
+"""
+localdb.py — 에이전트 공용 로컬 저장소 (sqlite3)
+
+에이전트는 Django 없이(cli_main 등)도 실행되므로 표준 라이브러리 sqlite3만 사용한다.
+각 캐시/스토어 모듈은 ensure_schema()로 자기 테이블을 만들고 get_conn()으로 접근한다.
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+AGENT_DB_PATH = os.getenv(
+    "AGENT_DB_PATH",
+    str(Path(__file__).resolve().parent.parent / ".cache" / "agent_store.sqlite3"),
+)
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+_applied_schemas = set()
+
+
+def get_conn() -> sqlite3.Connection:
+    """스레드별 커넥션 (autocommit + WAL)"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        Path(AGENT_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(AGENT_DB_PATH, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+    return conn
+
+
+def ensure_schema(name: str, ddl: str) -> sqlite3.Connection:
+    """프로세스당 1회만 DDL을 실행하고 커넥션을 돌려준다."""
+    conn = get_conn()
+    if name not in _applied_schemas:
+        with _schema_lock:
+            if name not in _applied_schemas:
+                conn.executescript(ddl)
+                _applied_schemas.add(name)
+    return conn
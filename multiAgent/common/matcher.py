@@ -0,0 +1,86 @@
+"""
+matcher.py — 관심사 키워드 다중 패턴 매처
+
+기사마다 관심사 키워드를 하나씩 `in`으로 검사하면 O(기사 x 관심사 x 본문 길이)가 된다.
+관심사 집합마다 매처를 한 번만 컴파일해 두고 본문을 한 번 훑어서
+어떤 관심사가 몇 번 나왔는지(Counter)를 돌려준다. (랭킹에서도 그대로 사용)
+
+- pyahocorasick(C 구현 Aho-Corasick 오토마톤)이 있으면 사용
+- 없으면 전방탐색 정규식으로 위치마다 가장 긴 패턴을 찾고, 그 접두사인 패턴까지 함께 센다
+  (겹치는 매칭까지 오토마톤과 같은 결과)
+"""
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class InterestMatcher:
+    """대소문자 무시, 겹치는 매칭 포함. 결과 키는 원래 관심사 문자열"""
+
+    def __init__(self, keywords: Iterable[str]):
+        # 소문자 패턴 -> 원래 표기들 ('AI', 'ai' 가 함께 들어와도 한 패턴으로)
+        self._labels: Dict[str, List[str]] = {}
+        for kw in keywords:
+            pat = (kw or "").strip().lower()
+            if pat:
+                self._labels.setdefault(pat, []).append(kw.strip())
+
+        self._automaton = None
+        self._regex = None
+        if not self._labels:
+            return
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for pat in self._labels:
+                self._automaton.add_word(pat, pat)
+            self._automaton.make_automaton()
+        else:
+            pats = sorted(self._labels, key=len, reverse=True)
+            self._regex = re.compile("(?=(" + "|".join(map(re.escape, pats)) + "))")
+            # 가장 긴 매칭 -> 같은 위치에서 시작하는(접두사인) 패턴 전부
+            self._prefixes = {p: [q for q in pats if p.startswith(q)] for p in pats}
+
+    def __bool__(self) -> bool:
+        return bool(self._labels)
+
+    def _scan(self, text: str) -> Counter:
+        found: Counter = Counter()
+        if self._automaton is not None:
+            found.update(pat for _, pat in self._automaton.iter(text))
+        else:
+            for m in self._regex.finditer(text):
+                found.update(self._prefixes[m.group(1)])
+        return found
+
+    def count(self, *texts: str) -> Counter:
+        """texts 전체에서 관심사별 등장 횟수. 하나도 없으면 빈 Counter"""
+        result: Counter = Counter()
+        if not self._labels:
+            return result
+        found: Counter = Counter()
+        for text in texts:
+            if text:
+                found.update(self._scan(text.lower()))
+        for pat, n in found.items():
+            for label in self._labels[pat]:
+                result[label] = n
+        return result
+
+    def matches(self, *texts: str) -> bool:
+        return bool(self.count(*texts))
+
+
+@lru_cache(maxsize=256)
+def _compiled(keywords: FrozenSet[str]) -> InterestMatcher:
+    return InterestMatcher(sorted(keywords))
+
+
+def get_matcher(interests: Iterable[str]) -> InterestMatcher:
+    """관심사 집합별로 컴파일된 매처를 재사용한다 (같은 관심사 사용자끼리 공유)"""
+    return _compiled(frozenset(k for k in interests if k and k.strip()))
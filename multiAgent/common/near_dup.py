@@ -0,0 +1,94 @@
+"""
+near_dup.py — SimHash 기반 유사 중복 기사 탐지
+
+같은 통신 기사를 여러 매체가 제목만 바꿔 재게재하는 경우를 잡기 위해
+본문 문자 3-gram으로 64비트 SimHash를 만들고, 해밍 거리가 작으면 중복으로 본다.
+매체마다 다른 바이라인/이메일/저작권 문구는 해시 전에 지운다. (그대로 두면 재게재 기사끼리
+거리가 16까지 벌어지고, 같은 매체의 다른 기사끼리는 가까워진다)
+
+NEAR_DUP_MAX_DISTANCE 기본값 12는 200~400자 기사로 잰 값이다:
+같은 기사 재게재(리드 한 단어 수정, 끝 문장 삭제/추가, 문장 순서, 숫자 수정, 매체 문구 교체)는 0~11,
+서로 다른 기사는 같은 매체 문구를 달고 있어도 23 이상.
+
+SimHashIndex는 해시를 (max_distance + 1)개 밴드로 나눠 버킷에 넣으므로
+(비둘기집 원리: 거리 <= max_distance면 최소 한 밴드는 완전히 같음) 전체 쌍을 비교하지 않는다.
+거리 12면 밴드가 4비트라 버킷이 크지만, 하루 풀(수백 건) 규모에서는 충분히 싸다.
+"""
+import hashlib
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+SIMHASH_BITS = 64
+NEAR_DUP_MAX_DISTANCE = int(os.getenv("NEAR_DUP_MAX_DISTANCE", "12"))
+# 이보다 짧은 본문은 SimHash가 불안정하므로 비교하지 않는다
+NEAR_DUP_MIN_CHARS = int(os.getenv("NEAR_DUP_MIN_CHARS", "200"))
+
+_NON_WORD_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+# 매체별 문구: (서울=연합뉴스) 홍길동 기자 = / 이메일 / 저작권 문구 / '한국경제 홍길동 기자'
+_BOILERPLATE_RE = re.compile(
+    r"\([^()]{1,20}=[^()]{1,20}\)\s*[가-힣]{2,4}\s*(?:기자|특파원)\s*="
+    r"|[\w.+-]+@[\w-]+(?:\.[\w-]+)+"
+    r"|(?:저작권자|ⓒ|©|\(c\)|copyright).{0,40}?(?:금지|reserved)"
+    r"|[가-힣]{2,6}\s+[가-힣]{2,4}\s*(?:기자|특파원)(?=\s|$)",
+    re.IGNORECASE,
+)
+
+
+def _shingles(text: str, n: int = 3) -> Counter:
+    s = _NON_WORD_RE.sub("", _BOILERPLATE_RE.sub(" ", text or "").lower())
+    if len(s) < n:
+        return Counter([s]) if s else Counter()
+    return Counter(s[i:i + n] for i in range(len(s) - n + 1))
+
+
+def simhash(text: str) -> int:
+    v = [0] * SIMHASH_BITS
+    for sh, w in _shingles(text).items():
+        h = int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest(), "big")
+        for i in range(SIMHASH_BITS):
+            v[i] += w if (h >> i) & 1 else -w
+    out = 0
+    for i in range(SIMHASH_BITS):
+        if v[i] > 0:
+            out |= 1 << i
+    return out
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class SimHashIndex:
+    """밴드 버킷 기반 SimHash 인덱스"""
+
+    def __init__(self, max_distance: int = NEAR_DUP_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.bands
+        self._mask = (1 << self.band_bits) - 1
+        self._buckets: Dict[Tuple[int, int], List[Tuple[Any, int]]] = defaultdict(list)
+
+    def _band_keys(self, h: int):
+        for b in range(self.bands):
+            yield b, (h >> (b * self.band_bits)) & self._mask
+
+    def find(self, h: int) -> Optional[Any]:
+        """거리 max_distance 이내의 기존 키를 반환 (없으면 None)"""
+        for bk in self._band_keys(h):
+            for key, other in self._buckets.get(bk, ()):
+                if hamming(h, other) <= self.max_distance:
+                    return key
+        return None
+
+    def add(self, key: Any, h: int) -> None:
+        for bk in self._band_keys(h):
+            self._buckets[bk].append((key, h))
+
+    def check_and_add(self, key: Any, h: int) -> Optional[Any]:
+        """중복이면 기존 키를 반환하고, 아니면 색인에 추가한 뒤 None"""
+        dup = self.find(h)
+        if dup is None:
+            self.add(key, h)
+        return dup
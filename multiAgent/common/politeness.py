@@ -0,0 +1,109 @@
+"""
+politeness.py — 도메인별 요청 속도 제한 + 적응형 백오프 + 서킷 브레이커
+
+- 도메인마다 최소 요청 간격(interval)을 지켜 요청 시점을 배정한다.
+- 429/5xx/연결 오류가 나면 간격을 배수로 늘리고, 성공하면 서서히 되돌린다.
+- 연속 실패가 임계치를 넘으면 쿨다운 동안 해당 도메인 요청을 즉시 거절한다.
+  쿨다운 후 첫 요청(half-open)이 다시 실패하면 곧바로 다시 차단한다.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+POLITE_MIN_INTERVAL_SEC = float(os.getenv("POLITE_MIN_INTERVAL_SEC", "0.3"))
+POLITE_MAX_INTERVAL_SEC = float(os.getenv("POLITE_MAX_INTERVAL_SEC", "30"))
+POLITE_BACKOFF_FACTOR = float(os.getenv("POLITE_BACKOFF_FACTOR", "2.0"))
+BREAKER_FAIL_THRESHOLD = int(os.getenv("BREAKER_FAIL_THRESHOLD", "5"))
+BREAKER_COOLDOWN_SEC = float(os.getenv("BREAKER_COOLDOWN_SEC", "300"))
+
+
+class DomainCircuitOpen(Exception):
+    """서킷이 열린(쿨다운 중인) 도메인에 요청한 경우"""
+
+    def __init__(self, domain: str, retry_in: float):
+        super().__init__(f"circuit open for {domain} (retry in {retry_in:.0f}s)")
+        self.domain = domain
+        self.retry_in = retry_in
+
+
+@dataclass
+class _DomainState:
+    interval: float
+    next_slot: float = 0.0
+    failures: int = 0
+    open_until: float = 0.0
+    half_open: bool = False
+
+
+class PolitenessScheduler:
+    def __init__(self,
+                 min_interval: float = POLITE_MIN_INTERVAL_SEC,
+                 max_interval: float = POLITE_MAX_INTERVAL_SEC,
+                 backoff_factor: float = POLITE_BACKOFF_FACTOR,
+                 fail_threshold: int = BREAKER_FAIL_THRESHOLD,
+                 cooldown: float = BREAKER_COOLDOWN_SEC):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.fail_threshold = fail_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._states: Dict[str, _DomainState] = {}
+
+    def _state(self, domain: str) -> _DomainState:
+        st = self._states.get(domain)
+        if st is None:
+            st = self._states[domain] = _DomainState(interval=self.min_interval)
+        return st
+
+    def acquire(self, domain: str) -> None:
+        """요청 슬롯을 배정받을 때까지 대기. 서킷이 열려 있으면 DomainCircuitOpen"""
+        with self._lock:
+            st = self._state(domain)
+            now = time.monotonic()
+            if st.open_until > now:
+                raise DomainCircuitOpen(domain, st.open_until - now)
+            if st.open_until:
+                # 쿨다운 종료 -> 시험 요청 허용
+                st.open_until = 0.0
+                st.half_open = True
+            slot = max(now, st.next_slot)
+            st.next_slot = slot + st.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def record(self, domain: str, status: Optional[int]) -> None:
+        """응답 결과 반영. status=None은 연결 오류/타임아웃"""
+        throttled = status is None or status == 429 or status >= 500
+        with self._lock:
+            st = self._state(domain)
+            if not throttled:
+                st.failures = 0
+                st.half_open = False
+                st.interval = max(self.min_interval, st.interval / self.backoff_factor)
+                return
+            st.failures += 1
+            st.interval = min(self.max_interval, st.interval * self.backoff_factor)
+            if st.half_open or st.failures >= self.fail_threshold:
+                st.open_until = time.monotonic() + self.cooldown
+                st.failures = 0
+                st.half_open = False
+
+    def is_open(self, domain: str) -> bool:
+        with self._lock:
+            return self._state(domain).open_until > time.monotonic()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                d: {"interval": round(st.interval, 2), "failures": st.failures,
+                    "open_for": round(max(0.0, st.open_until - now), 1)}
+                for d, st in self._states.items()
+            }
+
+
+# 프로세스 공용 스케줄러
+scheduler = PolitenessScheduler()
@@ -0,0 +1,151 @@
+"""
+ranking.py — 데일리 기사 랭킹 (공용 풀 x 사용자, NumPy 벡터화)
+
+점수 = 최신성(반감기 지수 감쇠) x W_RECENCY + 관심사 강도(log1p 등장 횟수, 사용자별 정규화) x W_INTEREST
+     + 임베딩 유사도(있으면) x W_SEMANTIC
+Top-k는 탐욕 선택: 한 건 뽑을 때마다 같은 매체 / 같은 사건(SimHash 근접) 기사 점수를 깎는다.
+
+- 풀 단위 특징(최신성, 매체 id, 사건 그룹)은 PoolFeatures로 한 번만 계산
+- 사용자 U명 x 기사 N건 점수 행렬을 한 번에 다뤄 k번의 argmax로 전원의 Top-k를 구한다
+"""
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+RANK_HALF_LIFE_HOURS = float(os.getenv("RANK_HALF_LIFE_HOURS", "12"))
+RANK_W_RECENCY = float(os.getenv("RANK_W_RECENCY", "1.0"))
+RANK_W_INTEREST = float(os.getenv("RANK_W_INTEREST", "1.0"))
+RANK_W_SEMANTIC = float(os.getenv("RANK_W_SEMANTIC", "1.0"))
+# 이미 뽑힌 기사와 매체/사건이 같을 때 깎는 점수 (건당 누적)
+RANK_SOURCE_PENALTY = float(os.getenv("RANK_SOURCE_PENALTY", "0.3"))
+RANK_DUP_PENALTY = float(os.getenv("RANK_DUP_PENALTY", "0.8"))
+# 같은 사건으로 묶을 SimHash 해밍 거리 (재게재 제거 기준 12보다 느슨하게, 다른 기사 간 거리 23보다는 작게)
+RANK_DUP_DISTANCE = int(os.getenv("RANK_DUP_DISTANCE", "18"))
+# 탐욕 선택은 사용자별 기본 점수 상위 후보 안에서만 수행 (감점만 있으므로 k가 작으면 충분)
+RANK_SHORTLIST = int(os.getenv("RANK_SHORTLIST", "64"))
+
+
+def _popcount64(x: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(x)
+    bytes_ = x.astype(np.uint64).view(np.uint8).reshape(x.shape + (8,))
+    return np.unpackbits(bytes_, axis=-1).sum(axis=-1)
+
+
+def dup_groups(simhashes: Sequence[Optional[int]], max_distance: int = RANK_DUP_DISTANCE) -> np.ndarray:
+    """
+    SimHash가 서로 가까운 기사들에 같은 그룹 id를 준다.
+    그룹 id = 거리 이내인 기사 중 가장 앞선 인덱스. (SimHash 없는 기사는 단독 그룹)
+    """
+    n = len(simhashes)
+    groups = np.arange(n)
+    have = np.array([h is not None for h in simhashes], dtype=bool)
+    if have.sum() < 2:
+        return groups
+    idx = np.flatnonzero(have)
+    h = np.array([simhashes[i] for i in idx], dtype=np.uint64)
+    close = _popcount64(h[:, None] ^ h[None, :]) <= max_distance
+    # 대각선은 항상 True이므로 argmax = 첫 번째로 가까운 기사
+    groups[idx] = idx[np.argmax(close, axis=1)]
+    return groups
+
+
+@dataclass
+class PoolFeatures:
+    recency: np.ndarray        # (N,) 0~1
+    source_ids: np.ndarray     # (N,) int
+    group_ids: np.ndarray      # (N,) int
+
+    @classmethod
+    def build(cls, published_at: Sequence[int], sources: Sequence[str],
+              simhashes: Sequence[Optional[int]], now: Optional[float] = None,
+              half_life_hours: float = RANK_HALF_LIFE_HOURS) -> "PoolFeatures":
+        now = time.time() if now is None else now
+        ts = np.asarray(published_at, dtype=np.float64)
+        age_h = np.clip(now - ts, 0, None) / 3600.0
+        recency = np.exp(-math.log(2) * age_h / half_life_hours)
+        recency[ts <= 0] = 0.0   # 발행 시각 모름
+        _, source_ids = np.unique(np.asarray(sources, dtype=object).astype(str), return_inverse=True)
+        return cls(recency, source_ids.reshape(-1), dup_groups(simhashes))
+
+    def __len__(self) -> int:
+        return len(self.recency)
+
+
+def interest_strength(counts: np.ndarray) -> np.ndarray:
+    """(U, N) 관심사 등장 횟수 -> 사용자별 0~1 강도 (log1p 후 행 최댓값으로 정규화)"""
+    s = np.log1p(np.asarray(counts, dtype=np.float64))
+    row_max = s.max(axis=1, keepdims=True) if s.size else s
+    return np.divide(s, row_max, out=np.zeros_like(s), where=row_max > 0)
+
+
+def top_k(features: PoolFeatures, counts: np.ndarray, mask: np.ndarray, k: int = 3,
+          similarity: Optional[np.ndarray] = None,
+          w_recency: float = RANK_W_RECENCY, w_interest: float = RANK_W_INTEREST,
+          w_semantic: float = RANK_W_SEMANTIC,
+          source_penalty: float = RANK_SOURCE_PENALTY,
+          dup_penalty: float = RANK_DUP_PENALTY) -> np.ndarray:
+    """
+    counts/mask/similarity: (U, N). mask가 False인 기사는 후보에서 제외.
+    반환: (U, k) 기사 인덱스. 후보가 k보다 적으면 -1로 채운다.
+    """
+    counts = np.atleast_2d(counts)
+    mask = np.atleast_2d(mask)
+    n_users, n_docs = counts.shape
+    out = np.full((n_users, k), -1, dtype=np.int64)
+    if n_docs == 0 or k <= 0:
+        return out
+
+    scores = w_recency * features.recency[None, :] + w_interest * interest_strength(counts)
+    if similarity is not None:
+        scores = scores + w_semantic * np.clip(np.atleast_2d(similarity), 0.0, 1.0)
+    scores = np.where(mask, scores, -np.inf)
+
+    # 1) 사용자별 상위 후보만 추린다 (argpartition: O(N))
+    m = min(n_docs, max(k, RANK_SHORTLIST))
+    if m < n_docs:
+        cand = np.argpartition(-scores, m - 1, axis=1)[:, :m]
+    else:
+        cand = np.broadcast_to(np.arange(n_docs), (n_users, n_docs))
+    sub = np.take_along_axis(scores, cand, axis=1)
+    src = features.source_ids[cand]
+    grp = features.group_ids[cand]
+
+    # 2) 후보 안에서 k번 argmax: 뽑힌 기사와 같은 매체 / 같은 사건 기사를 감점하고, 뽑힌 기사는 제외
+    rows = np.arange(n_users)
+    for step in range(min(k, m)):
+        best = np.argmax(sub, axis=1)
+        valid = np.isfinite(sub[rows, best])
+        if not valid.any():
+            break
+        out[valid, step] = cand[rows, best][valid]
+        sub -= source_penalty * (src == src[rows, best][:, None]) * valid[:, None]
+        sub -= dup_penalty * (grp == grp[rows, best][:, None]) * valid[:, None]
+        sub[rows[valid], best[valid]] = -np.inf
+    return out
+
+
+def top_k_filled(features: PoolFeatures, counts: np.ndarray, mask: np.ndarray, k: int = 3,
+                 similarity: Optional[np.ndarray] = None, **weights) -> np.ndarray:
+    """
+    top_k와 같지만 mask를 '우선 후보'로만 쓴다: mask 안 후보가 k건보다 적은 사용자는
+    mask 밖 기사까지 포함한 랭킹 순서로 k건까지 채운다. (풀 자체가 k건보다 작을 때만 -1)
+    """
+    counts = np.atleast_2d(counts)
+    mask = np.atleast_2d(mask)
+    out = top_k(features, counts, mask, k=k, similarity=similarity, **weights)
+    short = np.flatnonzero((out < 0).any(axis=1) & ~mask.all(axis=1))
+    if short.size == 0:
+        return out
+    sim = None if similarity is None else np.atleast_2d(similarity)[short]
+    fill = top_k(features, counts[short], np.ones((short.size, counts.shape[1]), dtype=bool),
+                 k=k, similarity=sim, **weights)
+    for j, r in enumerate(short):
+        got = [int(i) for i in out[r] if i >= 0]
+        got += [int(i) for i in fill[j] if i >= 0 and i not in got]
+        out[r, :len(got[:k])] = got[:k]
+    return out
@@ -0,0 +1,191 @@
+"""
+search_index.py — 수집 기사 로컬 전문 검색 인덱스 (역색인)
+
+한국어는 띄어쓰기·조사 때문에 단어 단위 매칭이 잘 안 되므로
+어절마다 문자 2-gram으로 쪼개 색인한다. ('삼성전자가' -> 삼성/성전/전자/자가)
+- 제목/RSS 요약/본문에 필드 가중치를 두고 tf(log 감쇠) x idf로 점수를 매긴다.
+- 기사 단위로 upsert되므로 수집할 때마다 증분 색인된다.
+"""
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .content_store import canonicalize_url
+from .localdb import ensure_schema
+
+FIELD_WEIGHTS = {"title": 3.0, "summary": 1.0, "content": 0.5}
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS search_doc (
+    doc_id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    url_key      TEXT NOT NULL UNIQUE,
+    url          TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    summary      TEXT NOT NULL DEFAULT '',
+    source       TEXT NOT NULL DEFAULT '',
+    published_at INTEGER NOT NULL DEFAULT 0,
+    has_content  INTEGER NOT NULL DEFAULT 0,
+    indexed_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_doc_published ON search_doc (published_at);
+CREATE TABLE IF NOT EXISTS search_posting (
+    token  TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (token, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS search_posting_doc ON search_posting (doc_id);
+"""
+
+_WORD_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+@dataclass
+class SearchHit:
+    url: str
+    title: str
+    summary: str
+    source: str
+    published_at: int
+    score: float
+
+
+def tokenize(text: str) -> List[str]:
+    """어절별 문자 2-gram (1글자 어절은 그대로)"""
+    tokens: List[str] = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _conn():
+    return ensure_schema("search_index", _DDL)
+
+
+def _weights(title: str, summary: str, content: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for field, text in (("title", title), ("summary", summary), ("content", content)):
+        for tok, tf in Counter(tokenize(text)).items():
+            weights[tok] = weights.get(tok, 0.0) + FIELD_WEIGHTS[field] * (1.0 + math.log(tf))
+    return weights
+
+
+def add_document(url: str, title: str, summary: str = "", content: str = "",
+                 source: str = "", published_at: int = 0) -> bool:
+    """기사 1건 색인 (이미 본문까지 색인된 기사는 건너뜀). 색인했으면 True"""
+    if not url or not title:
+        return False
+    conn = _conn()
+    url_key = canonicalize_url(url)
+    row = conn.execute("SELECT doc_id, has_content FROM search_doc WHERE url_key = ?", (url_key,)).fetchone()
+    if row and (row[1] or not content):
+        return False
+
+    conn.execute("BEGIN")
+    try:
+        if row:
+            doc_id = row[0]
+            conn.execute("DELETE FROM search_posting WHERE doc_id = ?", (doc_id,))
+            conn.execute(
+                "UPDATE search_doc SET url = ?, title = ?, summary = ?, source = ?, published_at = ?, "
+                "has_content = ?, indexed_at = ? WHERE doc_id = ?",
+                (url, title, summary or "", source or "", int(published_at or 0),
+                 1 if content else 0, time.time(), doc_id),
+            )
+        else:
+            cur = conn.execute(
+                "INSERT INTO search_doc (url_key, url, title, summary, source, published_at, has_content, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url_key, url, title, summary or "", source or "", int(published_at or 0),
+                 1 if content else 0, time.time()),
+            )
+            doc_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO search_posting (token, doc_id, weight) VALUES (?, ?, ?)",
+            [(tok, doc_id, w) for tok, w in _weights(title, summary, content).items()],
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return True
+
+
+def add_documents(docs: Iterable) -> int:
+    """NewsDoc 처럼 title/url/summary/content/source/published_at 속성을 가진 객체들을 색인"""
+    n = 0
+    for d in docs:
+        if add_document(d.url, d.title, getattr(d, "summary", ""), getattr(d, "content", ""),
+                        getattr(d, "source", ""), getattr(d, "published_at", 0)):
+            n += 1
+    return n
+
+
+def search(query: str, limit: int = 5, since: Optional[int] = None,
+           min_should_match: float = 0.5) -> List[SearchHit]:
+    """
+    query를 어절(검색어)별로 나눠, 어느 한 검색어라도 그 2-gram의 min_should_match 비율 이상을
+    포함한 기사를 찾는다. ('금리 인상 삼성' -> 금리/인상/삼성 중 하나 이상, '삼성전자가' -> 2-gram 4개 중 2개 이상)
+    맞은 검색어 수 -> 점수(tf-idf 합) -> 최신순으로 정렬해 반환한다.
+    """
+    terms = []
+    for word in dict.fromkeys(_WORD_RE.findall((query or "").lower())):
+        toks = sorted(set(tokenize(word)))
+        if toks:
+            terms.append(toks)
+    if not terms:
+        return []
+    q_tokens = sorted({tok for toks in terms for tok in toks})
+    conn = _conn()
+    n_docs = conn.execute("SELECT COUNT(*) FROM search_doc").fetchone()[0]
+    if not n_docs:
+        return []
+
+    marks = ",".join("?" * len(q_tokens))
+    df = dict(conn.execute(
+        f"SELECT token, COUNT(*) FROM search_posting WHERE token IN ({marks}) GROUP BY token", q_tokens
+    ).fetchall())
+    idf = {tok: math.log(1.0 + n_docs / (1 + cnt)) for tok, cnt in df.items()}
+
+    # 점수 집계/정렬은 SQLite에서 처리 (파이썬으로 포스팅을 끌어오지 않음)
+    # 검색어 i마다 맞은 2-gram 수(m{i})를 세고, 기준 이상인 검색어 수를 hit_terms로 둔다.
+    idf_case = " ".join("WHEN ? THEN ?" for _ in q_tokens)
+    term_cols = ", ".join(
+        f"SUM(CASE WHEN token IN ({','.join('?' * len(toks))}) THEN 1 ELSE 0 END) AS m{i}"
+        for i, toks in enumerate(terms)
+    )
+    hit_terms = " + ".join(f"(m{i} >= ?)" for i in range(len(terms)))
+    sql = (
+        f"SELECT url, title, summary, source, published_at, score FROM ("
+        f"  SELECT d.url, d.title, d.summary, d.source, d.published_at, p.score, ({hit_terms}) AS hit_terms"
+        f"  FROM ("
+        f"    SELECT doc_id, SUM(weight * CASE token {idf_case} ELSE 0 END) AS score, {term_cols}"
+        f"    FROM search_posting WHERE token IN ({marks}) GROUP BY doc_id"
+        f"  ) p JOIN search_doc d ON d.doc_id = p.doc_id"
+    )
+    params: list = [max(1, math.ceil(len(toks) * min_should_match)) for toks in terms]
+    params += [v for tok in q_tokens for v in (tok, idf.get(tok, 0.0))]
+    params += [tok for toks in terms for tok in toks] + q_tokens
+    if since:
+        sql += " WHERE d.published_at >= ?"
+        params.append(int(since))
+    sql += ") WHERE hit_terms > 0 ORDER BY hit_terms DESC, score DESC, published_at DESC LIMIT ?"
+    params.append(int(limit))
+
+    return [SearchHit(*row) for row in conn.execute(sql, params)]
+
+
+def recent_documents(since: int, content_only: bool = False) -> List[SearchHit]:
+    """since(epoch초) 이후 발행(발행 시각이 없으면 색인 시각 기준)된 기사를 최신순으로 반환"""
+    sql = ("SELECT url, title, summary, source, published_at, 0.0 FROM search_doc "
+           "WHERE (published_at >= ? OR (published_at = 0 AND indexed_at >= ?))")
+    if content_only:
+        sql += " AND has_content = 1"
+    sql += " ORDER BY published_at DESC"
+    return [SearchHit(*row) for row in _conn().execute(sql, (int(since), float(since)))]
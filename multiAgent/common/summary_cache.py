@@ -0,0 +1,75 @@
+"""
+summary_cache.py — 기사 요약 결과 캐시 (본문 해시 x 등급 x 프롬프트 버전 x 모델)
+
+같은 기사·같은 등급 요약을 챗봇 사용자마다, 데일리 작업마다 다시 만들지 않도록 저장한다.
+- TTL이 지난 항목은 조회 시 무시하고, 저장 시 오래된 항목과 함께 정리한다.
+- 항목 수가 상한을 넘으면 마지막 사용 시각이 가장 오래된 것부터 지운다. (LRU)
+"""
+import json
+import os
+import time
+import zlib
+from typing import Dict, Optional
+
+from .content_store import content_hash
+from .localdb import ensure_schema
+
+SUMMARY_CACHE_TTL_SEC = int(os.getenv("SUMMARY_CACHE_TTL_SEC", str(7 * 86400)))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "5000"))
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS summary_cache (
+    cache_key      TEXT PRIMARY KEY,
+    content_hash   TEXT NOT NULL,
+    grade          TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    model          TEXT NOT NULL,
+    payload        BLOB NOT NULL,
+    created_at     REAL NOT NULL,
+    last_used_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS summary_cache_lru ON summary_cache (last_used_at);
+"""
+
+
+def _conn():
+    return ensure_schema("summary_cache", _DDL)
+
+
+def make_key(content: str, grade: str, prompt_version: str, model: str, variant: str = "") -> str:
+    """variant: 프롬프트에 들어가는 그 밖의 개인화 값(관심사 등)"""
+    return content_hash("\x1f".join([content_hash(content), grade or "", prompt_version, model, variant or ""]))
+
+
+def get(key: str, ttl: int = SUMMARY_CACHE_TTL_SEC) -> Optional[Dict]:
+    conn = _conn()
+    row = conn.execute("SELECT payload, created_at FROM summary_cache WHERE cache_key = ?", (key,)).fetchone()
+    if not row or time.time() - row[1] > ttl:
+        return None
+    conn.execute("UPDATE summary_cache SET last_used_at = ? WHERE cache_key = ?", (time.time(), key))
+    return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+
+def put(key: str, payload: Dict, content: str, grade: str, prompt_version: str, model: str,
+        ttl: int = SUMMARY_CACHE_TTL_SEC, max_entries: int = SUMMARY_CACHE_MAX_ENTRIES) -> None:
+    conn = _conn()
+    now = time.time()
+    blob = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    conn.execute(
+        "INSERT OR REPLACE INTO summary_cache "
+        "(cache_key, content_hash, grade, prompt_version, model, payload, created_at, last_used_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (key, content_hash(content), grade or "", prompt_version, model, blob, now, now),
+    )
+    _evict(conn, now, ttl, max_entries)
+
+
+def _evict(conn, now: float, ttl: int, max_entries: int) -> None:
+    conn.execute("DELETE FROM summary_cache WHERE created_at < ?", (now - ttl,))
+    over = conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()[0] - max_entries
+    if over > 0:
+        conn.execute(
+            "DELETE FROM summary_cache WHERE cache_key IN "
+            "(SELECT cache_key FROM summary_cache ORDER BY last_used_at LIMIT ?)",
+            (over,),
+        )
@@ -0,0 +1,98 @@
+"""
+token_budget.py — 모델 토크나이저 기준 입력 예산 계산 / 분할
+
+글자 수로 자르면 한국어·영어 비율에 따라 실제 토큰 수가 크게 달라진다.
+tiktoken이 있으면 모델 인코딩으로 정확히 세고, 없거나 인코딩 파일을 못 받으면
+문자 종류별 근사치(한글 1자 ~ 1토큰, 그 외 4자 ~ 1토큰)로 센다.
+"""
+import math
+import re
+from functools import lru_cache
+from typing import List
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+# 청크 경계로 쓸 문단/문장 끝
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?。])\s+|(?<=다\.)|\n+")
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+    except Exception:
+        # 오프라인 등으로 BPE 파일을 못 받는 경우
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    if not text:
+        return 0
+    enc = _encoding(model)
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str:
+    """max_tokens 이하가 되도록 앞부분만 남긴다 (문장 경계 우선)"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    enc = _encoding(model)
+    if enc is not None:
+        return enc.decode(enc.encode(text, disallowed_special=())[:max_tokens])
+    out, used = [], 0
+    for sent in _sentences(text):
+        n = count_tokens(sent, model)
+        if used + n > max_tokens:
+            break
+        out.append(sent)
+        used += n
+    return " ".join(out) if out else text[:max_tokens]
+
+
+def _sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENT_SPLIT_RE.split(text or "") if s and s.strip()]
+
+
+def split_by_tokens(text: str, chunk_tokens: int, overlap_tokens: int = 0,
+                    model: str = "gpt-4o-mini") -> List[str]:
+    """
+    문장 단위로 모아 chunk_tokens 이하 청크로 나눈다.
+    overlap_tokens만큼 앞 청크의 마지막 문장들을 다음 청크 앞에 붙여 문맥이 끊기지 않게 한다.
+    """
+    chunks: List[str] = []
+    cur: List[str] = []
+    cur_tokens = 0
+    for sent in _sentences(text):
+        n = count_tokens(sent, model)
+        if n > chunk_tokens:
+            # 문장 하나가 예산보다 길면 강제로 자른다
+            sent, n = truncate_to_tokens(sent, chunk_tokens, model), chunk_tokens
+        if cur and cur_tokens + n > chunk_tokens:
+            chunks.append(" ".join(cur))
+            tail, tail_tokens = [], 0
+            for prev in reversed(cur):
+                t = count_tokens(prev, model)
+                if tail_tokens + t > overlap_tokens:
+                    break
+                tail.insert(0, prev)
+                tail_tokens += t
+            cur, cur_tokens = tail, tail_tokens
+        cur.append(sent)
+        cur_tokens += n
+    if cur:
+        chunks.append(" ".join(cur))
+    return chunks
@@ -0,0 +1,83 @@
+import hashlib
+import time
+from pathlib import Path
+
+import bs4
+from django.core.management.base import BaseCommand, CommandError
+from ...common import extractors
+
+DEFAULT_FIXTURE_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "html"
+
+
+class Command(BaseCommand):
+    help = '저장된 기사 HTML로 본문 추출 속도 비교 (페이지 전체 html.parser 파싱 vs 본문 컨테이너만 파싱)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fixtures',
+            type=str,
+            default=str(DEFAULT_FIXTURE_DIR),
+            help='HTML 픽스처 디렉터리 (파일명: <도메인>__<이름>.html)',
+        )
+        parser.add_argument('--repeat', type=int, default=20, help='파일당 반복 횟수')
+        parser.add_argument(
+            '--save',
+            nargs='+',
+            metavar='URL',
+            help='기사 URL을 받아 픽스처로 저장한 뒤 벤치마크 실행',
+        )
+
+    def handle(self, *args, **options):
+        fixture_dir = Path(options['fixtures'])
+        repeat = max(1, options['repeat'])
+
+        for url in options.get('save') or []:
+            ex = extractors.find_extractor(url)
+            if ex is None:
+                self.stderr.write(f"❌ 등록된 추출기가 없는 매체입니다: {url}")
+                continue
+            fixture_dir.mkdir(parents=True, exist_ok=True)
+            path = fixture_dir / f"{ex.domain}__{hashlib.sha1(url.encode()).hexdigest()[:10]}.html"
+            path.write_bytes(extractors.fetch_html(url))
+            self.stdout.write(f" - 저장: {path.name}")
+
+        files = sorted(fixture_dir.glob("*.html"))
+        if not files:
+            raise CommandError(f"❌ 픽스처가 없습니다: {fixture_dir} (--save URL 로 먼저 저장하세요)")
+
+        self.stdout.write(f"🚀 파서: {extractors.HTML_PARSER} | 파일 {len(files)}개 x {repeat}회")
+
+        total_full = total_strained = 0.0
+        for path in files:
+            ex = extractors.find_extractor("https://" + path.name.split("__")[0] + "/")
+            if ex is None:
+                self.stdout.write(f" - 스킵 (추출기 없음): {path.name}")
+                continue
+            html = path.read_bytes()
+
+            # 기존 방식: 페이지 전체를 html.parser로 파싱한 뒤 컨테이너 탐색
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                soup = bs4.BeautifulSoup(html, "html.parser")
+                container = soup.find(ex.tag, attrs=ex.attrs)
+                full_text = container.get_text("\n", strip=True) if container else ""
+            full_ms = (time.perf_counter() - t0) * 1000 / repeat
+
+            # 추출기: 본문 컨테이너만 트리로 생성
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                text = ex.extract(html)
+            strained_ms = (time.perf_counter() - t0) * 1000 / repeat
+
+            total_full += full_ms
+            total_strained += strained_ms
+            self.stdout.write(
+                f" - {path.name}: full {full_ms:7.2f}ms ({len(full_text)}자) | "
+                f"strained {strained_ms:7.2f}ms ({len(text)}자)"
+            )
+
+        if total_strained:
+            self.stdout.write(self.style.SUCCESS(
+                f"🎉 합계 full {total_full:.1f}ms / strained {total_strained:.1f}ms "
+                f"(x{total_full / total_strained:.1f})"
+            ))
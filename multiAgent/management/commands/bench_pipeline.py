@@ -0,0 +1,207 @@
+import io
+import json
+import os
+import time
+from contextlib import nullcontext, redirect_stdout
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from accounts.models import Profile
+from ...common import bench_fixtures, http_fixtures
+
+User = get_user_model()
+
+_MULTIAGENT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_FIXTURE_DIR = _MULTIAGENT_DIR / "fixtures" / "http"
+# 벤치마크 기본 환경. 이미 지정된 값은 그대로 쓴다 (예: LLM_BACKEND=openai 로 실제 API 지연 측정).
+# 픽스처 기사는 기록 시점 기준이므로 공용 풀 시간 창(DAILY_POOL_HOURS)을 넓혀 모두 포함한다.
+BENCH_ENV = {
+    "LLM_BACKEND": "fake",
+    "AGENT_DB_PATH": str(_MULTIAGENT_DIR / ".cache" / "bench_store.sqlite3"),
+    "DAILY_POOL_HOURS": str(24 * 365),
+}
+DEFAULT_CHAT = ["안녕", "오늘 금리 관련 뉴스 찾아줘", "첫번째 기사 요약해줘", "인플레이션이 뭐야?", "퀴즈 내줘"]
+# 등급 순환: 없음 / 씨앗 / 새싹 / 나무 / 숲
+BENCH_SCORES = [0, 500, 2000, 5000, 12000]
+
+
+class Command(BaseCommand):
+    help = (
+        '저장된 RSS/HTML 픽스처 + 가짜 LLM 백엔드로 데일리 파이프라인과 챗봇(run_agent)을 실행해 시간/호출/쿼리 수를 잰다. '
+        '데일리 파이프라인은 bench 사용자만 처리하고, 실행 중 DB에 쓴 내용은 끝나면 모두 롤백한다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fixtures',
+            type=str,
+            default=str(DEFAULT_FIXTURE_DIR),
+            help='HTTP 픽스처 디렉터리 (http_fixtures 형식)',
+        )
+        parser.add_argument('--record', action='store_true', help='실제 네트워크로 요청하면서 픽스처를 저장')
+        parser.add_argument('--synthetic', action='store_true', help='합성 RSS/기사 픽스처를 새로 만든 뒤 측정')
+        parser.add_argument('--users', type=int, default=0, help='bench_NNN 사용자 N명을 준비 (등급 순환)')
+        parser.add_argument('--username', type=str, help='챗봇 측정에 쓸 사용자 (기본: 첫 bench 사용자)')
+        parser.add_argument('--chat', nargs='+', metavar='TEXT', default=DEFAULT_CHAT, help='챗봇 질문 목록')
+        parser.add_argument('--skip-daily', action='store_true', help='데일리 파이프라인 측정 생략')
+        parser.add_argument('--skip-chat', action='store_true', help='챗봇 측정 생략')
+        parser.add_argument('--cold', action='store_true', help='로컬 캐시 저장소를 비우고 시작')
+        parser.add_argument('--json', type=str, metavar='PATH', help='측정 결과를 JSON으로 저장')
+        parser.add_argument('--verbose', action='store_true', help='에이전트 디버그 출력 표시')
+
+    def handle(self, *args, **options):
+        # 에이전트/공용 모듈은 import 시점에 LLM 클라이언트와 설정 상수를 만들므로
+        # 환경 변수를 먼저 지정한 뒤 처음 import 한다 (모듈 import 때 지정하면 같은 프로세스 전체가 바뀐다)
+        for key, value in BENCH_ENV.items():
+            os.environ.setdefault(key, value)
+        from ...agents.news_find import FEEDS
+        from ...common import llm, localdb
+        # 같은 프로세스에서 이미 import된 뒤라면 환경 변수가 반영되지 않는다 (운영 설정으로 측정하지 않도록 중단)
+        for key, loaded in (("LLM_BACKEND", llm.LLM_BACKEND), ("AGENT_DB_PATH", localdb.AGENT_DB_PATH)):
+            if loaded != os.environ[key]:
+                raise CommandError(f"❌ 에이전트 모듈이 이미 {key}={loaded}로 로드되었습니다. 별도 프로세스에서 실행하세요.")
+
+        fixture_dir = Path(options['fixtures'])
+        http_fixtures.HTTP_FIXTURES_DIR = str(fixture_dir)
+        http_fixtures.HTTP_FIXTURES_MODE = "record" if options['record'] else "replay"
+        if options['synthetic']:
+            n = bench_fixtures.generate(str(fixture_dir), FEEDS)
+            self.stdout.write(f" - 합성 픽스처 생성: 기사 {n}건 -> {fixture_dir}")
+        if not options['record'] and not any(fixture_dir.glob("*.bin")):
+            raise CommandError(f"❌ 픽스처가 없습니다: {fixture_dir} (--synthetic 또는 --record 로 먼저 만드세요)")
+
+        if options['cold']:
+            self._clear_local_store()
+
+        self.verbose = options['verbose']
+        self.stdout.write(
+            f"🚀 LLM 백엔드: {llm.LLM_BACKEND} | 픽스처: {fixture_dir} ({http_fixtures.HTTP_FIXTURES_MODE}) | "
+            f"로컬 저장소: {localdb.AGENT_DB_PATH}"
+        )
+
+        # 가짜 LLM 출력으로 만든 Article/Summary/Term/Quiz가 실제 사용자 피드에 남지 않도록
+        # bench 사용자 준비부터 챗봇 측정까지 한 트랜잭션에서 돌리고 마지막에 롤백한다
+        with transaction.atomic():
+            results = self._run(options)
+            transaction.set_rollback(True)
+        self.stdout.write(" - DB 변경 롤백 완료")
+
+        for r in results:
+            self._report(r)
+
+        if options.get('json'):
+            Path(options['json']).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+            self.stdout.write(f" - 결과 저장: {options['json']}")
+
+    def _run(self, options):
+        users = self._ensure_users(options['users'])
+        results = []
+
+        if not options['skip_daily']:
+            usernames = self._bench_usernames(users)
+            results.append(self._measure("daily", lambda: call_command(
+                "run_daily_pipeline", usernames=usernames, stdout=io.StringIO())))
+
+        if not options['skip_chat']:
+            user = self._chat_user(options.get('username'), users)
+            from ...services import run_agent
+            for text in options['chat']:
+                results.append(self._measure(f"chat: {text}", lambda t=text: run_agent(user, t)))
+        return results
+
+    # -----------------------------------------------------------
+    # 준비
+    # -----------------------------------------------------------
+    def _clear_local_store(self):
+        from ...common import localdb
+        path = Path(localdb.AGENT_DB_PATH)
+        default = Path(localdb.__file__).resolve().parent.parent / ".cache" / "agent_store.sqlite3"
+        if path.resolve() == default:
+            raise CommandError("❌ 운영 로컬 저장소는 --cold 로 지울 수 없습니다. AGENT_DB_PATH를 따로 지정하세요.")
+        for p in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+            p.unlink(missing_ok=True)
+
+    def _ensure_users(self, n):
+        users = []
+        for i in range(n):
+            user, _ = User.objects.get_or_create(username=f"bench_{i:03d}")
+            Profile.objects.update_or_create(user=user, defaults={"score": BENCH_SCORES[i % len(BENCH_SCORES)]})
+            users.append(user)
+        if users:
+            self.stdout.write(f" - bench 사용자 {len(users)}명 준비")
+        return users
+
+    def _bench_usernames(self, users):
+        # 데일리 파이프라인은 bench_ 사용자만 처리한다 (실제 사용자 데이터는 건드리지 않음)
+        usernames = [u.username for u in users] or list(
+            User.objects.filter(username__startswith="bench_", is_active=True).values_list("username", flat=True)
+        )
+        if not usernames:
+            raise CommandError("❌ 데일리 측정에 쓸 bench 사용자가 없습니다. (--users N)")
+        return usernames
+
+    def _chat_user(self, username, users):
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f"❌ 사용자 '{username}'을(를) 찾을 수 없습니다.")
+        if users:
+            return users[0]
+        profile = Profile.objects.filter(user__is_active=True).select_related("user").first()
+        if profile is None:
+            raise CommandError("❌ 챗봇을 실행할 사용자가 없습니다. (--users N 또는 --username)")
+        return profile.user
+
+    # -----------------------------------------------------------
+    # 측정 / 보고
+    # -----------------------------------------------------------
+    def _measure(self, stage, fn):
+        from ...common.llm import llm_stats, reset_llm_stats
+        reset_llm_stats()
+        http_fixtures.stats.clear()
+        queries = [0]
+
+        def _count_query(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        error = None
+        quiet = nullcontext() if self.verbose else redirect_stdout(io.StringIO())
+        started = time.perf_counter()
+        with connection.execute_wrapper(_count_query), quiet:
+            try:
+                fn()
+            except Exception as e:
+                error = repr(e)
+        return {
+            "stage": stage,
+            "wall_sec": round(time.perf_counter() - started, 3),
+            "db_queries": queries[0],
+            "http": dict(http_fixtures.stats),
+            "llm": llm_stats(),
+            "error": error,
+        }
+
+    def _report(self, r):
+        llm = r["llm"]
+        http = r["http"]
+        line = (
+            f"\n[{r['stage']}] {r['wall_sec']:.2f}s | DB 쿼리 {r['db_queries']} | "
+            f"HTTP hit {http.get('hits', 0)} / miss {http.get('misses', 0)} / 기록 {http.get('recorded', 0)} | "
+            f"LLM 호출 {int(llm.get('total.calls', 0))} (재시도 {int(llm.get('total.retries', 0))}, "
+            f"실패 {int(llm.get('total.failures', 0))}, 대기 {llm.get('total.throttle_wait_sec', 0):.1f}s)"
+        )
+        self.stdout.write(self.style.ERROR(f"{line}\n   -> 오류: {r['error']}") if r["error"] else line)
+
+        labels = sorted({k.split(".", 1)[0] for k in llm} - {"total"})
+        for label in labels:
+            self.stdout.write(
+                f"    - {label:<14} {int(llm.get(f'{label}.calls', 0)):>4}회 | "
+                f"응답 {llm.get(f'{label}.latency_sec', 0):7.2f}s | "
+                f"재시도 {int(llm.get(f'{label}.retries', 0))} | 실패 {int(llm.get(f'{label}.failures', 0))}"
+            )
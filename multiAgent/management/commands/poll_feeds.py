@@ -0,0 +1,13 @@
+from dotenv import load_dotenv
+load_dotenv()
+from django.core.management.base import BaseCommand
+from ...agents import news_find
+
+
+class Command(BaseCommand):
+    help = 'RSS 증분 수집: 피드 워터마크 이후 새 기사만 본문 스크랩/색인 (수 분 간격 cron 용)'
+
+    def handle(self, *args, **options):
+        fresh = news_find.ingest_new_articles()
+        scraped = sum(1 for d in fresh if d.content)
+        self.stdout.write(self.style.SUCCESS(f"✅ 새 기사 {len(fresh)}건 / 본문 확보 {scraped}건"))
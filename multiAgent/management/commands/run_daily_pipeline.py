@@ -5,243 +5,242 @@ load_dotenv()
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
-from django.db.models import Max
+from django.db.models import F, Max, Window
+from django.db.models.functions import RowNumber
 from ...agents import news_find, news_summary, term_explain, quiz
+from ... import quiz_pool
 from accounts.models import Profile
 from article.models import Article
 from summary.models import Summary, SummaryGroup
-from quiz.models import QuizOption, ShortAnswerQuiz, MultipleChoiceQuiz, OXQuiz
 from term.models import Term
+from qna.models import QnA
 
 
 class Command(BaseCommand):
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--usernames',
+            nargs='+',
+            metavar='USERNAME',
+            help='지정한 사용자만 처리 (기본: 활성 사용자 전원)',
+        )
+
     def handle(self, *args, **options):
         print("🚀 데일리 파이프라인 (DB 연동 모드) 시작...")
 
         all_profiles = Profile.objects.filter(user__is_active=True)
+        if options.get('usernames'):
+            all_profiles = all_profiles.filter(user__username__in=options['usernames'])
         if not all_profiles:
             self.stdout.write("❌ 처리할 사용자가 없습니다.")
             return
-        
-        self.stdout.write(f"✅ 총 {len(all_profiles)}명의 사용자를 처리합니다.")
 
-        for profile in all_profiles:
-            self.stdout.write(f"\n--- [사용자: {profile.user.username}] 작업 시작 ---")
+        self.stdout.write(f"✅ 총 {len(all_profiles)}명의 사용자를 처리합니다.")
 
-            profile_dict = {
-                #"level": "숲", 
-                "level": profile.grade, 
-                "interests": ""
+        # -------------------------------------------------------
+        # STEP 0. 공용 뉴스 풀 수집 (실행당 1회: RSS + 본문 스크랩)
+        # -------------------------------------------------------
+        print("0️⃣ 공용 뉴스 풀 수집 중...")
+        daily_pool = news_find.ingest_daily_pool()
+        self.stdout.write(f"✅ 공용 풀 기사 {len(daily_pool)}건 확보")
+
+        # -------------------------------------------------------
+        # STEP 1. 사용자별 기사 선별 (공용 풀 1회 랭킹으로 전원 Top 3 계산)
+        # -------------------------------------------------------
+        print("1️⃣ 사용자별 뉴스 선별 중 (공용 풀 기반)...")
+        history_by_user = self._recent_questions([profile.user_id for profile in all_profiles])
+        profile_dicts = [
+            {
+                #"level": "숲",
+                "level": profile.grade,
+                "interests": "",
+                # 최근 챗봇 질문 -> 임베딩 유사도로 관심 기사 선별
+                "history": history_by_user.get(profile.user_id, []),
             }
-            state = {"context": {}}
-            
-            # -------------------------------------------------------
-            # STEP 1. 뉴스 수집 및 저장 (Article)
-            # -------------------------------------------------------
-            print("1️⃣ 뉴스 수집 중...")
-            articles = news_find.build_daily_top3(profile=profile_dict, state=state)
-            
-            saved_articles = []
-            saved_articles_orm = []
-            
+            for profile in all_profiles
+        ]
+        top3_by_user = news_find.rank_daily_top3(profile_dicts, daily_pool)
+        user_jobs = list(zip(all_profiles, profile_dicts, top3_by_user))
+
+        # -------------------------------------------------------
+        # STEP 2. (기사, 등급)별 요약/용어/퀴즈 생성 — 등급당 1회만 생성
+        # -------------------------------------------------------
+        artifacts = self._build_grade_artifacts(user_jobs)
+
+        # -------------------------------------------------------
+        # STEP 3. 사용자별 저장 (생성된 결과를 같은 등급 사용자에게 연결)
+        # -------------------------------------------------------
+        for profile, profile_dict, articles in user_jobs:
+            self.stdout.write(f"\n--- [사용자: {profile.user.username}] 저장 시작 ---")
+            self._save_for_user(profile, profile_dict, articles, artifacts)
+
+        self.stdout.write(self.style.SUCCESS("🎉 모든 사용자 작업 완료!"))
+
+    # -----------------------------------------------------------
+    # 사용자별 최근 챗봇 질문 (쿼리 1회, 사용자마다 최근 per_user건)
+    # -----------------------------------------------------------
+    def _recent_questions(self, user_ids, per_user=5):
+        history = {}
+        # 공용 LIMIT 하나로 자르면 질문이 많은 사용자가 다른 사용자 몫을 밀어내므로 사용자별로 번호를 매겨 자른다
+        rows = (QnA.objects.filter(user_id__in=user_ids)
+                .exclude(question="")
+                .annotate(rn=Window(RowNumber(), partition_by=[F("user_id")], order_by=F("id").desc()))
+                .filter(rn__lte=per_user)
+                .order_by("user_id", "rn")
+                .values_list("user_id", "question"))
+        for user_id, question in rows:
+            history.setdefault(user_id, []).append(question[:200])
+        return history
+
+    # -----------------------------------------------------------
+    # (기사 URL, 등급) -> 요약 dict (explanations, quizzes 포함)
+    # -----------------------------------------------------------
+    def _build_grade_artifacts(self, user_jobs):
+        articles_by_grade = {}
+        for _, profile_dict, articles in user_jobs:
+            bucket = articles_by_grade.setdefault(profile_dict["level"], {})
             for art in articles:
-                try:
-                    db_article = Article.objects.create(
-                        url=art["url"], 
-                        title=art["title"],
-                        content=art.get("content", "")[:5000],
-                        author=art.get("source", "Unknown"),
-                        journal=art.get("source", "Unknown"),
-                        created_at=art.get("source", "2001-01-01 11:11:11.111000"),
-                        user=profile.user
+                bucket.setdefault(art["url"], art)
+
+        # 여러 등급이 받는 기사는 등급별 요약을 한 번의 호출로 만들어 요약 캐시를 먼저 채운다
+        # (본문 토큰을 등급 수만큼 반복 전송하지 않음). 아래 등급별 요약은 캐시에서 바로 읽는다.
+        grades_by_url = {}
+        for grade, bucket in articles_by_grade.items():
+            for url, art in bucket.items():
+                grades_by_url.setdefault(url, (art, []))[1].append(grade)
+        multi_grade_jobs = [(art, grades) for art, grades in grades_by_url.values() if len(grades) > 1]
+        if multi_grade_jobs:
+            self.stdout.write(f"\n--- 2️⃣ 다중 등급 기사 {len(multi_grade_jobs)}건 등급별 요약 일괄 생성 중... ---")
+            news_summary.prefill_grade_summaries(multi_grade_jobs, user_profile={"interests": ""})
+
+        artifacts = {}
+        for grade, bucket in articles_by_grade.items():
+            grade_articles = list(bucket.values())
+            grade_profile = {"level": grade, "interests": ""}
+            self.stdout.write(f"\n--- 2️⃣ [등급: {grade}] 기사 {len(grade_articles)}건 요약/용어/퀴즈 생성 중... ---")
+
+            state = {"context": {"daily_pool": grade_articles, "selected_articles": grade_articles}}
+            summaries = news_summary.build_daily_summaries(state=state, profile=grade_profile)
+            term_explain.build_daily_term_explanations(state={"context": {"summaries": summaries}}, profile=grade_profile)
+            quiz.build_daily_quizzes(state={"context": {"summaries": summaries}}, profile=grade_profile)
+
+            for art, summ in zip(grade_articles, summaries):
+                artifacts[(art["url"], grade)] = summ
+
+        return artifacts
+
+    # -----------------------------------------------------------
+    # 사용자 1명분 Article / Summary / Term / Quiz 저장
+    # -----------------------------------------------------------
+    def _save_for_user(self, profile, profile_dict, articles, artifacts):
+        saved_articles_orm = []
+
+        for art in articles:
+            try:
+                db_article = Article.objects.create(
+                    url=art["url"],
+                    title=art["title"],
+                    content=art.get("content", "")[:5000],
+                    author=art.get("source", "Unknown"),
+                    journal=art.get("source", "Unknown"),
+                    created_at=art.get("source", "2001-01-01 11:11:11.111000"),
+                    user=profile.user
+                )
+                saved_articles_orm.append((art, db_article))
+
+                # if created:
+                #     self.stdout.write(self.style.SUCCESS(f"   -> 기사 저장 완료 (ID: {db_article.pk})"))
+                # else:
+                #     self.stdout.write(f"   -> 기사 중복/조회 (ID: {db_article.pk})")
+            except Exception as e:
+                self.stderr.write(f"   -> 기사 저장 DB 오류: {e}")
+                traceback.print_exc()
+
+        if not saved_articles_orm:
+            print("❌ 저장된 기사가 하나도 없습니다. 이 사용자는 건너뜁니다.")
+            return
+
+        total_quiz_count = 0
+        success_quiz_count = 0
+
+        for art, article_orm_object in saved_articles_orm:
+            summ = artifacts.get((art["url"], profile_dict["level"]))
+            if not summ:
+                self.stderr.write(f"   -> [오류] 기사에 해당하는 요약이 없습니다. 건너뜁니다. ({art['title'][:10]}...)")
+                continue
+
+            terms_payload = [
+                    {"term": t["term"], "meaning": t["definition"]}
+                    for t in summ.get("explanations", [])
+                ]
+            try:
+                with transaction.atomic():
+
+                    today = timezone.localdate()
+
+                    last_index_data = SummaryGroup.objects.filter(date=today).aggregate(max_index=Max('group_index'))
+                    last_index = last_index_data.get('max_index')
+
+                    if last_index is None:
+                        next_index = 1
+                    else:
+                        next_index = last_index + 1
+
+                    new_summary_group = SummaryGroup.objects.create(date=today, group_index=next_index)
+
+                    db_summary = Summary.objects.create(
+                        article=article_orm_object,
+                        title=summ["title"],
+                        content=summ["summary_5sentences"],
+                        group=new_summary_group
                     )
-                    art["db_id"] = db_article.pk
-                    saved_articles.append(art)
-                    saved_articles_orm.append(db_article)
-
-                    # if created:
-                    #     self.stdout.write(self.style.SUCCESS(f"   -> 기사 저장 완료 (ID: {db_article.pk})"))
-                    # else:
-                    #     self.stdout.write(f"   -> 기사 중복/조회 (ID: {db_article.pk})")
-                except Exception as e:
-                    self.stderr.write(f"   -> 기사 저장 DB 오류: {e}")
-                    traceback.print_exc()
-
-            if not saved_articles:
-                print("❌ 저장된 기사가 하나도 없습니다. 파이프라인을 종료합니다.")
-                return
-
-            # -------------------------------------------------------
-            # STEP 2. 요약 및 용어 생성 및 저장 (Summary + Terms)
-            # -------------------------------------------------------
-            self.stdout.write(f"--- 2️⃣ [사용자: {profile.user.username}] 요약/용어 생성 중... ---")
-
-            state["context"]["daily_pool"] = saved_articles
-            state["context"]["selected_articles"] = saved_articles
-            
-            summaries = news_summary.build_daily_summaries(state=state, profile=profile_dict)
-            
-            term_explain.build_daily_term_explanations(state={"context": {"summaries": summaries}}, profile=profile_dict)
-
-            saved_summaries_orm = [] 
-            saved_summaries_with_db_id = []
-
-            for i, summ in enumerate(summaries):
-                try:
-                    article_orm_object = saved_articles_orm[i]
-                except IndexError:
-                    self.stderr.write(f"   -> [오류] 기사(STEP 1)와 요약(STEP 2) 개수가 불일치. 건너뜁니다.")
-                    continue
-                terms_payload = [
-                        {"term": t["term"], "meaning": t["definition"]}
-                        for t in summ.get("explanations", [])
-                    ]
-                try:
-                    with transaction.atomic():
-
-                        today = timezone.localdate()
-        
-                        last_index_data = SummaryGroup.objects.filter(date=today).aggregate(max_index=Max('group_index'))
-                        last_index = last_index_data.get('max_index')
-
-                        if last_index is None:
-                            next_index = 1
-                        else:
-                            next_index = last_index + 1
-
-                        new_summary_group = SummaryGroup.objects.create(date=today, group_index=next_index)
-
-                        db_summary = Summary.objects.create(
-                            article=article_orm_object, 
-                            title=summ["title"],
-                            content=summ["summary_5sentences"],
-                            group=new_summary_group
+
+                    term_objects_to_link = []
+                    for t_data in terms_payload:
+                        term_obj, _ = Term.objects.get_or_create(
+                            term=t_data["term"],
+                            defaults={'meaning': t_data["meaning"]}
                         )
+                        term_objects_to_link.append(term_obj)
+
+                    if term_objects_to_link:
+                        db_summary.terms.set(term_objects_to_link)
+
+                self.stdout.write(self.style.SUCCESS(f"   -> 요약/용어 저장 완료 (ID: {db_summary.pk})"))
+
+            except Exception as e:
+                self.stderr.write(f"   -> 요약/용어 저장 DB 오류: {e}")
+                traceback.print_exc()
+                continue
+
+            questions = summ.get("quizzes", [])
+            total_quiz_count += len(questions)
+            # 등급 없음은 build_daily_quizzes가 '새싹' 설정으로 만들므로 풀에도 '새싹'으로 저장 (챗봇 조회 키와 일치)
+            success_quiz_count += self._save_quizzes(db_summary, questions, profile_dict["level"] or "새싹")
+
+        self.stdout.write(f"✅ [사용자: {profile.user.username}] 퀴즈 저장 시도: {total_quiz_count}개 / 저장 성공: {success_quiz_count}개")
+
+    # -----------------------------------------------------------
+    # 요약 1건에 딸린 퀴즈 저장 -> 저장 성공 개수 반환
+    # -----------------------------------------------------------
+    def _save_quizzes(self, summary_orm_object, questions, grade=None):
+        success_quiz_count = 0
+
+        for q in questions:
+            q_type_from_agent = q["type"]
+
+            try:
+                # 등급을 함께 저장해 두면 챗봇 퀴즈 요청이 LLM 호출 없이 이 풀에서 출제한다
+                db_quiz = quiz_pool.create_quiz(summary_orm_object, q, grade)
+                success_quiz_count += 1
+                self.stdout.write(self.style.SUCCESS(f"    -> {q_type_from_agent} 퀴즈 1개 저장 완료 (ID: {db_quiz.pk})"))
+
+            except quiz_pool.QuizRejected as e:
+                self.stdout.write(f"    -> [경고] {e}. 스킵.")
+
+            except Exception as e:
+                self.stderr.write(f"    -> 퀴즈 저장 DB 오류 ({q_type_from_agent}): {e}")
+                traceback.print_exc()
 
-                        term_objects_to_link = []
-                        for t_data in terms_payload:
-                            term_obj, _ = Term.objects.get_or_create(
-                                term=t_data["term"],
-                                defaults={'meaning': t_data["meaning"]}
-                            )
-                            term_objects_to_link.append(term_obj)
-
-                        if term_objects_to_link:
-                            db_summary.terms.set(term_objects_to_link)
-
-                    # 4. [공통] 성공 시 처리 (daily_job.py와 동일)
-                    summ["db_id"] = db_summary.pk
-                    saved_summaries_with_db_id.append(summ)
-                    saved_summaries_orm.append(db_summary)
-
-                    self.stdout.write(self.style.SUCCESS(f"   -> 요약/용어 저장 완료 (ID: {db_summary.pk})"))
-                
-                except Exception as e:
-                    self.stderr.write(f"   -> 요약/용어 저장 DB 오류: {e}")
-                    traceback.print_exc()
-
-            # -------------------------------------------------------
-            # STEP 3. 퀴즈 생성 및 저장 (Quiz)
-            # -------------------------------------------------------
-            self.stdout.write(f"--- 3️⃣ [사용자: {profile.user.username}] 퀴즈 생성 중... ---")
-
-            # AI 에이전트 호출 (daily_job.py와 동일)
-            state['context']['summaries'] = saved_summaries_with_db_id
-            all_quizzes_from_agent = quiz.build_daily_quizzes(state=state, profile=profile_dict)
-
-            # 💡 [수정] 'db_id' 맵 대신, 'Summary ORM 객체' 맵을 사용
-            summary_orm_map = {s.title: s for s in saved_summaries_orm}
-
-            total_quiz_count = 0
-            success_quiz_count = 0
-
-            for quiz_group in all_quizzes_from_agent:
-                title = quiz_group["title"]
-                
-                # 💡 [수정] ID 대신 ORM 객체를 가져옴
-                summary_orm_object = summary_orm_map.get(title) 
-                
-                if not summary_orm_object:
-                    self.stdout.write(f"   -> 스킵: 일치하는 요약(ORM)이 없음 (기사: {title[:10]}...)")
-                    continue
-
-                for q in quiz_group["questions"]:
-                    total_quiz_count += 1
-                    
-                    q_type_from_agent = q["type"]
-                    
-                    try:
-                        if q_type_from_agent == "OX":
-                            ans_val = str(q["answer"]).upper()
-                            correct_bool = (ans_val in ["O", "TRUE", "1"])
-                            
-                            db_quiz = OXQuiz.objects.create(
-                                summary=summary_orm_object,
-                                question=q["question"],
-                                explanation=q.get("explanation", ""),
-                                correct_answer=correct_bool
-                            )
-                            
-                        elif q_type_from_agent == "ShortAnswer":
-                            db_quiz = ShortAnswerQuiz.objects.create(
-                                summary=summary_orm_object,
-                                question=q["question"],
-                                explanation=q.get("explanation", ""),
-                                correct_answer=str(q["answer"])
-                            )
-
-                        elif q_type_from_agent == "MC4":
-                            options_payload = q.get("options", [])
-                            correct_answer_text = str(q["answer"]) 
-                            
-                            if len(options_payload) != 4:
-                                 self.stdout.write(f"    -> [경고] MC4 퀴즈 보기 4개 아님. 스킵.")
-                                 continue 
-
-                            correct_count = 0
-                            options_to_create = []
-                            for idx, opt_text in enumerate(options_payload):
-                                is_correct = (str(opt_text) == correct_answer_text)
-                                if is_correct: 
-                                    correct_count += 1
-                                
-                                options_to_create.append(
-                                    QuizOption(
-                                        text=opt_text,
-                                        order=idx + 1,
-                                        is_correct=is_correct
-                                    )
-                                )
-                            
-                            if correct_count != 1:
-                                self.stdout.write(f"    -> [경고] MC4 퀴즈 정답 1개 아님. 스킵.")
-                                continue
-                            
-                            with transaction.atomic():
-                                db_quiz = MultipleChoiceQuiz.objects.create(
-                                    summary=summary_orm_object,
-                                    question=q["question"],
-                                    explanation=q.get("explanation", ""),
-                                    choice_type=MultipleChoiceQuiz.TYPE_MC4
-                                )
-                                
-                                for opt in options_to_create:
-                                    opt.quiz = db_quiz
-
-                                QuizOption.objects.bulk_create(options_to_create)
-                        
-                        else:
-                            self.stdout.write(f"   -> 알 수 없는 퀴즈 유형: {q_type_from_agent}")
-                            continue
-
-                        success_quiz_count += 1
-                        self.stdout.write(self.style.SUCCESS(f"    -> {q_type_from_agent} 퀴즈 1개 저장 완료 (ID: {db_quiz.pk})"))
-
-                    except Exception as e:
-                        self.stderr.write(f"    -> 퀴즈 저장 DB 오류 ({q_type_from_agent}): {e}")
-                        traceback.print_exc()
-
-            self.stdout.write(f"✅ [사용자: {profile.user.username}] 퀴즈 생성 시도: {total_quiz_count}개 / 저장 성공: {success_quiz_count}개")
-        
-        self.stdout.write(self.style.SUCCESS("🎉 모든 사용자 작업 완료!"))
\ No newline at end of file
+        return success_quiz_count
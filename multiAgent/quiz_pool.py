@@ -0,0 +1,151 @@
+"""
+quiz_pool.py — 데일리 파이프라인이 미리 만들어 둔 퀴즈를 챗봇에 내주는 DB 퀴즈 풀
+
+(요약, 등급, 유형)별로 저장된 OXQuiz / MultipleChoiceQuiz / ShortAnswerQuiz 중
+사용자가 이미 푼 문제(UserQuizAnswer)와 챗봇이 이미 낸 문제(ServedQuiz)를 빼고 하나를 고른다.
+챗봇 요청은 대화 맥락 없이 들어오므로 출제 기록은 서버(DB)에 남긴다.
+에이전트(quiz.py)는 Django를 모르므로 services.py가 이 모듈의 함수를 quiz.register_quiz_pool로 등록한다.
+"""
+from typing import Any, Dict, List, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+
+from accounts.models import Profile
+from quiz.models import MultipleChoiceQuiz, OXQuiz, QuizOption, ServedQuiz, ShortAnswerQuiz, UserQuizAnswer
+from summary.models import Summary
+
+# 에이전트 퀴즈 유형 -> (DB 모델, 에이전트 쪽 Pydantic 모델 이름)
+POOL_MODELS = {
+    "OX": (OXQuiz, "OXQuiz"),
+    "MC4": (MultipleChoiceQuiz, "MultipleChoice4"),
+    "ShortAnswer": (ShortAnswerQuiz, "ShortAnswer"),
+}
+
+
+class QuizRejected(ValueError):
+    """저장할 수 없는 퀴즈 (보기 수/정답 수 오류, 알 수 없는 유형)"""
+
+
+# -----------------------------------------------------------
+# 저장 (데일리 파이프라인 / 풀 보충 공용)
+# -----------------------------------------------------------
+def create_quiz(summary: Summary, q: Dict[str, Any], grade: Optional[str] = ""):
+    """build_daily_quizzes 형식의 퀴즈 dict 1개를 저장하고 DB 객체를 돌려준다."""
+    q_type = q["type"]
+    common = {"summary": summary, "question": q["question"], "explanation": q.get("explanation", ""),
+              "grade": grade or ""}
+
+    if q_type == "OX":
+        return OXQuiz.objects.create(correct_answer=str(q["answer"]).upper() in ["O", "TRUE", "1"], **common)
+
+    if q_type == "ShortAnswer":
+        return ShortAnswerQuiz.objects.create(correct_answer=str(q["answer"]), **common)
+
+    if q_type == "MC4":
+        options_payload = q.get("options", [])
+        if len(options_payload) != 4:
+            raise QuizRejected("MC4 퀴즈 보기 4개 아님")
+        correct_answer_text = str(q["answer"])
+        options = [QuizOption(text=opt, order=idx + 1, is_correct=(str(opt) == correct_answer_text))
+                   for idx, opt in enumerate(options_payload)]
+        if sum(o.is_correct for o in options) != 1:
+            raise QuizRejected("MC4 퀴즈 정답 1개 아님")
+        with transaction.atomic():
+            db_quiz = MultipleChoiceQuiz.objects.create(choice_type=MultipleChoiceQuiz.TYPE_MC4, **common)
+            for opt in options:
+                opt.quiz = db_quiz
+            QuizOption.objects.bulk_create(options)
+        return db_quiz
+
+    raise QuizRejected(f"알 수 없는 퀴즈 유형: {q_type}")
+
+
+# -----------------------------------------------------------
+# 조회 (챗봇 출제)
+# -----------------------------------------------------------
+def pool_grade(user_id: int) -> str:
+    """퀴즈 풀 등급 키: 사용자 등급. 등급 없음(점수 0)/프로필 없음은 데일리 퀴즈와 같이 '새싹'"""
+    profile = Profile.objects.filter(user_id=user_id).first()
+    return (profile.grade if profile else None) or "새싹"
+
+
+def _to_active_quiz(db_quiz, type_str: str) -> Dict[str, Any]:
+    """DB 퀴즈 -> quiz.handle의 active_quiz 형식 (Pydantic model_dump + type_str)"""
+    data: Dict[str, Any] = {"question": db_quiz.question, "rationale": db_quiz.explanation, "type_str": type_str}
+    if isinstance(db_quiz, OXQuiz):
+        data["answer"] = db_quiz.correct_answer
+    elif isinstance(db_quiz, MultipleChoiceQuiz):
+        options = list(db_quiz.options.all())  # prefetch (order 순)
+        data["options"] = [o.text for o in options]
+        data["answer_index"] = next((i for i, o in enumerate(options) if o.is_correct), -1)
+    else:
+        data["answer"] = [a.strip() for a in db_quiz.correct_answer.split(",") if a.strip()]
+    data["pool_id"] = f"{db_quiz._meta.model_name}:{db_quiz.pk}"
+    return data
+
+
+def take_quiz(user_id: int, quiz_type: str, urls: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    사용자 등급(pool_grade)의 풀에서 퀴즈 1개를 꺼내 출제 기록(ServedQuiz)을 남긴다.
+    urls가 있으면 그 기사들의 요약, 없으면 사용자의 데일리 요약에서 찾는다. 없으면 None.
+    """
+    if quiz_type not in POOL_MODELS or not user_id:
+        return None
+    model, type_str = POOL_MODELS[quiz_type]
+    content_type = ContentType.objects.get_for_model(model)
+
+    qs = model.objects.filter(grade=pool_grade(user_id), summary__isnull=False)
+    if urls:
+        qs = qs.filter(summary__article__url__in=urls)
+    else:
+        qs = qs.filter(summary__article__user_id=user_id)
+
+    # 이미 푼/낸 문제는 id로, 같은 기사를 받은 다른 사용자 사본은 질문 문장으로 제외
+    for seen_model in (UserQuizAnswer, ServedQuiz):
+        seen = seen_model.objects.filter(user_id=user_id, content_type=content_type).values("object_id")
+        qs = qs.exclude(pk__in=seen).exclude(question__in=model.objects.filter(pk__in=seen).values("question"))
+
+    if model is MultipleChoiceQuiz:
+        qs = qs.prefetch_related("options")
+    # ORDER BY RAND()는 후보 전체를 정렬하므로 쓰지 않는다. 이미 낸 문제는 빠지므로 pk 순으로도 매번 새 문제가 나온다.
+    db_quiz = qs.order_by("pk").first()
+    if db_quiz is None:
+        return None
+    ServedQuiz.objects.get_or_create(user_id=user_id, content_type=content_type, object_id=db_quiz.pk)
+    return _to_active_quiz(db_quiz, type_str)
+
+
+def has_summary(url: str) -> bool:
+    """
+    풀 보충 전에 확인: 요약(Summary)은 데일리 파이프라인만 만들므로 채팅에서 찾은 기사는 없을 수 있다.
+    store_quizzes와 같이 보충 스레드에서 호출되므로 끝나면 커넥션을 닫는다.
+    """
+    try:
+        return bool(url) and Summary.objects.filter(article__url=url).exists()
+    finally:
+        connection.close()
+
+
+def store_quizzes(user_id: int, quiz_type: str, url: str, quizzes: List[Dict[str, Any]]) -> int:
+    """
+    풀 보충: 기사 url의 요약(사용자 본인 것 우선)에 사용자 등급(pool_grade)으로 퀴즈를 저장하고 저장 개수를 돌려준다.
+    quiz.py의 백그라운드 스레드에서 호출되므로 끝나면 이 스레드의 DB 커넥션을 닫는다.
+    """
+    try:
+        summaries = Summary.objects.filter(article__url=url)
+        summary = (summaries.filter(article__user_id=user_id).order_by("-id").first()
+                   or summaries.order_by("-id").first())
+        if summary is None:
+            return 0
+        grade = pool_grade(user_id)
+        saved = 0
+        for q in quizzes:
+            try:
+                create_quiz(summary, q, grade)
+                saved += 1
+            except QuizRejected:
+                continue
+        return saved
+    finally:
+        connection.close()
@@ -2,6 +2,8 @@ import traceback
 from langchain_core.messages import HumanMessage, AIMessage
 from accounts.models import Profile
 from .graph_app import APP 
+from .agents import quiz
+from . import quiz_pool
 from django.forms.models import model_to_dict
 from typing import Dict, TypedDict, Any, Annotated, List, Optional
 from langgraph.graph.message import add_messages
@@ -18,6 +20,10 @@ class GraphState(TypedDict):
     context: Dict[str, Any]
     profile: Dict[str, Any]
 
+# 챗봇 퀴즈는 데일리 파이프라인이 저장해 둔 DB 퀴즈 풀에서 먼저 출제한다
+quiz.register_quiz_pool(quiz_pool.take_quiz, quiz_pool.has_summary, quiz_pool.store_quizzes)
+
+
 def run_agent(user, question_text, context=None):
     """
     Django View에서 호출하는 AI 에이전트 실행 함수 (1회 실행)
@@ -38,8 +44,6 @@ def run_agent(user, question_text, context=None):
         print(f"[AI Service] 프로필 조회 실패 (기본값 '씨앗' 사용): {e}")
         user_grade = "숲"
 
-    print(f"[AI Service] 사용자: {user.username} | 등급: {user_grade}")
-
         
     # profile_data = {
     #     "username": user.username,
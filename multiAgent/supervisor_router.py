@@ -1,6 +1,11 @@
 from typing import List, Literal, Dict, Any
 from pydantic import BaseModel
-from langchain_openai import ChatOpenAI
+
+try:
+    from .common.llm import get_structured_model, invoke_llm
+except ImportError:
+    # cli_main 등 multiAgent 디렉터리에서 단독 실행하는 경우
+    from common.llm import get_structured_model, invoke_llm
 
 # ✅ 여러 단계를 순서대로 반환하도록 수정
 class RouteDecision(BaseModel):
@@ -45,15 +50,15 @@ def classify_intent(user_text: str, context: Dict[str, Any] = {}) -> List[str]:
     if is_quiz_active:
         print(f"[DBG router] Quiz is ACTIVE. Prioritizing 'quiz' intent for answers.")
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0).with_structured_output(RouteDecision)
+    llm = get_structured_model(RouteDecision, "gpt-4o-mini", temperature=0)
     
     # 시스템 프롬프트에 상태 주입
     system_prompt = SYSTEM_TEMPLATE.format(is_quiz_active=str(is_quiz_active))
     
-    out = llm.invoke([
+    out = invoke_llm(llm, [
         {"role":"system","content": system_prompt},
         {"role":"user","content": user_text or ""},
-    ])
+    ], label="router")
     
     intents = getattr(out, "intents", None)
     if intents is None:
@@ -0,0 +1,37 @@
+"""
+multiAgent 단위 테스트 (Django 없이 실행: python -m pytest multiAgent/tests)
+
+로컬 저장소(sqlite)를 쓰는 모듈은 LocalStoreTestCase로 테스트마다 임시 파일을 쓴다.
+"""
+import os
+import tempfile
+import unittest
+
+from multiAgent.common import localdb
+
+FIXTURE_HTTP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "http")
+
+
+def reset_local_store() -> None:
+    conn = getattr(localdb._local, "conn", None)
+    if conn is not None:
+        conn.close()
+        localdb._local.conn = None
+    localdb._applied_schemas.clear()
+
+
+class LocalStoreTestCase(unittest.TestCase):
+    """테스트마다 빈 임시 AGENT_DB_PATH (운영 로컬 저장소는 건드리지 않는다)"""
+
+    def setUp(self):
+        super().setUp()
+        self._store_dir = tempfile.TemporaryDirectory()
+        self._prev_db_path = localdb.AGENT_DB_PATH
+        reset_local_store()
+        localdb.AGENT_DB_PATH = os.path.join(self._store_dir.name, "agent_store.sqlite3")
+
+    def tearDown(self):
+        reset_local_store()
+        localdb.AGENT_DB_PATH = self._prev_db_path
+        self._store_dir.cleanup()
+        super().tearDown()
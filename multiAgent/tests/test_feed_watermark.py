@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from multiAgent.common import feed_watermark
+from multiAgent.tests import LocalStoreTestCase
+
+FEED = "https://feed.example/rss"
+DAY = feed_watermark.STALE_SKEW_SEC
+
+
+@dataclass
+class _Doc:
+    url: str
+    published_at: int = 0
+
+
+class FilterNewTest(LocalStoreTestCase):
+    def test_everything_is_new_for_unknown_feed(self):
+        docs = [_Doc("https://a/1", 100), _Doc("https://a/2")]
+        self.assertEqual(feed_watermark.filter_new(FEED, docs), docs)
+
+    def test_seen_links_and_stale_items_are_skipped(self):
+        now = 10 * DAY
+        feed_watermark.advance(FEED, [_Doc("https://a/1", now), _Doc("https://a/2", now - 3600)])
+        docs = [
+            _Doc("https://a/1", now),              # 이미 처리
+            _Doc("https://a/3", now + 60),         # 새 항목
+            _Doc("https://a/4", now - 3600),       # 워터마크보다 조금 과거 (늦게 올라온 기사) -> 새 항목
+            _Doc("https://a/5", now - 2 * DAY),    # 너무 오래됨
+            _Doc("https://a/6"),                   # 발행 시각 없음 -> 링크로만 판단
+        ]
+        self.assertEqual([d.url for d in feed_watermark.filter_new(FEED, docs)],
+                         ["https://a/3", "https://a/4", "https://a/6"])
+
+    def test_advance_keeps_latest_timestamp_and_caps_seen_links(self):
+        feed_watermark.advance(FEED, [_Doc("https://a/new", 500)])
+        feed_watermark.advance(FEED, [_Doc("https://a/old", 100)])
+        wm = feed_watermark.get(FEED)
+        self.assertEqual(wm.last_published, 500)
+        self.assertEqual(wm.seen_links, ["https://a/old", "https://a/new"])
+
+        feed_watermark.advance(FEED, [_Doc(f"https://a/{i}") for i in range(feed_watermark.MAX_SEEN_LINKS + 10)])
+        self.assertEqual(len(feed_watermark.get(FEED).seen_links), feed_watermark.MAX_SEEN_LINKS)
+
+    def test_feeds_are_independent(self):
+        feed_watermark.advance(FEED, [_Doc("https://a/1", 100)])
+        self.assertEqual(len(feed_watermark.filter_new("https://other/rss", [_Doc("https://a/1", 100)])), 1)
@@ -0,0 +1,78 @@
+import unittest
+from unittest import mock
+
+from multiAgent.common import llm_retry
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = mock.Mock(status_code=status_code, headers=headers or {})
+
+
+class LLMRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.sleep = mock.patch.object(llm_retry.time, "sleep").start()
+        mock.patch.object(llm_retry, "limiter", llm_retry.RateLimiter(rpm=10 ** 6, tpm=10 ** 9)).start()
+        self.addCleanup(mock.patch.stopall)
+        llm_retry.reset_llm_stats()
+
+    def _flaky(self, *errors, result="ok"):
+        calls = iter(errors)
+
+        def fn():
+            e = next(calls, None)
+            if e is not None:
+                raise e
+            return result
+        return fn
+
+    def test_classification(self):
+        self.assertTrue(llm_retry.is_rate_limited(_HTTPError(429)))
+        self.assertTrue(llm_retry.is_retryable(_HTTPError(503)))
+        self.assertTrue(llm_retry.is_retryable(TimeoutError()))
+        self.assertFalse(llm_retry.is_retryable(_HTTPError(400)))
+        self.assertFalse(llm_retry.is_retryable(ValueError("parse")))
+
+    def test_retry_after_headers(self):
+        self.assertEqual(llm_retry._retry_after(_HTTPError(429, {"retry-after-ms": "1500"})), 1.5)
+        self.assertEqual(llm_retry._retry_after(_HTTPError(429, {"retry-after": "2"})), 2.0)
+        self.assertIsNone(llm_retry._retry_after(_HTTPError(429, {"retry-after": "soon"})))
+
+    def test_backoff_is_capped_with_jitter(self):
+        for attempt in range(12):
+            d = llm_retry.backoff_delay(attempt)
+            full = min(llm_retry.LLM_BACKOFF_MAX_SEC, llm_retry.LLM_BACKOFF_BASE_SEC * 2 ** attempt)
+            self.assertTrue(full * 0.5 <= d <= full)
+
+    def test_retries_transient_errors_then_succeeds(self):
+        out = llm_retry.call_with_retry(self._flaky(_HTTPError(500), TimeoutError()), label="t")
+        self.assertEqual(out, "ok")
+        stats = llm_retry.llm_stats()
+        self.assertEqual((stats["t.calls"], stats["t.retries"]), (3, 2))
+        self.assertNotIn("t.failures", stats)
+
+    def test_rate_limit_waits_at_least_retry_after(self):
+        llm_retry.call_with_retry(self._flaky(_HTTPError(429, {"retry-after": "45"})), label="t")
+        # 백오프 대기 후 다음 예약도 limiter.pause 때문에 막힌다
+        self.assertGreaterEqual(max(c.args[0] for c in self.sleep.call_args_list), 45)
+        self.assertEqual(llm_retry.llm_stats()["t.rate_limited"], 1)
+
+    def test_non_retryable_raises_immediately(self):
+        with self.assertRaises(ValueError):
+            llm_retry.call_with_retry(self._flaky(ValueError("bad json")), label="t")
+        stats = llm_retry.llm_stats()
+        self.assertEqual((stats["t.calls"], stats["t.failures"]), (1, 1))
+        self.sleep.assert_not_called()
+
+    def test_gives_up_after_max_attempts(self):
+        with self.assertRaises(_HTTPError):
+            llm_retry.call_with_retry(self._flaky(*[_HTTPError(502)] * 5), label="t", max_attempts=3)
+        self.assertEqual(llm_retry.llm_stats()["t.calls"], 3)
+
+    def test_token_bucket_reports_wait_when_empty(self):
+        bucket = llm_retry.TokenBucket(60)  # 초당 1
+        self.assertEqual(bucket.reserve(60, now=bucket.updated), 0.0)
+        self.assertAlmostEqual(bucket.reserve(2, now=bucket.updated), 2.0)
+        self.assertAlmostEqual(bucket.reserve(1, now=bucket.updated + 3), 0.0)
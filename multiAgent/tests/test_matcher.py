@@ -0,0 +1,32 @@
+import unittest
+
+from multiAgent.common import matcher
+
+
+class InterestMatcherTest(unittest.TestCase):
+    def test_counts_case_insensitive_and_keeps_original_labels(self):
+        m = matcher.InterestMatcher(["AI", "반도체"])
+        self.assertEqual(m.count("ai 반도체와 AI 서버", "반도체 수출"), {"AI": 2, "반도체": 2})
+
+    def test_overlapping_prefix_patterns_are_both_counted(self):
+        m = matcher.InterestMatcher(["삼성", "삼성전자"])
+        self.assertEqual(m.count("삼성전자 실적"), {"삼성": 1, "삼성전자": 1})
+
+    def test_empty_matcher(self):
+        m = matcher.InterestMatcher(["", "  "])
+        self.assertFalse(m)
+        self.assertEqual(m.count("아무 기사"), {})
+        self.assertFalse(m.matches("아무 기사"))
+
+    def test_get_matcher_reuses_compiled_matcher_per_interest_set(self):
+        self.assertIs(matcher.get_matcher(["금리", "환율"]), matcher.get_matcher(["환율", "금리", ""]))
+
+    def test_regex_fallback_matches_automaton_semantics(self):
+        prev = matcher.ahocorasick
+        matcher.ahocorasick = None
+        try:
+            m = matcher.InterestMatcher(["금리", "기준금리", "ETF"])
+            self.assertEqual(m.count("기준금리 동결, 금리 인하 기대에 etf 자금 유입"),
+                             {"금리": 2, "기준금리": 1, "ETF": 1})
+        finally:
+            matcher.ahocorasick = prev
@@ -0,0 +1,48 @@
+import unittest
+
+from multiAgent.common import near_dup
+
+# 같은 통신 기사를 두 매체가 받아 쓴 경우: 바이라인/저작권 문구가 다르고 리드 한 단어, 마지막 문장이 바뀐다
+WIRE = (
+    "(서울=연합뉴스) 김철수 기자 = 한국은행 금융통화위원회가 기준금리를 연 3.25%로 동결했다. "
+    "소비자물가 상승률이 2%대 초반으로 내려왔지만 수도권 주택담보대출 증가세가 이어진 점이 발목을 잡았다. "
+    "총재는 기자간담회에서 금리 인하 시점은 가계부채 흐름과 환율을 함께 보고 판단하겠다고 말했다. "
+    "시장에서는 연내 한 차례 인하 가능성을 여전히 높게 보고 있다. "
+    "채권시장에서는 국고채 3년물 금리가 소폭 하락했다. "
+    "kcs@yna.co.kr 저작권자(c) 연합뉴스, 무단 전재-재배포 금지"
+)
+REPRINT = (
+    "한국은행 금융통화위원회가 기준금리를 연 3.25%로 동결했다고 밝혔다. "
+    "소비자물가 상승률이 2%대 초반으로 내려왔지만 수도권 주택담보대출 증가세가 이어진 점이 발목을 잡았다. "
+    "총재는 기자간담회에서 금리 인하 시점은 가계부채 흐름과 환율을 함께 보고 판단하겠다고 말했다. "
+    "시장에서는 연내 한 차례 인하 가능성을 여전히 높게 보고 있다. "
+    "한국경제 이영희 기자 lee@hankyung.com ⓒ 한국경제, 무단전재 및 재배포 금지"
+)
+# 같은 매체(같은 저작권 문구)의 다른 기사
+OTHER = (
+    "(서울=연합뉴스) 김철수 기자 = 원·달러 환율이 장중 1,400원을 넘어서며 약 반년 만에 최고 수준을 기록했다. "
+    "미국 국채 금리 상승과 달러 강세가 겹치면서 외국인 투자자의 주식 순매도가 늘었다. "
+    "환율이 오르면 원유와 곡물 같은 수입 원자재 가격이 올라 국내 물가에 부담이 된다. "
+    "외환당국은 시장 변동성이 과도할 경우 안정 조치를 하겠다는 구두 개입에 나섰다. "
+    "kcs@yna.co.kr 저작권자(c) 연합뉴스, 무단 전재-재배포 금지"
+)
+
+
+class NearDupTest(unittest.TestCase):
+    def test_fixture_texts_are_long_enough_to_compare(self):
+        for text in (WIRE, REPRINT, OTHER):
+            self.assertGreaterEqual(len(text), near_dup.NEAR_DUP_MIN_CHARS)
+
+    def test_reprint_from_other_feed_is_duplicate(self):
+        d = near_dup.hamming(near_dup.simhash(WIRE), near_dup.simhash(REPRINT))
+        self.assertLessEqual(d, near_dup.NEAR_DUP_MAX_DISTANCE)
+
+    def test_different_story_same_outlet_is_not_duplicate(self):
+        d = near_dup.hamming(near_dup.simhash(WIRE), near_dup.simhash(OTHER))
+        self.assertGreater(d, near_dup.NEAR_DUP_MAX_DISTANCE)
+
+    def test_index_finds_reprint_and_keeps_other_story(self):
+        index = near_dup.SimHashIndex()
+        self.assertIsNone(index.check_and_add("wire", near_dup.simhash(WIRE)))
+        self.assertIsNone(index.check_and_add("other", near_dup.simhash(OTHER)))
+        self.assertEqual(index.check_and_add("reprint", near_dup.simhash(REPRINT)), "wire")
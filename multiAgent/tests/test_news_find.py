@@ -0,0 +1,59 @@
+"""
+rank_daily_top3 오프라인 테스트: 커밋된 HTTP 픽스처(multiAgent/fixtures/http) + 가짜 LLM/임베딩 백엔드
+"""
+import os
+import unittest
+
+from multiAgent.tests import FIXTURE_HTTP_DIR, LocalStoreTestCase
+
+# 실제 OpenAI 호출이 나가지 않도록 에이전트 import 전에 가짜 백엔드로 고정
+os.environ["LLM_BACKEND"] = "fake"
+try:
+    from multiAgent.agents import news_find
+    from multiAgent.common import http_fixtures
+    _IMPORT_ERROR = None
+except ImportError as e:  # langchain/feedparser/bs4 등 에이전트 의존성이 없는 환경
+    news_find = None
+    _IMPORT_ERROR = e
+
+
+@unittest.skipIf(news_find is None, f"에이전트 의존성 없음: {_IMPORT_ERROR}")
+class RankDailyTop3FixtureTest(LocalStoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self._prev_fixtures = (http_fixtures.HTTP_FIXTURES_DIR, http_fixtures.HTTP_FIXTURES_MODE)
+        http_fixtures.HTTP_FIXTURES_DIR, http_fixtures.HTTP_FIXTURES_MODE = FIXTURE_HTTP_DIR, "replay"
+        news_find._parsed_feeds.clear()
+
+        meta = news_find.collect_rss_meta_via_feedparser(news_find.FEEDS, per_feed_limit=20)
+        contents = news_find.scrape_many([d.url for d in meta])
+        for d in meta:
+            d.content = contents.get(d.url, "")
+        self.pool = [d for d in meta if d.content]
+
+    def tearDown(self):
+        http_fixtures.HTTP_FIXTURES_DIR, http_fixtures.HTTP_FIXTURES_MODE = self._prev_fixtures
+        super().tearDown()
+
+    def _top3(self, profile):
+        return news_find.rank_daily_top3([profile], self.pool)[0]
+
+    def test_fixture_pool_is_complete(self):
+        self.assertEqual(len(self.pool), 12)
+
+    def test_no_profile_gets_three(self):
+        self.assertEqual(len(self._top3(None)), 3)
+
+    def test_history_without_interests_gets_three(self):
+        # 인사/잡담 질문은 어느 기사와도 유사도가 낮지만 Top 3는 그대로 받아야 한다
+        top = self._top3({"interests": "", "history": ["안녕", "고마워 잘 봤어", "ㅋㅋ"]})
+        self.assertEqual(len(top), 3)
+        self.assertEqual(len({a["url"] for a in top}), 3)
+
+    def test_unmatched_interest_is_filled_to_three(self):
+        self.assertEqual(len(self._top3({"interests": "비트코인", "history": []})), 3)
+
+    def test_matching_interest_comes_first(self):
+        top = self._top3({"interests": "반도체", "history": []})
+        self.assertEqual(len(top), 3)
+        self.assertIn("반도체", top[0]["title"])
@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+from multiAgent.common import politeness
+
+
+class PolitenessSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(politeness.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sleep = mock.patch.object(politeness.time, "sleep").start()
+        self.addCleanup(mock.patch.stopall)
+        self.s = politeness.PolitenessScheduler(min_interval=1.0, max_interval=8.0, backoff_factor=2.0,
+                                                fail_threshold=3, cooldown=60.0)
+
+    def test_requests_are_spaced_by_interval(self):
+        self.s.acquire("a.com")
+        self.s.acquire("a.com")
+        self.sleep.assert_called_once_with(1.0)
+        self.s.acquire("b.com")  # 도메인별로 따로
+        self.assertEqual(self.sleep.call_count, 1)
+
+    def test_backoff_on_throttle_and_recover_on_success(self):
+        self.s.record("a.com", 429)
+        self.s.record("a.com", 503)
+        self.assertEqual(self.s.snapshot()["a.com"]["interval"], 4.0)
+        self.s.record("a.com", 200)
+        self.assertEqual(self.s.snapshot()["a.com"], {"interval": 2.0, "failures": 0, "open_for": 0.0})
+        for _ in range(5):
+            self.s.record("a.com", None)
+        self.assertLessEqual(self.s.snapshot()["a.com"]["interval"], 8.0)
+
+    def test_breaker_opens_after_threshold_and_half_open_failure_reopens(self):
+        for _ in range(3):
+            self.s.record("a.com", None)
+        self.assertTrue(self.s.is_open("a.com"))
+        with self.assertRaises(politeness.DomainCircuitOpen):
+            self.s.acquire("a.com")
+
+        self.now += 61
+        self.s.acquire("a.com")  # 쿨다운 뒤 시험 요청 허용
+        self.s.record("a.com", 500)
+        self.assertTrue(self.s.is_open("a.com"))
+
+        self.now += 61
+        self.s.acquire("a.com")
+        self.s.record("a.com", 200)
+        self.assertFalse(self.s.is_open("a.com"))
+
+    def test_client_errors_do_not_count_as_failures(self):
+        for _ in range(5):
+            self.s.record("a.com", 404)
+        self.assertFalse(self.s.is_open("a.com"))
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from multiAgent.common import ranking
+
+
+def _features(n, sources=None, simhashes=None, now=1_000_000.0):
+    # 인덱스가 작을수록 최신 (1시간 간격)
+    return ranking.PoolFeatures.build(
+        [now - 3600 * i for i in range(n)],
+        sources or [f"s{i}" for i in range(n)],
+        simhashes or [None] * n,
+        now=now,
+    )
+
+
+class TopKTest(unittest.TestCase):
+    def test_recency_order_without_interests(self):
+        f = _features(5)
+        out = ranking.top_k(f, np.zeros((1, 5)), np.ones((1, 5), dtype=bool), k=3)
+        self.assertEqual(out.tolist(), [[0, 1, 2]])
+
+    def test_interest_counts_outrank_recency(self):
+        f = _features(5)
+        counts = np.array([[0, 0, 0, 0, 4]])
+        out = ranking.top_k(f, counts, np.ones((1, 5), dtype=bool), k=2)
+        self.assertEqual(out[0, 0], 4)
+
+    def test_mask_excludes_and_pads_with_minus_one(self):
+        f = _features(4)
+        mask = np.array([[False, True, False, False]])
+        out = ranking.top_k(f, np.zeros((1, 4)), mask, k=3)
+        self.assertEqual(out.tolist(), [[1, -1, -1]])
+
+    def test_same_source_is_penalised(self):
+        f = _features(3, sources=["a", "a", "b"])
+        out = ranking.top_k(f, np.zeros((1, 3)), np.ones((1, 3), dtype=bool), k=2,
+                            source_penalty=1.0, dup_penalty=0.0)
+        self.assertEqual(out.tolist(), [[0, 2]])
+
+    def test_same_event_group_is_penalised(self):
+        f = _features(3, simhashes=[0b1111, 0b1110, 0xFFFF_FFFF_0000_0000])
+        out = ranking.top_k(f, np.zeros((1, 3)), np.ones((1, 3), dtype=bool), k=2,
+                            source_penalty=0.0, dup_penalty=1.0)
+        self.assertEqual(out.tolist(), [[0, 2]])
+
+    def test_rows_are_independent(self):
+        f = _features(4)
+        counts = np.array([[0, 0, 0, 3], [0, 0, 0, 0]])
+        out = ranking.top_k(f, counts, np.ones((2, 4), dtype=bool), k=1)
+        self.assertEqual(out[:, 0].tolist(), [3, 0])
+
+
+class TopKFilledTest(unittest.TestCase):
+    def test_short_mask_is_filled_from_full_ranking(self):
+        f = _features(5)
+        mask = np.array([[False, False, False, True, False]])
+        out = ranking.top_k_filled(f, np.zeros((1, 5)), mask, k=3)
+        # 우선 후보(3)가 먼저, 나머지는 최신순
+        self.assertEqual(out.tolist(), [[3, 0, 1]])
+
+    def test_empty_mask_still_gets_k(self):
+        f = _features(4)
+        out = ranking.top_k_filled(f, np.zeros((1, 4)), np.zeros((1, 4), dtype=bool), k=3)
+        self.assertEqual(out.tolist(), [[0, 1, 2]])
+
+    def test_pool_smaller_than_k_keeps_padding(self):
+        f = _features(2)
+        out = ranking.top_k_filled(f, np.zeros((1, 2)), np.ones((1, 2), dtype=bool), k=3)
+        self.assertEqual(out.tolist(), [[0, 1, -1]])
+
+    def test_full_rows_are_untouched(self):
+        f = _features(5)
+        mask = np.array([[True] * 5, [False, False, False, False, True]])
+        out = ranking.top_k_filled(f, np.zeros((2, 5)), mask, k=2)
+        self.assertEqual(out.tolist(), [[0, 1], [4, 0]])
@@ -0,0 +1,35 @@
+from multiAgent.common import search_index
+from multiAgent.tests import LocalStoreTestCase
+
+
+class SearchIndexTest(LocalStoreTestCase):
+    def setUp(self):
+        super().setUp()
+        search_index.add_document("https://a.example/rate", "한은 기준금리 인상…대출 이자 부담 커져",
+                                  content="한국은행이 기준금리를 0.25%포인트 올렸다.", published_at=100)
+        search_index.add_document("https://a.example/chip", "삼성전자 반도체 실적 개선",
+                                  content="메모리 가격 상승으로 영업이익이 늘었다.", published_at=200)
+        search_index.add_document("https://a.example/both", "금리 인상에 삼성 계열사 회사채 발행 늘려",
+                                  content="금리가 더 오르기 전에 자금을 확보하려는 움직임이다.", published_at=50)
+        search_index.add_document("https://a.example/oil", "국제유가 하락세",
+                                  content="산유국 증산으로 유가가 내려왔다.", published_at=300)
+
+    def _urls(self, query, **kwargs):
+        return [h.url for h in search_index.search(query, **kwargs)]
+
+    def test_single_word_query(self):
+        self.assertEqual(self._urls("유가"), ["https://a.example/oil"])
+
+    def test_multi_word_query_matches_any_term_and_ranks_all_terms_first(self):
+        urls = self._urls("금리 인상 삼성")
+        self.assertEqual(urls[0], "https://a.example/both")
+        self.assertCountEqual(urls, ["https://a.example/both", "https://a.example/rate", "https://a.example/chip"])
+
+    def test_per_term_threshold(self):
+        # '반도체주': 2-gram 3개 중 2개(반도/도체) -> 기준(0.5 -> 2개) 충족. '반값'은 겹치는 2-gram 없음
+        self.assertEqual(self._urls("반도체주"), ["https://a.example/chip"])
+        self.assertEqual(self._urls("반값"), [])
+        self.assertEqual(self._urls("반도체주", min_should_match=1.0), [])
+
+    def test_since_filters_old_documents(self):
+        self.assertEqual(self._urls("금리 인상 삼성", since=100), ["https://a.example/rate", "https://a.example/chip"])
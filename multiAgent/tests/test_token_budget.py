@@ -0,0 +1,29 @@
+import unittest
+
+from multiAgent.common import token_budget
+
+TEXT = "한국은행이 기준금리를 동결했다. 물가는 2%대로 내려왔다. 가계부채 증가세는 이어졌다. 시장은 연내 인하를 예상한다."
+
+
+class TokenBudgetTest(unittest.TestCase):
+    def test_count_tokens(self):
+        self.assertEqual(token_budget.count_tokens(""), 0)
+        self.assertGreater(token_budget.count_tokens(TEXT), token_budget.count_tokens("한국은행"))
+
+    def test_truncate_keeps_short_text_and_fits_budget(self):
+        self.assertEqual(token_budget.truncate_to_tokens("금리", 10), "금리")
+        out = token_budget.truncate_to_tokens(TEXT, 20)
+        self.assertLessEqual(token_budget.count_tokens(out), 20)
+        self.assertTrue(TEXT.startswith(out[:5]))
+
+    def test_split_by_tokens_respects_budget_and_keeps_all_sentences(self):
+        chunks = token_budget.split_by_tokens(TEXT, 25)
+        self.assertGreater(len(chunks), 1)
+        for c in chunks:
+            self.assertLessEqual(token_budget.count_tokens(c), 25)
+        self.assertEqual(" ".join(chunks), " ".join(token_budget._sentences(TEXT)))
+
+    def test_split_overlap_repeats_last_sentence(self):
+        chunks = token_budget.split_by_tokens(TEXT, 25, overlap_tokens=25)
+        last_of_first = token_budget._sentences(chunks[0])[-1]
+        self.assertTrue(chunks[1].startswith(last_of_first))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0004_multiplechoicequiz_flag_oxquiz_flag_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='multiplechoicequiz',
+            name='grade',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='oxquiz',
+            name='grade',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='shortanswerquiz',
+            name='grade',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=10),
+        ),
+    ]
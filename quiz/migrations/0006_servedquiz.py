@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('quiz', '0005_multiplechoicequiz_grade_oxquiz_grade_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServedQuiz',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('served_at', models.DateTimeField(auto_now_add=True)),
+                ('content_type', models.ForeignKey(limit_choices_to=models.Q(models.Q(('app_label', 'quiz'), ('model', 'oxquiz')), models.Q(('app_label', 'quiz'), ('model', 'multiplechoicequiz')), models.Q(('app_label', 'quiz'), ('model', 'shortanswerquiz')), _connector='OR'), on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'quiz_served',
+                'unique_together': {('user', 'content_type', 'object_id')},
+            },
+        ),
+    ]
@@ -22,6 +22,9 @@ class BaseQuiz(models.Model):
 
     flag = models.BooleanField(default=False)
 
+    # 생성 대상 등급 (씨앗/새싹/나무/숲, 등급 없음은 빈 문자열) — 챗봇 퀴즈 풀 조회 키
+    grade = models.CharField(max_length=10, blank=True, default="", db_index=True)
+
     class Meta:
         abstract = True
 
@@ -107,4 +110,26 @@ class UserQuizAnswer(models.Model):
         unique_together = ("user", "content_type", "object_id")
 
     def __str__(self):
-        return f"{self.user} - {self.quiz} - {'Correct' if self.is_correct else 'Incorrect'}"
\ No newline at end of file
+        return f"{self.user} - {self.quiz} - {'Correct' if self.is_correct else 'Incorrect'}"
+
+class ServedQuiz(models.Model):
+    """챗봇이 퀴즈 풀에서 사용자에게 낸 문제 (같은 문제를 다시 내지 않기 위한 기록)"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    content_type = models.ForeignKey(ContentType,
+                                     on_delete=models.CASCADE,
+                                     limit_choices_to=Q(app_label='quiz', model='oxquiz') |
+                                                        Q(app_label='quiz', model='multiplechoicequiz') |
+                                                        Q(app_label='quiz', model='shortanswerquiz'),
+                                    )
+    object_id = models.PositiveIntegerField()
+    quiz = GenericForeignKey('content_type', 'object_id')
+
+    served_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "quiz_served"
+        unique_together = ("user", "content_type", "object_id")
+
+    def __str__(self):
+        return f"{self.user} - {self.quiz} (served)"